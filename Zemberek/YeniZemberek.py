@@ -1,56 +1,1463 @@
-from typing import List, Tuple
-from zemberek import TurkishMorphology, TurkishTokenizer
+import argparse
+import gc
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import re
+import sys
+import threading
+import time
+import unicodedata
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from itertools import chain, islice, product
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from zemberek import TurkishMorphology, TurkishSentenceExtractor, TurkishTokenizer
+from zemberek.tokenization.token import Token
+from joblib import Memory, Parallel, delayed
+import numpy as np
+import scipy.sparse as sp
+from sklearn.compose import ColumnTransformer
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
+from sklearn.model_selection import StratifiedKFold, train_test_split
+from sklearn.preprocessing import LabelEncoder, normalize
 from stop_words import get_stop_words
-from collections import Counter
+from collections import Counter, defaultdict
+
+from profiling import (
+    PROFILE_MODES,
+    ambiguity,
+    checkpoint,
+    make_profiler,
+    memory,
+    print_pstats,
+    span,
+    timer,
+)
+from snapshot import load_or_create_morphology_snapshot
+from analysis_table import AnalysisTable, build_analysis_table, count_surface_forms
+from dedup import NearDuplicateFilter
+from ngrams import NgramCounter, write_collocations
+from sketches import FrequencySketch, load_sketch, merge_sketches
+from similarity import SimilarityIndex
 
 
-# Zemberek ile Türkçe metinleri köklerine ayırma ve kelime türlerini belirleme
-def analyze_text(text: str, morphology: TurkishMorphology) -> List[Tuple[str, str]]:
+# Ön işleme çıktısını değiştiren her düzenlemede artırılır; önbellek anahtarına girer
+PREPROCESS_VERSION = 4
+
+
+_morphology: Optional[TurkishMorphology] = None
+
+
+# Morphology nesnesi pahalıdır; süreç başına bir kez oluşturulur.
+# snapshot_dir verilirse nesne oradaki anlık görüntüden yüklenir (yoksa yazılır).
+def get_morphology(snapshot_dir: Optional[str] = None) -> TurkishMorphology:
+    global _morphology
+    if _morphology is None:
+        with span("morphology.create"):
+            if snapshot_dir is None:
+                _morphology = TurkishMorphology.create_with_defaults()
+            else:
+                _morphology = load_or_create_morphology_snapshot(snapshot_dir)
+        checkpoint("morphology.create")
+    return _morphology
+
+
+_analysis_table: Optional[AnalysisTable] = None
+
+
+# Önceden derlenmiş analiz tablosunu açma; analyze_text zemberek'ten önce ona bakar
+def load_analysis_table(path: Optional[str]) -> Optional[AnalysisTable]:
+    global _analysis_table
+    _analysis_table = None if path is None else AnalysisTable(path)
+    return _analysis_table
+
+
+_sentence_extractor: Optional[TurkishSentenceExtractor] = None
+
+# Cümle gruplarının boyutu; uzun belgeler işçiler arasında eşit dağıtılır
+SENTENCE_BATCH_SIZE = 64
+
+# Akış halinde işlenen derlemlerde havuza bir seferde verilen belge sayısı
+DOCUMENT_CHUNK_SIZE = 1000
+
+
+# Akışı en fazla size elemanlı listelere bölme
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Cümle ayırıcı ağırlık ve kısaltma dosyalarını yükler; süreç başına bir kez oluşturulur
+def get_sentence_extractor() -> TurkishSentenceExtractor:
+    global _sentence_extractor
+    if _sentence_extractor is None:
+        _sentence_extractor = TurkishSentenceExtractor()
+    return _sentence_extractor
+
+
+# Metni cümlelere ayırma; her paragraf (satır) ayrı işlenir
+def split_sentences(text: str) -> List[str]:
+    extractor = get_sentence_extractor()
+    with span("split_sentences"):
+        return [
+            sentence
+            for paragraph in text.splitlines()
+            if paragraph.strip()
+            for sentence in extractor.from_paragraph(paragraph)
+        ]
+
+
+# Belgeleri cümlelere ayırıp belgeler arası sabit boyutlu gruplara bölme.
+# owners her cümlenin ait olduğu belgenin sırasını tutar.
+def sentence_batches(
+    texts: Sequence[str], batch_size: int = SENTENCE_BATCH_SIZE
+) -> Tuple[List[List[str]], List[int]]:
+    sentences, owners = [], []
+    for index, text in enumerate(texts):
+        for sentence in split_sentences(unicodedata.normalize("NFC", text or "")):
+            sentences.append(sentence)
+            owners.append(index)
+    batches = [
+        sentences[start:start + batch_size]
+        for start in range(0, len(sentences), batch_size)
+    ]
+    return batches, owners
+
+
+# Cümle sonuçlarını belge sırasına göre yeniden toplama
+def group_by_document(values: Iterable[Any], owners: List[int], count: int) -> List[List[Any]]:
+    grouped: List[List[Any]] = [[] for _ in range(count)]
+    for owner, value in zip(owners, values):
+        grouped[owner].append(value)
+    return grouped
+
+
+# Kök ve tür taşımayan token'lar (adres, etiket, ifade) analiz edilmeden atlanır
+def _skip(token: Token) -> List[Tuple[str, str]]:
+    return []
+
+
+# Token türü -> işleyici. Tabloda olmayan türler morphology.analyze ile analiz
+# edilir. İşleyici token için (kök, analiz) listesini kendisi döndürür.
+# Varsayılan kurallar analyze_text'e rules ile başka bir tablo verilerek
+# değiştirilebilir.
+TOKEN_RULES: Dict[Token.Type, Callable[[Token], List[Tuple[str, str]]]] = {
+    Token.Type.URL: _skip,
+    Token.Type.Email: _skip,
+    Token.Type.HashTag: _skip,
+    Token.Type.Mention: _skip,
+    Token.Type.MetaTag: _skip,
+    Token.Type.Emoji: _skip,
+    Token.Type.Emoticon: _skip,
+}
+
+# Noktalama, sayı, tarih ve saatlerin zemberek analizi (ör. "3" için
+# [3:Num, Card], "31." için hiç analiz) yalnızca token içeriğine bağlıdır ve
+# farklı içerik sayısı azdır. Bu türlerde zemberek her içerik için bir kez
+# çağrılır; sonuç (doğru mu, analizler) TOKEN_MEMO_SIZE kayda kadar saklanır ve
+# tekrarlarda aynen kullanılır. Çıktı ve belirsizlik kayıtları değişmez.
+MEMOIZED_TOKEN_TYPES = frozenset(
+    {Token.Type.Punctuation, Token.Type.Number, Token.Type.Date, Token.Type.Time}
+)
+TOKEN_MEMO_SIZE = 10_000
+_token_memo: Dict[str, Tuple[bool, List[Tuple[str, str]]]] = {}
+
+# Kurallar ya da saklanan sonuçlar yüzünden yapılmayan morphology.analyze
+# çağrıları (token türüne göre)
+skipped_analyses: Counter = Counter()
+
+
+# Metni token token analiz etme: (token, [(kök, analiz), ...], kelime mi).
+# Token'lar önce türlerine göre rules (varsayılan TOKEN_RULES) ile süzülür;
+# analiz tablosu yüklüyse sık kelimeler zemberek çağrılmadan tablodan okunur.
+def analyze_tokens(
+    text: str,
+    morphology: TurkishMorphology,
+    rules: Optional[Dict[Token.Type, Callable[[Token], List[Tuple[str, str]]]]] = None,
+) -> Iterator[Tuple[Token, List[Tuple[str, str]], bool]]:
     tokenizer = TurkishTokenizer.DEFAULT
-    tokens = tokenizer.tokenize(text)
-    analyzed_tokens = []
+    if rules is None:
+        rules = TOKEN_RULES
+    with span("analyze_text.tokenize"):
+        tokens = tokenizer.tokenize(text)
+    table = _analysis_table
     for token in tokens:
+        handler = rules.get(token.type_)
+        if handler is not None:
+            skipped_analyses[token.type_.name] += 1
+            yield token, handler(token), False
+            continue
+        memoized = token.type_ in MEMOIZED_TOKEN_TYPES
+        if memoized:
+            entry = _token_memo.get(token.content)
+            if entry is not None:
+                skipped_analyses[token.type_.name] += 1
+                correct, analyses = entry
+                if ambiguity.enabled:
+                    ambiguity.record(token.content, len(analyses), not correct)
+                yield token, analyses, True
+                continue
+        if table is not None:
+            entry = table.get(token.content)
+            if entry is not None:
+                correct, analyses = entry
+                if ambiguity.enabled:
+                    ambiguity.record(token.content, len(analyses), not correct)
+                yield token, analyses, True
+                continue
         # Her bir token için ayrı ayrı analiz yapımı
-        results = morphology.analyze(token.content)
-        for result in results:
-            analyzed_tokens.append((result.get_stem(), result.format_string()))
+        with span("analyze_text.analyze"):
+            results = morphology.analyze(token.content)
+        if ambiguity.enabled:
+            ambiguity.record(
+                token.content, len(results.analysis_results), not results.is_correct()
+            )
+        with span("analyze_text.format"):
+            analyses = [
+                (result.get_stem(), result.format_string()) for result in results
+            ]
+        if memoized and len(_token_memo) < TOKEN_MEMO_SIZE:
+            _token_memo[token.content] = (results.is_correct(), analyses)
+        yield token, analyses, True
+
+
+# Zemberek ile Türkçe metinleri köklerine ayırma ve kelime türlerini belirleme
+def analyze_text(
+    text: str,
+    morphology: TurkishMorphology,
+    rules: Optional[Dict[Token.Type, Callable[[Token], List[Tuple[str, str]]]]] = None,
+) -> List[Tuple[str, str]]:
+    analyzed_tokens = []
+    for _, analyses, _ in analyze_tokens(text, morphology, rules):
+        analyzed_tokens.extend(analyses)
     return analyzed_tokens
 
 
+# Metnin kelime olmayan token'larla (noktalama vb.) ayrılmış kök dizileri.
+# Her kelime için ilk analizin kökü alınır; analizi olmayan kelime kendisiyle
+# temsil edilir. Noktalama da zemberek'ten analiz alır ama diziyi böler.
+def lemma_runs(text: str, morphology: TurkishMorphology) -> Iterator[List[str]]:
+    run = []
+    for token, analyses, word in analyze_tokens(text, morphology):
+        if word and token.type_ != Token.Type.Punctuation:
+            run.append(analyses[0][0] if analyses else token.content)
+        elif run:
+            yield run
+            run = []
+    if run:
+        yield run
+
+
+# Metni cümle cümle analiz etme. disambiguate=True ise zemberek'in cümle
+# düzeyindeki belirsizlik gidericisi her kelime için yalnızca en iyi analizi döndürür.
+def analyze_sentences(
+    text: str, morphology: TurkishMorphology, disambiguate: bool = False
+) -> List[Tuple[str, str]]:
+    analyzed_tokens = []
+    for sentence in split_sentences(text):
+        if not disambiguate:
+            analyzed_tokens.extend(analyze_text(sentence, morphology))
+            continue
+        with span("analyze_sentences.disambiguate"):
+            best = morphology.analyze_and_disambiguate(sentence).best_analysis()
+        analyzed_tokens.extend(
+            (result.get_stem(), result.format_string()) for result in best
+        )
+    return analyzed_tokens
+
+
+
+
+# Türkçe küçük harfe çevirme ve harf/boşluk dışındaki karakterleri silme tablosu.
+# str.lower() "I" harfini "i" yapar ve "İ" için birleşik nokta (U+0307) bırakır;
+# aynı kelimenin farklı yazımları ayrı ayrı analiz edilir. Latin ve Türkçe
+# aralığı önceden hesaplanır, diğer karakterler ilk görüldüklerinde eklenir.
+class _TurkishFoldTable(dict):
+    def __missing__(self, code: int) -> Optional[str]:
+        char = chr(code)
+        if char.isspace():
+            value = char
+        elif char.isalpha():
+            value = "".join(c for c in char.lower() if c.isalpha()) or None
+        else:
+            value = None
+        self[code] = value
+        return value
+
 
+TURKISH_FOLD_TABLE = _TurkishFoldTable({ord("I"): "ı", ord("İ"): "i"})
+for _code in range(0x250):
+    TURKISH_FOLD_TABLE[_code]
 
-# Metin ön işleme fonksiyonu
-def preprocess_text(text: str, morphology: TurkishMorphology) -> str:
+
+# Metni Türkçe kurallarıyla küçük harflere dönüştürüp yalnızca harf ve boşlukları
+# bırakma. Unicode NFC normalleştirmesi belge başına bir kez, çağıran tarafta yapılır.
+def normalize_text(text: str) -> str:
+    return text.translate(TURKISH_FOLD_TABLE)
+
+
+# Bir cümleyi normalleştirip durma kelimelerini çıkarma
+def _sentence_words(sentence: str) -> List[str]:
+    with span("preprocess_text.normalize"):
+        sentence = normalize_text(sentence)
+
+    # Durma kelimelerini çıkarma kısmı
+    with span("preprocess_text.stopwords"):
+        turkish_stopwords = get_stop_words("turkish")
+        words = sentence.split()
+        return [word for word in words if word not in turkish_stopwords]
+
+
+def _lemmatize(
+    words: List[str],
+    morphology: TurkishMorphology,
+    lemma_table: Optional[Dict[str, Tuple[str, ...]]],
+    learn: bool,
+) -> List[str]:
+    with span("preprocess_text.lemmas"):
+        if lemma_table is not None:
+            return _lookup_lemmas(words, morphology, lemma_table, learn)
+        analyzed_tokens = analyze_text(" ".join(words), morphology)
+        return [lemma for lemma, pos in analyzed_tokens]
+
+
+# Metin ön işleme fonksiyonu. Metin önce cümlelere ayrılır; kelime kökleri
+# bağlamdan bağımsız olduğundan sonuç, cümlelerin ayrı ayrı (ör. işçilerde)
+# ön işlenip birleştirilmesiyle aynıdır.
+# lemma_table verilirse eğitimde görülmüş kelimeler sözlükten çözülür, yalnızca
+# bilinmeyen kelimeler zemberek ile analiz edilir (learn=True ise tabloya eklenir)
+def preprocess_text(
+    text: str,
+    morphology: TurkishMorphology,
+    lemma_table: Optional[Dict[str, Tuple[str, ...]]] = None,
+    learn: bool = False,
+) -> str:
     if text is None:
         return ""  # None değeri alırsa boş bir dize döndür
-    text = text.lower()  # Metni küçük harflere dönüştürme
-    text = "".join([char for char in text if char.isalpha() or char.isspace()])
-    
-    # Durma kelimelerini çıkarma kısmı
-    turkish_stopwords = get_stop_words("turkish")
-    words = text.split()
-    words = [word for word in words if word not in turkish_stopwords]
-    
-    analyzed_tokens = analyze_text(" ".join(words), morphology)
-    lemmas = [lemma for lemma, pos in analyzed_tokens]
+    text = unicodedata.normalize("NFC", text)
+    words = [
+        word for sentence in split_sentences(text) for word in _sentence_words(sentence)
+    ]
+    lemmas = _lemmatize(words, morphology, lemma_table, learn)
+    if ambiguity.enabled:
+        ambiguity.end_document()
     return " ".join(lemmas)
 
 
+# Yüzey biçimi -> kök tablosu üzerinden kök çözümleme; her bilinmeyen kelime
+# belge başına bir kez analiz edilir
+def _lookup_lemmas(
+    words: List[str],
+    morphology: TurkishMorphology,
+    lemma_table: Dict[str, Tuple[str, ...]],
+    learn: bool,
+) -> List[str]:
+    unknown = {}
+    for word in words:
+        if word not in lemma_table and word not in unknown:
+            unknown[word] = tuple(
+                lemma for lemma, pos in analyze_text(word, morphology)
+            )
+    if learn:
+        lemma_table.update(unknown)
 
+    lemmas = []
+    for word in words:
+        lemmas.extend(unknown[word] if word in unknown else lemma_table[word])
+    return lemmas
 
+
+
+
+# lemma_table verilirse ön işleme sırasında yüzey biçimi -> kök tablosu doldurulur.
+# workers > 1 ise belgeler cümle gruplarına bölünüp süreç havuzunda ön işlenir;
+# aksi halde derlem akış halinde okunur ve ham metinler bellekte tutulmaz.
 def prepare_data(
-    corner_texts: List[Tuple[str, str]], morphology: TurkishMorphology
+    corner_texts: Iterable[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    lemma_table: Optional[Dict[str, Tuple[str, ...]]] = None,
+    workers: int = 1,
 ) -> Tuple[List[str], List[str]]:
-    texts, authors = zip(*corner_texts)
-    preprocessed_texts = [preprocess_text(text, morphology) for text in texts]
+    if ambiguity.enabled:
+        ambiguity.begin_pass("prepare_data")
+    with span("prepare_data"):
+        if workers > 1:
+            texts, authors = zip(*corner_texts)
+            with worker_pool(morphology, workers, lemma_table, learn=True) as pool:
+                preprocessed_texts, learned = preprocess_in_pool(pool, texts)
+            if lemma_table is not None:
+                lemma_table.update(learned)
+        else:
+            preprocessed_texts, authors = [], []
+            for text, author in corner_texts:
+                preprocessed_texts.append(
+                    preprocess_text(text, morphology, lemma_table, learn=True)
+                )
+                authors.append(author)
+    checkpoint("prepare_data")
 
     return preprocessed_texts, list(authors)
 
 
+# Süreç havuzundaki işçilerin durumu. fork ile başlatılan işçiler ebeveynde
+# yüklenmiş morphology nesnesini devralır, spawn ile başlayanlar kendisi oluşturur.
+_worker_state: Dict[str, Any] = {}
+
+
+# fork ile açılan işçiler ebeveynin eşlediği analiz tablosunu devralır;
+# spawn ile açılanlar aynı dosyayı kendileri eşler (sayfalar yine paylaşılır)
+def _init_worker(
+    lemma_table: Optional[Dict[str, Tuple[str, ...]]],
+    learn: bool,
+    analysis_table_path: Optional[str] = None,
+    ambiguity_enabled: bool = False,
+    timer_enabled: bool = False,
+):
+    _worker_state["lemma_table"] = None if lemma_table is None else dict(lemma_table)
+    _worker_state["learn"] = learn
+    if analysis_table_path is not None and _analysis_table is None:
+        load_analysis_table(analysis_table_path)
+    # fork ile devralınan ebeveyn sayımları işçiden bir daha gönderilmesin
+    ambiguity.reset()
+    ambiguity.enabled = ambiguity_enabled
+    timer.reset()
+    timer.enabled = timer_enabled
+    skipped_analyses.clear()
+    if _analysis_table is not None:
+        _analysis_table.drain_counts()
+
+
+# İşçide biriken tanı sayımlarını (belirsizlik, atlanan analizler, analiz
+# tablosu isabetleri, aşama süreleri) alıp sıfırlama; her görev sonucu bunları
+# taşır, ebeveyn _merge_worker_counters ile toplar
+def _drain_worker_counters() -> Dict[str, Any]:
+    counters = {
+        "ambiguity": ambiguity.drain() if ambiguity.enabled else None,
+        "timer": timer.drain() if timer.enabled else None,
+        "skipped": dict(skipped_analyses),
+        "analysis_table": (
+            None if _analysis_table is None else _analysis_table.drain_counts()
+        ),
+    }
+    skipped_analyses.clear()
+    return counters
+
+
+# owners, işçinin cümle başına belirsizlik kayıtlarının ait olduğu belgeler
+def _merge_worker_counters(counters: Dict[str, Any], owners: Optional[List[int]] = None):
+    if counters["ambiguity"] is not None and ambiguity.enabled:
+        ambiguity.merge(counters["ambiguity"], owners)
+    if counters["timer"] is not None and timer.enabled:
+        timer.merge(counters["timer"])
+    skipped_analyses.update(counters["skipped"])
+    if counters["analysis_table"] is not None and _analysis_table is not None:
+        _analysis_table.merge_counts(counters["analysis_table"])
+
+
+# İşçide bir metni ön işleme; learn=True ise bu belgede öğrenilen kökler de döner
+def _preprocess_worker(text: str) -> Tuple[str, Dict[str, Tuple[str, ...]]]:
+    morphology = _worker_state.get("morphology") or get_morphology()
+    lemma_table = _worker_state["lemma_table"]
+    size = len(lemma_table) if lemma_table is not None else 0
+    preprocessed = preprocess_text(
+        text, morphology, lemma_table, learn=_worker_state["learn"]
+    )
+    learned = {}
+    if lemma_table is not None and len(lemma_table) > size:
+        learned = dict(islice(lemma_table.items(), size, None))
+    return preprocessed, learned
+
+
+# İşçide bir cümle grubunu ön işleme; cümle başına kök dizisi, öğrenilen kökler
+# ve işçinin tanı sayımları döner
+def _preprocess_sentences_worker(
+    sentences: List[str],
+) -> Tuple[List[str], Dict[str, Tuple[str, ...]], Dict[str, Any]]:
+    morphology = _worker_state.get("morphology") or get_morphology()
+    lemma_table = _worker_state["lemma_table"]
+    size = len(lemma_table) if lemma_table is not None else 0
+    preprocessed = []
+    for sentence in sentences:
+        lemmas = _lemmatize(
+            _sentence_words(sentence), morphology, lemma_table, _worker_state["learn"]
+        )
+        preprocessed.append(" ".join(lemmas))
+        if ambiguity.enabled:
+            ambiguity.end_document(empty=True)
+    learned = {}
+    if lemma_table is not None and len(lemma_table) > size:
+        learned = dict(islice(lemma_table.items(), size, None))
+    return preprocessed, learned, _drain_worker_counters()
+
+
+# Belgeleri cümle grupları halinde havuzda ön işleyip belge başına birleştirme
+def preprocess_in_pool(
+    pool: Any, texts: Sequence[str]
+) -> Tuple[List[str], Dict[str, Tuple[str, ...]]]:
+    batches, owners = sentence_batches(texts)
+    results = pool.map(_preprocess_sentences_worker, batches, 1)
+    learned: Dict[str, Tuple[str, ...]] = {}
+    offset = 0
+    for batch, batch_learned, counters in results:
+        learned.update(batch_learned)
+        _merge_worker_counters(counters, owners[offset : offset + len(batch)])
+        offset += len(batch)
+    if ambiguity.enabled:
+        ambiguity.end_document()
+    sentences = [sentence for batch, _, _ in results for sentence in batch]
+    preprocessed = [
+        " ".join(sentence for sentence in document if sentence)
+        for document in group_by_document(sentences, owners, len(texts))
+    ]
+    return preprocessed, learned
+
+
+# İşçide bir cümle grubunun (kök, tür) sayımları ve işçinin tanı sayımları
+def _frequency_worker(sentences: List[str]) -> Tuple[Counter, Dict[str, Any]]:
+    morphology = _worker_state.get("morphology") or get_morphology()
+    counter = Counter()
+    for sentence in sentences:
+        counter.update(analyze_text(sentence, morphology))
+        if ambiguity.enabled:
+            ambiguity.end_document(empty=True)
+    return counter, _drain_worker_counters()
+
+
+# Belgeleri cümle grupları halinde havuzda analiz edip grup başına (kök, tür)
+# sayımlarını sırayla döndürme; işçilerin tanı sayımları ebeveyne katılır
+def frequencies_in_pool(pool: Any, texts: Sequence[str]) -> Iterator[Counter]:
+    batches, owners = sentence_batches(texts)
+    offset = 0
+    for batch, (counter, counters) in zip(
+        batches, pool.imap(_frequency_worker, batches, 1)
+    ):
+        _merge_worker_counters(counters, owners[offset : offset + len(batch)])
+        offset += len(batch)
+        yield counter
+    if ambiguity.enabled:
+        ambiguity.end_document()
+
+
+# Önceden çatallanmış (pre-fork) işçi havuzu. Ebeveyn morphology nesnesini bir
+# kez yükler; fork ile açılan işçiler sözlük sayfalarını copy-on-write paylaşır.
+# Çatallamadan önce gc.freeze() ile mevcut nesneler kalıcı kuşağa alınır; böylece
+# işçilerdeki çöp toplama turları paylaşılan sayfalara yazıp kopyalatmaz.
+@contextmanager
+def worker_pool(
+    morphology: Optional[TurkishMorphology],
+    workers: int,
+    lemma_table: Optional[Dict[str, Tuple[str, ...]]] = None,
+    learn: bool = False,
+    start_method: Optional[str] = None,
+) -> Iterator[Any]:
+    if start_method is None:
+        start_method = (
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+    context = multiprocessing.get_context(start_method)
+
+    frozen = start_method == "fork" and morphology is not None
+    if frozen:
+        # Tembel oluşturulan yapılar işçilerde değil ebeveynde kurulsun
+        morphology.analyze("ısınma")
+        get_sentence_extractor()
+        _worker_state["morphology"] = morphology
+        gc.collect()
+        gc.freeze()
+    try:
+        table_path = None if _analysis_table is None else _analysis_table.path
+        with context.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(lemma_table, learn, table_path, ambiguity.enabled, timer.enabled),
+        ) as pool:
+            yield pool
+    finally:
+        if frozen:
+            gc.unfreeze()
+
+
+# Ön işlemeden önce yakın kopya (yeniden yayımlanmış) belgeleri ayıklama;
+# ilk görülen kopya korunur. Derlem akış halinde süzülür; kaldırılan belge ve
+# kelime sayıları akış tükendikten sonra süzgecin report() çıktısındadır.
+def deduplicate_corpus(
+    corner_texts: Iterable[Tuple[str, str]],
+    shingle_size: int = 5,
+    threshold: float = 0.8,
+    max_documents: Optional[int] = None,
+) -> Tuple[Iterator[Tuple[str, str]], NearDuplicateFilter]:
+    dedup = NearDuplicateFilter(shingle_size, threshold, max_documents=max_documents)
+
+    def kept() -> Iterator[Tuple[str, str]]:
+        for item in corner_texts:
+            with span("deduplicate"):
+                duplicate = dedup.is_duplicate(item[0])
+            if not duplicate:
+                yield item
+
+    return kept(), dedup
+
+
+# Derlemin içeriğine ve ön işleme sürümüne bağlı önbellek anahtarı
+def corpus_fingerprint(corner_texts: Sequence[Tuple[str, str]]) -> str:
+    digest = hashlib.sha256(f"v{PREPROCESS_VERSION}".encode("utf-8"))
+    for text, author in corner_texts:
+        digest.update(b"\x00" + (text or "").encode("utf-8"))
+        digest.update(b"\x01" + author.encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+# Ön işlenmiş kök dizilerini diskten okuma; yoksa hesaplayıp önbelleğe yazma.
+# Böylece morfolojik analiz her katman için değil, derlem başına bir kez çalışır.
+# Önbellek anahtarı için derlem iki kez okunur; önbellek yoksa akış olduğu gibi
+# prepare_data'ya verilir.
+def cached_prepare_data(
+    corner_texts: Iterable[Tuple[str, str]],
+    morphology_factory: Callable[[], TurkishMorphology] = get_morphology,
+    cache_dir: Optional[str] = None,
+    lemma_table: Optional[Dict[str, Tuple[str, ...]]] = None,
+    workers: int = 1,
+) -> Tuple[List[str], List[str]]:
+    if cache_dir is None:
+        return prepare_data(corner_texts, morphology_factory(), lemma_table, workers)
+
+    corner_texts = list(corner_texts)
+    cache_path = os.path.join(
+        cache_dir, f"lemmas-{corpus_fingerprint(corner_texts)}.json"
+    )
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as file:
+            cached = json.load(file)
+        if lemma_table is not None:
+            lemma_table.update(
+                (word, tuple(lemmas)) for word, lemmas in cached["lemma_table"].items()
+            )
+        return cached["texts"], cached["authors"]
+
+    table = {} if lemma_table is None else lemma_table
+    texts, authors = prepare_data(corner_texts, morphology_factory(), table, workers)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(
+            {"texts": texts, "authors": authors, "lemma_table": table},
+            file,
+            ensure_ascii=False,
+        )
+    os.replace(tmp_path, cache_path)
+    return texts, authors
+
+
+# Derlemi akış halinde ön işleme: kök dizileri sırayla döndürülür, derlem ve
+# sonuçlar bellekte tutulmaz. pool verilirse belgeler chunk_size'lık gruplar
+# halinde havuzda ön işlenir.
+def iter_prepared_texts(
+    corner_texts: Iterable[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    pool: Optional[Any] = None,
+    chunk_size: int = DOCUMENT_CHUNK_SIZE,
+) -> Iterator[str]:
+    if pool is None:
+        for text, _ in corner_texts:
+            yield preprocess_text(text, morphology)
+        return
+    for chunk in iter_chunks((text for text, _ in corner_texts), chunk_size):
+        yield from preprocess_in_pool(pool, chunk)[0]
+
+
+
+
+# Öznitelik modları: "lemma" yalnızca kökler, "char" yalnızca ham metin karakter
+# n-gramları (zemberek gerektirmez, hızlı mod), "union" ikisinin seyrek birleşimi
+FEATURE_MODES = ("lemma", "union", "char")
+
+
+# Kök dizilerini ve ham metinleri iki sütunlu bir girdi olarak birleştirme.
+# Hızlı modda kök sütunu boş kalır ve morfolojik analiz hiç çalıştırılmaz.
+def feature_rows(
+    raw_texts: Sequence[str], lemma_texts: Optional[Sequence[str]] = None
+) -> np.ndarray:
+    rows = np.empty((len(raw_texts), 2), dtype=object)
+    rows[:, 0] = list(lemma_texts) if lemma_texts is not None else ""
+    rows[:, 1] = [text or "" for text in raw_texts]
+    return rows
+
+
+# Kök TF-IDF ve karakter n-gram TF-IDF özniteliklerini paralel olarak üretip
+# seyrek matrisleri yan yana birleştiren öznitelik hattı
+def make_feature_pipeline(
+    mode: str = "union",
+    n_jobs: Optional[int] = None,
+    char_ngram_range: Tuple[int, int] = (2, 5),
+) -> ColumnTransformer:
+    if mode not in FEATURE_MODES:
+        raise ValueError(f"Bilinmeyen öznitelik modu: {mode}")
+
+    transformers = []
+    if mode in ("lemma", "union"):
+        transformers.append(
+            ("lemma", TfidfVectorizer(stop_words=get_stop_words("turkish")), 0)
+        )
+    if mode in ("char", "union"):
+        transformers.append(
+            (
+                "char",
+                TfidfVectorizer(
+                    analyzer="char_wb", ngram_range=char_ngram_range, sublinear_tf=True
+                ),
+                1,
+            )
+        )
+    return ColumnTransformer(transformers, n_jobs=n_jobs, sparse_threshold=1.0)
+
+
+
+
+# Çapraz doğrulamada aranan varsayılan hiperparametre ızgarası
+DEFAULT_PARAM_GRID: Dict[str, List[Any]] = {
+    "ngram_range": [(1, 1), (1, 2)],
+    "C": [0.1, 1.0, 10.0],
+    "solver": ["lbfgs", "saga"],
+}
+
+# Izgarada TfidfVectorizer'a giden anahtarlar; geri kalanlar LogisticRegression'a gider
+VECTORIZER_PARAMS = ("ngram_range", "min_df", "max_df", "sublinear_tf", "max_features")
+
+
+def _expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in product(*(grid[k] for k in keys))]
+
+
+# Bir katman için TF-IDF matrislerini üretme (joblib.Memory ile diskte önbelleğe alınır)
+def _vectorize_fold(
+    texts: List[str],
+    train_idx: List[int],
+    test_idx: List[int],
+    vectorizer_params: Dict[str, Any],
+):
+    vectorizer = TfidfVectorizer(
+        stop_words=get_stop_words("turkish"), **vectorizer_params
+    )
+    X_train = vectorizer.fit_transform([texts[i] for i in train_idx])
+    X_test = vectorizer.transform([texts[i] for i in test_idx])
+    return X_train, X_test
+
+
+# Bir katman ve bir vektörleştirici ayarı için tüm model ayarlarını değerlendirme.
+# Matrisler bir kez üretilir ve tüm C/solver kombinasyonlarında yeniden kullanılır.
+def _evaluate_fold(
+    texts: List[str],
+    y: List[int],
+    train_idx: List[int],
+    test_idx: List[int],
+    vectorizer_params: Dict[str, Any],
+    model_grid: List[Dict[str, Any]],
+    cache_dir: Optional[str],
+) -> Tuple[float, List[Tuple[Dict[str, Any], float, float]]]:
+    vectorize = _vectorize_fold
+    if cache_dir is not None:
+        vectorize = Memory(os.path.join(cache_dir, "folds"), verbose=0).cache(
+            _vectorize_fold
+        )
+
+    start = time.perf_counter()
+    X_train, X_test = vectorize(texts, train_idx, test_idx, vectorizer_params)
+    vectorize_time = time.perf_counter() - start
+
+    y_train = [y[i] for i in train_idx]
+    y_test = [y[i] for i in test_idx]
+    results = []
+    for model_params in model_grid:
+        start = time.perf_counter()
+        model = LogisticRegression(max_iter=1000, **model_params)
+        model.fit(X_train, y_train)
+        accuracy = model.score(X_test, y_test)
+        results.append((model_params, accuracy, time.perf_counter() - start))
+    return vectorize_time, results
+
+
+# Katmanlı k-katlı çapraz doğrulama ile hiperparametre araması.
+# Her ayar için ortalama doğruluk, standart sapma ve toplam duvar saati süresi döner.
+def cross_validate_grid(
+    texts: List[str],
+    authors: List[str],
+    param_grid: Optional[Dict[str, List[Any]]] = None,
+    n_splits: int = 5,
+    n_jobs: int = -1,
+    cache_dir: Optional[str] = None,
+    random_state: int = 42,
+) -> List[Dict[str, Any]]:
+    param_grid = DEFAULT_PARAM_GRID if param_grid is None else param_grid
+    vectorizer_grid = _expand_grid(
+        {k: v for k, v in param_grid.items() if k in VECTORIZER_PARAMS}
+    )
+    model_grid = _expand_grid(
+        {k: v for k, v in param_grid.items() if k not in VECTORIZER_PARAMS}
+    )
+
+    y = LabelEncoder().fit_transform(authors).tolist()
+    folds = [
+        (train_idx.tolist(), test_idx.tolist())
+        for train_idx, test_idx in StratifiedKFold(
+            n_splits=n_splits, shuffle=True, random_state=random_state
+        ).split(texts, y)
+    ]
+
+    tasks = [
+        (vectorizer_params, train_idx, test_idx)
+        for vectorizer_params in vectorizer_grid
+        for train_idx, test_idx in folds
+    ]
+    outputs = Parallel(n_jobs=n_jobs)(
+        delayed(_evaluate_fold)(
+            texts, y, train_idx, test_idx, vectorizer_params, model_grid, cache_dir
+        )
+        for vectorizer_params, train_idx, test_idx in tasks
+    )
+
+    params_by_key = {}
+    accuracies = defaultdict(list)
+    wall_times = defaultdict(float)
+    for (vectorizer_params, _, _), (vectorize_time, results) in zip(tasks, outputs):
+        # Vektörleştirme süresi aynı matrisi paylaşan model ayarlarına bölüştürülür
+        shared_time = vectorize_time / len(results)
+        for model_params, accuracy, fit_time in results:
+            params = {**vectorizer_params, **model_params}
+            key = json.dumps(params, sort_keys=True)
+            params_by_key[key] = params
+            accuracies[key].append(accuracy)
+            wall_times[key] += shared_time + fit_time
+
+    report = []
+    for key, scores in accuracies.items():
+        mean = sum(scores) / len(scores)
+        std = (sum((s - mean) ** 2 for s in scores) / len(scores)) ** 0.5
+        report.append(
+            {
+                "params": params_by_key[key],
+                "mean_accuracy": mean,
+                "std_accuracy": std,
+                "wall_time": wall_times[key],
+            }
+        )
+    report.sort(key=lambda row: (-row["mean_accuracy"], row["wall_time"]))
+    return report
+
+
+# Çapraz doğrulama sonuçlarını tablo olarak yazdırma
+def print_cv_report(report: List[Dict[str, Any]]):
+    for row in report:
+        params = " ".join(f"{k}={v}" for k, v in sorted(row["params"].items()))
+        print(
+            f"{params:<50} doğruluk: {row['mean_accuracy'] * 100:6.2f}% "
+            f"± {row['std_accuracy'] * 100:5.2f}  süre: {row['wall_time']:.3f} sn"
+        )
+
+
+
+
+
+# Metinlerdeki terim sayılarını seyrek matris olarak çıkarma.
+# grow=True ise sözlükte olmayan terimler sona eklenir, mevcut indeksler değişmez.
+def _count_terms(
+    analyzer: Callable[[str], List[str]],
+    texts: Sequence[str],
+    vocabulary: Dict[str, int],
+    grow: bool = False,
+) -> sp.csr_matrix:
+    indptr, indices, values = [0], [], []
+    for text in texts:
+        term_counts = Counter()
+        for term in analyzer(text):
+            index = vocabulary.get(term)
+            if index is None and grow:
+                index = vocabulary[term] = len(vocabulary)
+            if index is not None:
+                term_counts[index] += 1
+        indices.extend(term_counts.keys())
+        values.extend(term_counts.values())
+        indptr.append(len(indices))
+    return sp.csr_matrix(
+        (np.asarray(values, dtype=np.float64), indices, indptr),
+        shape=(len(texts), len(vocabulary)),
+    )
+
+
+# TfidfVectorizer ile aynı (smooth_idf) formülle belge frekansından idf hesaplama
+def _idf_from_document_frequency(
+    document_frequency: np.ndarray, n_documents: int
+) -> np.ndarray:
+    return np.log((1 + n_documents) / (1 + document_frequency)) + 1
+
+
+# Vektörleştirici, etiket kodlayıcı ve modeli artımlı güncellemeye uygun bir
+# model paketi (sözlük) olarak eğitme. Ham terim sayıları ve belge frekansları
+# da saklanır; böylece yeni makaleler geldiğinde derlem yeniden işlenmez.
+# features "char" ya da "union" ise make_feature_pipeline kullanılır ve ham
+# metinler (raw_texts) gerekir; bu modeller artımlı güncellenemez ve küçük
+# pakete aktarılamaz. Char modunda texts (kök dizileri) kullanılmaz.
+# n_jobs, bu modlarda öznitelik çıkarımını paralel çalıştırır; pakete yazılan
+# vektörleştirici tahminde tek süreçte çalışsın diye eğitimden sonra sıfırlanır.
+def train_model(
+    texts: Optional[List[str]],
+    authors: List[str],
+    C: float = 1.0,
+    max_iter: int = 1000,
+    lemma_table: Optional[Dict[str, Tuple[str, ...]]] = None,
+    raw_texts: Optional[List[str]] = None,
+    features: str = "lemma",
+    n_jobs: Optional[int] = None,
+) -> Dict[str, Any]:
+    if features not in FEATURE_MODES:
+        raise ValueError(f"Bilinmeyen öznitelik modu: {features}")
+    if features != "lemma" and raw_texts is None:
+        raise ValueError(f"'{features}' öznitelik modu ham metinleri gerektirir")
+    label_encoder = LabelEncoder()
+    y = label_encoder.fit_transform(authors)
+
+    artifact: Dict[str, Any] = {}
+    with span("train.vectorize"):
+        if features == "lemma":
+            vectorizer = TfidfVectorizer(stop_words=get_stop_words("turkish"))
+            X = vectorizer.fit_transform(texts)
+            counts = _count_terms(
+                vectorizer.build_analyzer(), texts, vectorizer.vocabulary_
+            )
+            artifact.update(
+                counts=counts,
+                labels=y,
+                document_frequency=np.bincount(
+                    counts.indices, minlength=counts.shape[1]
+                ).astype(np.int64),
+            )
+        else:
+            vectorizer = make_feature_pipeline(features, n_jobs=n_jobs)
+            X = vectorizer.fit_transform(
+                feature_rows(raw_texts, texts if features == "union" else None)
+            )
+            vectorizer.set_params(n_jobs=None)
+    checkpoint("train.fit_transform")
+
+    with span("train.fit"):
+        model = LogisticRegression(C=C, max_iter=max_iter)
+        model.fit(X, y)
+    checkpoint("train.fit")
+
+    artifact.update(
+        features=features,
+        vectorizer=vectorizer,
+        label_encoder=label_encoder,
+        model=model,
+        lemma_table={} if lemma_table is None else lemma_table,
+        version=uuid.uuid4().hex,
+    )
+    return artifact
+
+
+def _require_lemma_features(artifact: Dict[str, Any], action: str):
+    features = artifact.get("features", "lemma")
+    if features != "lemma":
+        raise ValueError(
+            f"{action} yalnızca kök öznitelikli modellerde desteklenir "
+            f"(model: {features})"
+        )
+
+
+# Yeni makaleler ve/veya yeni yazarlar ile modeli artımlı olarak güncelleme:
+# yalnızca yeni belgeler ön işlenir, sözlük ve idf büyütülür, etiket kodlayıcı
+# yeni sınıflarla genişletilir ve sınıflandırıcı önceki katsayılardan başlatılır.
+#
+# Maliyet: ön işleme, terim sayımı ve belge frekansı yeni belge sayısıyla
+# orantılıdır. Sınıflandırıcı ise tüm satırlar (eski + yeni) üzerinde yeniden
+# eğitilir; sıcak başlangıç yalnızca yineleme sayısını azaltır, bu adımın
+# maliyeti derlemin tamamıyla büyür. Saklanan sayım matrisi de her güncellemede
+# yeniden yığılır (bellek ve kopyalama derlem boyutunda).
+def update_model(
+    artifact: Dict[str, Any],
+    new_corner_texts: List[Tuple[str, str]],
+    morphology: TurkishMorphology,
+) -> Dict[str, Any]:
+    _require_lemma_features(artifact, "Artımlı güncelleme")
+    new_texts, new_authors = prepare_data(
+        new_corner_texts, morphology, artifact.setdefault("lemma_table", {})
+    )
+
+    old_vectorizer = artifact["vectorizer"]
+    vocabulary = dict(old_vectorizer.vocabulary_)
+    n_old_features = len(vocabulary)
+    new_counts = _count_terms(
+        old_vectorizer.build_analyzer(), new_texts, vocabulary, grow=True
+    )
+
+    counts = artifact["counts"].copy()
+    counts.resize((counts.shape[0], len(vocabulary)))
+    counts = sp.vstack([counts, new_counts], format="csr")
+
+    document_frequency = np.concatenate(
+        [
+            artifact["document_frequency"],
+            np.zeros(len(vocabulary) - n_old_features, dtype=np.int64),
+        ]
+    )
+    document_frequency += np.bincount(new_counts.indices, minlength=len(vocabulary))
+    idf = _idf_from_document_frequency(document_frequency, counts.shape[0])
+
+    vectorizer = TfidfVectorizer(**old_vectorizer.get_params())
+    vectorizer.vocabulary_ = vocabulary
+    vectorizer.idf_ = idf
+    X = normalize(counts @ sp.diags(idf), norm="l2", copy=False)
+
+    # Etiket kodlayıcıyı genişletme; LabelEncoder sınıfları sıralı tuttuğu için
+    # eski etiketler yeni konumlarına taşınır
+    label_encoder = artifact["label_encoder"]
+    old_classes = label_encoder.classes_
+    classes = np.unique(np.concatenate([old_classes, np.asarray(new_authors)]))
+    positions = np.searchsorted(classes, old_classes)
+    label_encoder.classes_ = classes
+    y = np.concatenate(
+        [positions[artifact["labels"]], label_encoder.transform(new_authors)]
+    )
+
+    # Önceki katsayıları yeni sınıf ve öznitelik boyutlarına taşıma
+    model = artifact["model"]
+    old_coef, old_intercept = model.coef_, model.intercept_
+    if len(old_classes) == 2:
+        # İkili modelin tek satırı, eşdeğer çok sınıflı iki satıra bölünür
+        old_coef = np.vstack([-old_coef / 2, old_coef / 2])
+        old_intercept = np.concatenate([-old_intercept / 2, old_intercept / 2])
+    coef = np.zeros((len(classes), len(vocabulary)))
+    intercept = np.zeros(len(classes))
+    coef[positions, :n_old_features] = old_coef
+    intercept[positions] = old_intercept
+    if len(classes) == 2:
+        coef = coef[1:] - coef[:1]
+        intercept = intercept[1:] - intercept[:1]
+
+    model.set_params(warm_start=True)
+    model.coef_ = coef
+    model.intercept_ = intercept
+    model.fit(X, y)
+
+    artifact.update(
+        vectorizer=vectorizer,
+        label_encoder=label_encoder,
+        model=model,
+        counts=counts,
+        labels=y,
+        document_frequency=document_frequency,
+        version=uuid.uuid4().hex,
+    )
+    return artifact
+
+
+# Model paketi ile toplu yazar tahmini; bilinen kelimeler kök tablosundan çözülür
+# Tahmin sonuçları için TTL ve LRU tahliyeli sınırlı önbellek. Anahtar, normalize
+# edilmiş metnin (küçük harf, yalnızca harfler, tekil boşluk) ve model paketi
+# sürümünün özetidir; boşluk farkları ve yeniden gönderimler aynı anahtara düşer.
+class PredictionCache:
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def key(text: str, model_version: str) -> str:
+        normalized = " ".join(
+            normalize_text(unicodedata.normalize("NFC", text or "")).split()
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(model_version.encode("utf-8") + b"\x00")
+        digest.update(normalized.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[0] > self.ttl:
+                    del self._entries[key]
+                    self.expirations += 1
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, author: str):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), author)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+# pool verilirse (worker_pool) ön işleme işçilere dağıtılır; cache verilirse
+# daha önce görülmüş metinler ön işleme ve tahmin yapılmadan yanıtlanır.
+# artifact, load_model ya da load_compact_model çıktısı olabilir.
+def predict_authors(
+    artifact: Dict[str, Any],
+    texts: Sequence[str],
+    morphology: TurkishMorphology,
+    pool: Optional[Any] = None,
+    cache: Optional[PredictionCache] = None,
+) -> List[str]:
+    authors: List[Optional[str]] = [None] * len(texts)
+    missing = list(range(len(texts)))
+    if cache is not None:
+        # Aynı grup içindeki kopyalar da tek bir kez hesaplanır
+        model_version = artifact.get("version", "")
+        first_by_key: Dict[str, int] = {}
+        duplicates: List[Tuple[int, int]] = []
+        missing = []
+        for i, text in enumerate(texts):
+            key = cache.key(text, model_version)
+            if key in first_by_key:
+                duplicates.append((i, first_by_key[key]))
+                continue
+            first_by_key[key] = i
+            authors[i] = cache.get(key)
+            if authors[i] is None:
+                missing.append(i)
+        keys = {i: key for key, i in first_by_key.items()}
+
+    if missing:
+        features = artifact.get("features", "lemma")
+        lemma_table = artifact.get("lemma_table")
+        missing_texts = [texts[i] for i in missing]
+        preprocessed = None
+        with span("predict.preprocess"):
+            # Char modunda kök gerekmez; morfolojik analiz hiç çalışmaz
+            if features == "char":
+                pass
+            elif pool is not None:
+                preprocessed, _ = preprocess_in_pool(pool, missing_texts)
+            else:
+                preprocessed = [
+                    preprocess_text(text, morphology, lemma_table)
+                    for text in missing_texts
+                ]
+        if "model" not in artifact:
+            # Küçük model paketi (load_compact_model): saf NumPy puanlama
+            with span("predict.classify"):
+                predicted = [predict_compact(artifact, text) for text in preprocessed]
+        else:
+            with span("predict.vectorize"):
+                if features == "lemma":
+                    vectors = artifact["vectorizer"].transform(preprocessed)
+                else:
+                    vectors = artifact["vectorizer"].transform(
+                        feature_rows(missing_texts, preprocessed)
+                    )
+            with span("predict.classify"):
+                labels = artifact["model"].predict(vectors)
+            predicted = artifact["label_encoder"].inverse_transform(labels).tolist()
+        for i, author in zip(missing, predicted):
+            authors[i] = author
+            if cache is not None:
+                cache.put(keys[i], author)
+
+    if cache is not None:
+        for i, j in duplicates:
+            authors[i] = cache.get(keys[j]) or authors[j]
+    return authors
+
+
+# Model paketini diske yazma ve okuma
+def save_model(artifact: Dict[str, Any], path: str):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as file:
+        pickle.dump(artifact, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_model(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+# Her satırı {"text": ..., "author": ...} olan JSONL derlemini okuma ("-": stdin)
+def iter_corpus(path: str) -> Iterator[Tuple[str, str]]:
+    file = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "text" not in record or "author" not in record:
+                raise ValueError(f"{path}:{line_number}: 'text' ve 'author' gerekli")
+            yield record["text"], record["author"]
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def read_corpus(path: str) -> List[Tuple[str, str]]:
+    return list(iter_corpus(path))
+
+
+
+
+# Yalnızca çıkarım için küçük model paketi çıkarma. Katsayılar büyüklüğe göre
+# budanır, seyrek (öznitelik x sınıf) olarak float32 ya da sınıf başına ölçekli
+# int8 saklanır; sözlük yalnızca kalan öznitelikler için sıralı dizi olarak tutulur.
+def export_compact_model(
+    artifact: Dict[str, Any],
+    path: str,
+    keep_ratio: float = 0.2,
+    dtype: str = "float32",
+) -> Dict[str, Any]:
+    if dtype not in ("float32", "int8"):
+        raise ValueError(f"Desteklenmeyen katsayı tipi: {dtype}")
+    _require_lemma_features(artifact, "Küçük model aktarımı")
+
+    vectorizer = artifact["vectorizer"]
+    model = artifact["model"]
+    coef = model.coef_
+    magnitudes = np.abs(coef[coef != 0])
+    threshold = np.quantile(magnitudes, 1 - keep_ratio) if magnitudes.size else 0.0
+    pruned = np.where(np.abs(coef) >= threshold, coef, 0.0)
+
+    surviving = np.flatnonzero(np.any(pruned != 0, axis=0))
+    terms = vectorizer.get_feature_names_out()[surviving].astype(str)
+    order = np.argsort(terms)
+    surviving, terms = surviving[order], terms[order]
+    weights = sp.csr_matrix(pruned[:, surviving].T)
+
+    scales = np.ones(coef.shape[0], dtype=np.float32)
+    data = weights.data.astype(np.float32)
+    if dtype == "int8":
+        scales = (np.abs(pruned).max(axis=1) / 127).astype(np.float32)
+        scales[scales == 0] = 1
+        data = np.round(weights.data / scales[weights.indices]).astype(np.int8)
+
+    idf = vectorizer.idf_[surviving].astype(np.float32)
+    config = {
+        "lowercase": vectorizer.lowercase,
+        "token_pattern": vectorizer.token_pattern,
+        "ngram_range": list(vectorizer.ngram_range),
+        "stop_words": sorted(vectorizer.get_stop_words() or ()),
+    }
+    with open(path, "wb") as file:
+        np.savez(
+            file,
+            terms=terms,
+            idf=idf,
+            indptr=weights.indptr.astype(np.int32),
+            indices=weights.indices.astype(np.int32),
+            data=data,
+            scales=scales,
+            intercept=model.intercept_.astype(np.float32),
+            classes=artifact["label_encoder"].classes_.astype(str),
+            config=np.array(json.dumps(config, ensure_ascii=False)),
+            # Kök tablosu da pakete girer; bilinen kelimeler zemberek'e gitmez
+            lemma_table=np.array(
+                json.dumps(artifact.get("lemma_table") or {}, ensure_ascii=False)
+            ),
+            version=np.array(artifact.get("version", "")),
+        )
+
+    # Eğitim belgelerinde küçük model ile tam modelin tahmin uyumu
+    counts = artifact["counts"]
+    X = normalize(counts @ sp.diags(vectorizer.idf_), norm="l2")
+    X_compact = normalize(counts[:, surviving] @ sp.diags(idf), norm="l2")
+    stored_weights = sp.csr_matrix(
+        (data * scales[weights.indices], weights.indices, weights.indptr),
+        shape=weights.shape,
+    )
+    compact_scores = (X_compact @ stored_weights).toarray() + model.intercept_
+    if coef.shape[0] == 1:
+        compact_labels = (compact_scores[:, 0] > 0).astype(int)
+    else:
+        compact_labels = compact_scores.argmax(axis=1)
+
+    return {
+        "features": int(coef.shape[1]),
+        "kept_features": int(len(surviving)),
+        "nonzero_weights": int(weights.nnz),
+        "bytes": os.path.getsize(path),
+        "agreement": float(np.mean(compact_labels == model.predict(X))),
+    }
+
+
+def load_compact_model(path: str) -> Dict[str, Any]:
+    with np.load(path, allow_pickle=False) as arrays:
+        compact = {name: arrays[name] for name in arrays.files}
+    config = json.loads(str(compact.pop("config")))
+    config["token_pattern"] = re.compile(config["token_pattern"])
+    config["stop_words"] = frozenset(config["stop_words"])
+    compact["config"] = config
+    compact["lemma_table"] = {
+        word: tuple(lemmas)
+        for word, lemmas in json.loads(str(compact["lemma_table"])).items()
+    }
+    compact["version"] = f"compact-{compact['version']}"
+    compact["features"] = "lemma"
+    return compact
+
+
+# Küçük model ile saf NumPy puanlama; sklearn nesnelerine gerek duymaz.
+# Girdi, preprocess_text çıktısı olan kök dizisidir.
+def predict_compact(compact: Dict[str, Any], lemma_text: str) -> str:
+    config = compact["config"]
+    if config["lowercase"]:
+        lemma_text = lemma_text.lower()
+    words = [
+        word
+        for word in config["token_pattern"].findall(lemma_text)
+        if word not in config["stop_words"]
+    ]
+    min_n, max_n = config["ngram_range"]
+    tokens = [
+        " ".join(words[i : i + n])
+        for n in range(min_n, max_n + 1)
+        for i in range(len(words) - n + 1)
+    ]
+
+    intercept = compact["intercept"]
+    scores = intercept.astype(np.float64)
+    terms = compact["terms"]
+    if tokens and len(terms):
+        tokens = np.array(tokens)
+        positions = np.minimum(np.searchsorted(terms, tokens), len(terms) - 1)
+        found = positions[terms[positions] == tokens]
+        features, term_counts = np.unique(found, return_counts=True)
+        values = term_counts * compact["idf"][features]
+        norm = np.sqrt(np.dot(values, values))
+        if norm > 0:
+            values /= norm
+
+        # Kalan özniteliklerin seyrek satırlarını tek seferde toplama
+        starts = compact["indptr"][features]
+        lengths = compact["indptr"][features + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        flat = np.arange(lengths.sum()) + offsets
+        classes = compact["indices"][flat]
+        contributions = (
+            np.repeat(values, lengths)
+            * compact["data"][flat]
+            * compact["scales"][classes]
+        )
+        np.add.at(scores, classes, contributions)
+
+    if len(intercept) == 1:
+        return str(compact["classes"][int(scores[0] > 0)])
+    return str(compact["classes"][int(np.argmax(scores))])
+
+
+# Benzerlik sonuçlarında gösterilen metin başlangıcının uzunluğu
+SNIPPET_LENGTH = 120
+
+
+def _snippet(text: str) -> str:
+    return " ".join((text or "").split())[:SNIPPET_LENGTH]
+
+
+# Köşe yazılarının kök TF-IDF vektörlerinden benzerlik indeksi paketi
+# oluşturma. Paket, sorguları aynı uzaya taşıyan vektörleştiriciyi ve ters
+# indeksi birlikte tutar; save_model/load_model ile diske yazılır.
+def build_similarity_index(
+    texts: List[str], raw_texts: List[str], authors: List[str]
+) -> Dict[str, Any]:
+    with span("index.vectorize"):
+        vectorizer = TfidfVectorizer(
+            stop_words=get_stop_words("turkish"), dtype=np.float32
+        )
+        X = vectorizer.fit_transform(texts)
+    index = SimilarityIndex(len(vectorizer.vocabulary_))
+    with span("index.insert"):
+        index.add(X, authors, [_snippet(text) for text in raw_texts])
+    checkpoint("index.build")
+    return {"vectorizer": vectorizer, "index": index, "version": uuid.uuid4().hex}
+
+
+# İndekse yeni makaleler ekleme. Sözlük ve idf ilk derlemle sabitlenir; yeni
+# makalelerdeki bilinmeyen kökler yok sayılır (yenilemek için indeks baştan
+# oluşturulur).
+def add_to_similarity_index(
+    package: Dict[str, Any],
+    texts: List[str],
+    raw_texts: List[str],
+    authors: List[str],
+) -> range:
+    with span("index.vectorize"):
+        X = package["vectorizer"].transform(texts)
+    with span("index.insert"):
+        ids = package["index"].add(X, authors, [_snippet(text) for text in raw_texts])
+    package["version"] = uuid.uuid4().hex
+    return ids
+
+
+# Her metin için indeksteki en benzer k köşe yazısı (kosinüs benzerliği)
+def similar_articles(
+    package: Dict[str, Any],
+    texts: Sequence[str],
+    morphology: TurkishMorphology,
+    k: int = 5,
+    pool: Optional[Any] = None,
+) -> List[List[Dict[str, Any]]]:
+    with span("similar.preprocess"):
+        if pool is not None:
+            preprocessed, _ = preprocess_in_pool(pool, list(texts))
+        else:
+            preprocessed = [preprocess_text(text, morphology) for text in texts]
+    with span("similar.vectorize"):
+        vectors = package["vectorizer"].transform(preprocessed)
+    index = package["index"]
+    with span("similar.search"):
+        return [
+            [
+                {
+                    "id": doc,
+                    "author": index.labels[doc],
+                    "score": round(score, 4),
+                    "snippet": index.snippets[doc],
+                }
+                for doc, score in index.search(vectors[i], k)
+            ]
+            for i in range(vectors.shape[0])
+        ]
+
 
 
 
@@ -2200,35 +3607,7 @@ Ama CHP’nin genel başkanı Özgür Özel, “Afyon Belediye Başkan adayımı
     ),
 ]
 
-# Morphology nesnesini oluştur
-morphology = TurkishMorphology.create_with_defaults()
-
-# Veriyi hazırla
-texts, authors = prepare_data(corner_texts, morphology)
-
-# Etiketleri sayısal değerlere çevir
-label_encoder = LabelEncoder()
-encoded_labels = label_encoder.fit_transform(authors)
-
-# Metinleri vektörize et ve model oluştur
-vectorizer = TfidfVectorizer(stop_words=get_stop_words("turkish"))
-X = vectorizer.fit_transform(texts)
-y = encoded_labels
-
-# Eğitim ve test verisini ayır
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42
-)
-
-# Lojistik regresyon modeli ile eğitim yap
-model = LogisticRegression()
-model.fit(X_train, y_train)
-
-# Test verisi üzerinde tahmin yap ve doğruluğu kontrol et
-accuracy = model.score(X_test, y_test)
-print(f"Model doğruluğu: {accuracy * 100:.2f}%")
-
-# Hedef metni ön işleme tabi tut ve tahmin yap
+# Yazarı tahmin edilecek hedef metin (örnek)
 target_text = """Bu tür çalışmaları iki açıdan değerlendiririm. Birincisi seyrettiğimiz ya da seyredeceğimiz filmler konusunda bilgi sahibi oluruz, diğer açıdan da farklı kişilerin çalışmalarını bir özel sayıda buluruz.
 
 HECE Dergisi’nin çıkardığı 2 ciltlik Türk Sineması kitaplığınızda yerini almalıdır.
@@ -2240,32 +3619,887 @@ Sunuş özel sayı ile ilgili açıklamayı içeriyor:
 “Türkiye’de sinemaya duyulan ilgi bugün neredeyse 60’lı 70’li yılları yakaladı. Ancak bu ilginin Türk sinemasından çok yabancı sinemaya, Doğu’nun ve Batı’nın eski ve yeni sinemalarına ve özümsenmeyen teorik metinlere doğru bir temayülü olduğunu biliyoruz. Türk kültürü ve medeniyetinin sanatla ve ilimle yoğrulmasını isteyen herkes gibi biz de Türk sinemasının gelişmesini, dünya çapında bir marka halini almasını, bu toprakların özgün sesinin, söyleminin sözcüsü olmasını, insanlığa miras kalacak filmlerle büyümesini arzu ederiz. Ancak bu filmler vücut bulurken ve seyircisi ile buluşurken, entelektüel çevrelere büyük bir rol düşmekte. Özellikle endüstri olmaktan öte bir sanat olarak sinema üzerine düşünen ve yazan herkesin yönünü en az yabancı sinema kadar ve mutlaka daha fazla Türk sinemasına çevirmesini isteriz. Yaklaşıp bakmak, üzerinde düşünüp yazıp tartışmak, sağlıklı ve tutarlı bir inceleme ve eleştiri ortamı oluşturmak, ‘sağa’ ‘sol’a çekiştirmeden, benimki sizinki demeden dikkatimizi Türk sinemasına vermek istedik."""
 
 
-
-target_text_preprocessed = preprocess_text(target_text, morphology)
-target_vector = vectorizer.transform([target_text_preprocessed])
-predicted_label = model.predict(target_vector)[0]
-predicted_author = label_encoder.inverse_transform([predicted_label])[0]
-
-print(f"Test edilen köşe yazısı, {predicted_author} tarafından yazılmış olabilir.")
-
-
-# Kelimelerin türlerini ve frekanslarını yazdırma
+# Kelimelerin türlerini ve frekanslarını yazdırma.
+# workers > 1 ise metinler cümle grupları halinde süreç havuzunda analiz edilip
+# sayımlar birleştirilir.
 def write_word_frequencies(
-    texts: List[str], morphology: TurkishMorphology, output_file: str
+    texts: List[str], morphology: TurkishMorphology, output_file: str, workers: int = 1
 ):
-    all_tokens = []
-    for text in texts:
-        analyzed_tokens = analyze_text(text, morphology)
-        all_tokens.extend(analyzed_tokens)
-
-    token_counter = Counter(all_tokens)
-
-    with open(output_file, "w", encoding="utf-8") as file:
+    if ambiguity.enabled:
+        ambiguity.begin_pass("frequencies")
+    if workers > 1:
+        with span("frequencies.analyze"), worker_pool(morphology, workers) as pool:
+            counters = list(frequencies_in_pool(pool, texts))
+        checkpoint("frequencies.analyze")
+        with span("frequencies.count"):
+            token_counter = Counter()
+            for counter in counters:
+                token_counter.update(counter)
+    else:
+        all_tokens = []
+        with span("frequencies.analyze"):
+            for text in texts:
+                analyzed_tokens = analyze_text(text, morphology)
+                all_tokens.extend(analyzed_tokens)
+                if ambiguity.enabled:
+                    ambiguity.end_document()
+        checkpoint("frequencies.analyze")
+
+        with span("frequencies.count"):
+            token_counter = Counter(all_tokens)
+    checkpoint("frequencies.count")
+
+    with span("frequencies.write"), open(output_file, "w", encoding="utf-8") as file:
         for (lemma, pos), frequency in token_counter.items():
             file.write(f"{lemma}\t{pos}\t{frequency}\n")
 
 
-# Frekans dosyasını oluşturma
-output_file = "kelime_frekanslari.txt"
-write_word_frequencies(texts, morphology, output_file)
-print(f"Kelime frekansları {output_file} dosyasına yazdırıldı.")
\ No newline at end of file
+# Frekans tablosunun yaklaşık modu: (kök, tür) sayımları sabit bellekli
+# sketch'e eklenir, en sık top kayıt aynı biçimde yazılır. Sayılar Count-Min
+# tahminidir; gerçek değerden küçük olmaz. texts akış olarak tüketilir;
+# pool verilirse belgeler gruplar halinde havuza verilir ve işçilerin cümle
+# grubu sayımları ebeveyndeki sketch'e katılır.
+def write_approximate_frequencies(
+    texts: Iterable[str],
+    morphology: TurkishMorphology,
+    output_file: str,
+    sketch: FrequencySketch,
+    top: int = 10_000,
+    pool: Optional[Any] = None,
+) -> Dict[str, float]:
+    if ambiguity.enabled:
+        ambiguity.begin_pass("frequencies")
+    with span("frequencies.analyze"):
+        if pool is not None:
+            for chunk in iter_chunks(texts, DOCUMENT_CHUNK_SIZE):
+                for counter in frequencies_in_pool(pool, chunk):
+                    sketch.update(
+                        {f"{lemma}\t{pos}": count for (lemma, pos), count in counter.items()}
+                    )
+        else:
+            for text in texts:
+                for lemma, pos in analyze_text(text, morphology):
+                    sketch.add(f"{lemma}\t{pos}")
+                if ambiguity.enabled:
+                    ambiguity.end_document()
+    checkpoint("frequencies.analyze")
+
+    with span("frequencies.write"), open(output_file, "w", encoding="utf-8") as file:
+        for key, frequency in sketch.top(top):
+            file.write(f"{key}\t{frequency}\n")
+    return sketch.bounds()
+
+
+# --dedup verilmişse derlemdeki yakın kopyaları akış halinde ayıklama; rapor
+# akış tükenince yazdırılır
+def _deduplicated(
+    args: argparse.Namespace, corpus: Iterable[Tuple[str, str]]
+) -> Iterable[Tuple[str, str]]:
+    if not args.dedup:
+        return corpus
+    kept, dedup = deduplicate_corpus(
+        corpus, args.shingle_size, args.dedup_threshold, args.dedup_max_documents
+    )
+
+    def reported() -> Iterator[Tuple[str, str]]:
+        yield from kept
+        report = dedup.report()
+        print(
+            f"Yakın kopya: {report['duplicates']}/{report['documents']} belge, "
+            f"{report['removed_words']} kelime ({report['removed_word_rate'] * 100:.1f}%) "
+            "ön işlemeden çıkarıldı.",
+            file=sys.stderr,
+        )
+
+    return reported()
+
+
+# Derlemi aynen geçirirken her belgenin kök n-gramlarını sayaca ekleme. Böylece
+# n-gramlar frekans sayımıyla aynı akışta, derlem belleğe alınmadan sayılır.
+# n-gramlar noktalama ve cümle sınırlarını aşmasın diye ham metinden çıkarılır;
+# belirsizlik sayımları ayrı "ngrams" geçişine yazılır.
+def counting_ngrams(
+    corpus: Iterable[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    counter: NgramCounter,
+) -> Iterator[Tuple[str, str]]:
+    for item in corpus:
+        with span("ngrams.count"), ambiguity.switched("ngrams"):
+            for sentence in split_sentences(item[0] or ""):
+                for run in lemma_runs(sentence, morphology):
+                    counter.update(run)
+        yield item
+
+
+# Sayaçtaki n-gramları eşdizimlik puanlarıyla (PMI, G²) yazma. Her derece için
+# output_prefix.{n}gram.txt dosyası oluşur.
+def write_counter_collocations(
+    counter: NgramCounter, output_prefix: str, min_count: int = 2
+) -> Dict[str, Any]:
+    checkpoint("ngrams.count")
+    with span("ngrams.write"):
+        for n in counter.orders:
+            write_collocations(
+                counter.collocations(n, min_count), f"{output_prefix}.{n}gram.txt"
+            )
+    return counter.report()
+
+
+# Kök n-gramlarını akış halinde sayıp yazma; sayaç belleği max_ngrams ile sınırlıdır
+def write_ngram_collocations(
+    texts: Iterable[str],
+    morphology: TurkishMorphology,
+    output_prefix: str,
+    orders: Sequence[int] = (2, 3),
+    min_count: int = 2,
+    max_ngrams: int = 1_000_000,
+) -> Dict[str, Any]:
+    counter = NgramCounter(orders, max_ngrams)
+    if ambiguity.enabled:
+        ambiguity.begin_pass("ngrams")
+    for _ in counting_ngrams(((text, "") for text in texts), morphology, counter):
+        pass
+    return write_counter_collocations(counter, output_prefix, min_count)
+
+
+# Alt komut verilmediğinde çalışan örnek akış: örnek derlemle eğitim, hedef
+# metin için tahmin ve frekans dosyasının yazılması
+def run_demo(args: argparse.Namespace):
+    # Morphology nesnesini oluştur
+    morphology = get_morphology(args.cache_dir)
+
+    # Veriyi hazırla
+    corpus = list(_deduplicated(args, corner_texts))
+    lemma_table = {}
+    texts, authors = cached_prepare_data(
+        corpus, lambda: morphology, args.cache_dir, lemma_table
+    )
+
+    if args.cv:
+        # Katmanlı çapraz doğrulama ve hiperparametre araması
+        report = cross_validate_grid(
+            texts, authors, n_splits=args.folds, n_jobs=args.jobs, cache_dir=args.cache_dir
+        )
+        print_cv_report(report)
+
+    # Etiketleri sayısal değerlere çevir
+    label_encoder = LabelEncoder()
+    encoded_labels = label_encoder.fit_transform(authors)
+
+    # Metinleri vektörize et ve model oluştur
+    raw_texts = [text for text, _ in corpus]
+    with span("train.vectorize"):
+        vectorizer = make_feature_pipeline(args.features, n_jobs=args.jobs)
+        X = vectorizer.fit_transform(feature_rows(raw_texts, texts))
+    checkpoint("train.fit_transform")
+    y = encoded_labels
+
+    # Eğitim ve test verisini ayır
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+
+    # Lojistik regresyon modeli ile eğitim yap
+    with span("train.fit"):
+        model = LogisticRegression()
+        model.fit(X_train, y_train)
+    checkpoint("train.fit")
+
+    # Test verisi üzerinde tahmin yap ve doğruluğu kontrol et
+    accuracy = model.score(X_test, y_test)
+    print(f"Model doğruluğu: {accuracy * 100:.2f}%")
+
+    # Hedef metni ön işleme tabi tut ve tahmin yap
+    target_text_preprocessed = None
+    with span("predict.preprocess"):
+        if args.features != "char":
+            target_text_preprocessed = [
+                preprocess_text(target_text, morphology, lemma_table)
+            ]
+    with span("predict.vectorize"):
+        target_vector = vectorizer.transform(
+            feature_rows([target_text], target_text_preprocessed)
+        )
+    with span("predict.classify"):
+        predicted_label = model.predict(target_vector)[0]
+    predicted_author = label_encoder.inverse_transform([predicted_label])[0]
+
+    print(f"Test edilen köşe yazısı, {predicted_author} tarafından yazılmış olabilir.")
+
+    # Frekans dosyasını oluşturma
+    output_file = "kelime_frekanslari.txt"
+    write_word_frequencies(texts, morphology, output_file)
+    print(f"Kelime frekansları {output_file} dosyasına yazdırıldı.")
+
+
+
+# Derlemden model paketi oluşturma
+def run_train(args: argparse.Namespace):
+    corpus = read_corpus(args.corpus) if args.corpus else corner_texts
+    corpus = list(_deduplicated(args, corpus))
+    lemma_table = {}
+    if args.features == "char":
+        # Hızlı mod: kökler kullanılmaz, zemberek hiç yüklenmez
+        texts, authors = None, [author for _, author in corpus]
+    else:
+        texts, authors = cached_prepare_data(
+            corpus,
+            lambda: get_morphology(args.cache_dir),
+            args.cache_dir,
+            lemma_table,
+            args.workers,
+        )
+    artifact = train_model(
+        texts,
+        authors,
+        C=args.C,
+        lemma_table=lemma_table,
+        raw_texts=[text for text, _ in corpus],
+        features=args.features,
+        n_jobs=args.jobs,
+    )
+    save_model(artifact, args.output)
+    print(
+        f"{len(authors)} belge ve {len(artifact['label_encoder'].classes_)} yazar ile "
+        f"eğitilen model {args.output} dosyasına yazıldı.",
+        file=sys.stderr,
+    )
+
+
+# Mevcut model paketini yeni makalelerle güncelleme (bkz. update_model maliyeti)
+def run_update(args: argparse.Namespace):
+    artifact = load_model(args.model)
+    corpus = list(_deduplicated(args, iter_corpus(args.corpus)))
+    documents = len(artifact["labels"])
+    artifact = update_model(artifact, corpus, get_morphology(args.cache_dir))
+    output = args.output or args.model
+    save_model(artifact, output)
+    print(
+        f"{len(corpus)} yeni belge eklendi ({documents} -> {len(artifact['labels'])}); "
+        f"{len(artifact['label_encoder'].classes_)} yazarlı model {output} "
+        "dosyasına yazıldı.",
+        file=sys.stderr,
+    )
+
+
+# Model paketinden yalnızca çıkarım için küçük model paketi çıkarma
+def run_export(args: argparse.Namespace):
+    report = export_compact_model(
+        load_model(args.model), args.output, args.keep_ratio, args.dtype
+    )
+    print(
+        f"Küçük model {args.output} dosyasına yazıldı: {json.dumps(report)}",
+        file=sys.stderr,
+    )
+
+
+def _read_batches(file, batch_size: int) -> Iterator[List[str]]:
+    batch = []
+    for line in file:
+        if line.strip():
+            batch.append(line)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# stdin'den JSONL ({"text": ...}) okuyup her satırı "author" alanı eklenmiş
+# olarak stdout'a yazma; satırlar gruplar halinde işlenir
+def run_predict(args: argparse.Namespace):
+    # zemberek kök günlükçüye stdout üzerinden yazar; JSONL çıktısını bozmasın
+    logging.getLogger("zemberek").setLevel(logging.WARNING)
+    if args.compact_model:
+        artifact = load_compact_model(args.compact_model)
+    else:
+        artifact = load_model(args.model)
+    # Char modundaki modeller kök kullanmaz; zemberek yüklenmez
+    char_only = artifact.get("features", "lemma") == "char"
+    morphology = None if char_only else get_morphology(args.cache_dir)
+
+    cache = None
+    if args.cache_size > 0:
+        cache = PredictionCache(args.cache_size, args.cache_ttl)
+    pool_context = nullcontext()
+    if args.workers > 1 and not char_only:
+        pool_context = worker_pool(morphology, args.workers, artifact.get("lemma_table"))
+
+    with pool_context as pool:
+        for lines in _read_batches(sys.stdin, args.batch_size):
+            records = []
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                    if not isinstance(record.get("text"), str):
+                        raise ValueError("'text' alanı gerekli")
+                except (ValueError, AttributeError) as error:
+                    record = {"error": f"Geçersiz satır: {error}"}
+                records.append(record)
+
+            valid = [record for record in records if "error" not in record]
+            if valid:
+                authors = predict_authors(
+                    artifact,
+                    [record["text"] for record in valid],
+                    morphology,
+                    pool,
+                    cache,
+                )
+                for record, author in zip(valid, authors):
+                    record["author"] = author
+
+            for record in records:
+                sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+    if cache is not None:
+        print(f"Tahmin önbelleği: {json.dumps(cache.metrics())}", file=sys.stderr)
+
+
+# stdin'den JSONL ({"text": ...}) okuyup her satıra indeksteki en benzer köşe
+# yazılarını "similar" alanı olarak ekleme
+def run_similar(args: argparse.Namespace):
+    logging.getLogger("zemberek").setLevel(logging.WARNING)
+    package = load_model(args.index)
+    morphology = get_morphology(args.cache_dir)
+
+    pool_context = nullcontext()
+    if args.workers > 1:
+        pool_context = worker_pool(morphology, args.workers)
+
+    with pool_context as pool:
+        for lines in _read_batches(sys.stdin, args.batch_size):
+            records = []
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                    if not isinstance(record.get("text"), str):
+                        raise ValueError("'text' alanı gerekli")
+                except (ValueError, AttributeError) as error:
+                    record = {"error": f"Geçersiz satır: {error}"}
+                records.append(record)
+
+            valid = [record for record in records if "error" not in record]
+            if valid:
+                neighbours = similar_articles(
+                    package,
+                    [record["text"] for record in valid],
+                    morphology,
+                    args.top_k,
+                    pool,
+                )
+                for record, similar in zip(valid, neighbours):
+                    record["similar"] = similar
+
+            for record in records:
+                sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+    print(
+        f"Benzerlik indeksi: {json.dumps(package['index'].metrics())}", file=sys.stderr
+    )
+
+
+# Derlemin kök/tür frekans tablosunu yazma. Yaklaşık modda derlem ön işlemeden
+# sketch'e kadar akış halinde geçer (kök önbelleği kullanılmaz); ön işleme ve
+# sayım tek geçiştir, belirsizlik raporu ikisini "frequencies" altında verir.
+# --ngrams verilirse n-gramlar da aynı geçişte, ham metinden sayılır.
+def run_freq(args: argparse.Namespace):
+    corpus = iter_corpus(args.corpus) if args.corpus else corner_texts
+    corpus = _deduplicated(args, corpus)
+    if args.ngrams:
+        ngram_counter = NgramCounter(args.ngrams, args.max_ngrams)
+        if ambiguity.enabled:
+            ambiguity.begin_pass("ngrams")
+        corpus = counting_ngrams(corpus, get_morphology(args.cache_dir), ngram_counter)
+    if args.approximate:
+        # Önceki günlerin sketch'i varsa sayımlar onun üzerine eklenir; başka
+        # makine ya da günlerin sketch'leri de aynı tabloya katılır
+        if args.sketch and os.path.exists(args.sketch):
+            sketch = load_sketch(args.sketch)
+        else:
+            sketch = FrequencySketch(
+                args.sketch_epsilon, args.sketch_delta, args.heavy_hitters
+            )
+        sketch = merge_sketches(
+            chain([sketch], (load_sketch(path) for path in args.merge_sketch))
+        )
+        morphology = get_morphology(args.cache_dir)
+        pool_context = nullcontext()
+        if args.workers > 1:
+            pool_context = worker_pool(morphology, args.workers)
+        with pool_context as pool:
+            bounds = write_approximate_frequencies(
+                iter_prepared_texts(corpus, morphology, pool),
+                morphology,
+                args.output,
+                sketch,
+                args.top_k,
+                pool,
+            )
+        if args.sketch:
+            sketch.save(args.sketch)
+        print(
+            f"Yaklaşık kelime frekansları {args.output} dosyasına yazdırıldı: "
+            f"{json.dumps(bounds)}",
+            file=sys.stderr,
+        )
+    else:
+        texts, _ = cached_prepare_data(
+            corpus,
+            lambda: get_morphology(args.cache_dir),
+            args.cache_dir,
+            workers=args.workers,
+        )
+        write_word_frequencies(
+            texts, get_morphology(args.cache_dir), args.output, args.workers
+        )
+        print(f"Kelime frekansları {args.output} dosyasına yazdırıldı.", file=sys.stderr)
+
+    if args.ngrams:
+        prefix = os.path.splitext(args.output)[0]
+        report = write_counter_collocations(ngram_counter, prefix, args.ngram_min_count)
+        print(
+            f"Eşdizimlikler {prefix}.<n>gram.txt dosyalarına yazdırıldı: "
+            f"{json.dumps(report)}",
+            file=sys.stderr,
+        )
+
+
+# Derlemdeki en sık yüzey biçimlerinin analiz tablosunu derleme. Hem ham
+# token'lar hem de ön işlemenin zemberek'e gönderdiği normalleştirilmiş
+# kelimeler sayılır.
+def run_build_table(args: argparse.Namespace):
+    corpus = read_corpus(args.corpus) if args.corpus else corner_texts
+
+    def normalize(text: str) -> str:
+        sentences = split_sentences(unicodedata.normalize("NFC", text or ""))
+        return " ".join(normalize_text(sentence) for sentence in sentences)
+
+    counts = count_surface_forms((text or "" for text, _ in corpus), normalize)
+    count = build_analysis_table(
+        counts, get_morphology(args.cache_dir), args.output, args.top
+    )
+    print(
+        f"{count} kelimelik analiz tablosu {args.output} dosyasına yazıldı.",
+        file=sys.stderr,
+    )
+
+
+# Derlemden benzerlik indeksi oluşturma; indeks dosyası varsa derlemdeki
+# makaleler mevcut indekse eklenir
+def run_index(args: argparse.Namespace):
+    corpus = read_corpus(args.corpus) if args.corpus else corner_texts
+    corpus = list(_deduplicated(args, corpus))
+    texts, authors = cached_prepare_data(
+        corpus,
+        lambda: get_morphology(args.cache_dir),
+        args.cache_dir,
+        workers=args.workers,
+    )
+    raw_texts = [text for text, _ in corpus]
+    if os.path.exists(args.output) and not args.rebuild:
+        package = load_model(args.output)
+        add_to_similarity_index(package, texts, raw_texts, authors)
+    else:
+        package = build_similarity_index(texts, raw_texts, authors)
+    save_model(package, args.output)
+    print(
+        f"Benzerlik indeksi {args.output} dosyasına yazıldı: "
+        f"{json.dumps(package['index'].metrics())}",
+        file=sys.stderr,
+    )
+
+
+def run_bench(args: argparse.Namespace):
+    import bench
+
+    if args.baseline is not None:
+        passed = bench.run_regression(
+            args.baseline,
+            corner_texts,
+            get_morphology(args.cache_dir),
+            trials=args.trials,
+            tolerance=args.tolerance,
+            update=args.update_baseline,
+        )
+        if not passed:
+            sys.exit(1)
+        return
+
+    if args.cold_start:
+        bench.print_cold_start(bench.bench_cold_start(args.model, args.trials))
+        return
+
+    if args.similarity:
+        bench.print_similarity(bench.bench_similarity(args.similarity_sizes))
+        return
+
+    if args.scaling:
+        bench.run_scaling(
+            corner_texts,
+            get_morphology(args.cache_dir),
+            args.sizes,
+            args.worker_counts,
+            args.workers,
+            args.scaling_tokens,
+            args.scaling_output,
+        )
+        return
+
+    bench.print_feature_modes(
+        bench.bench_feature_modes(
+            corner_texts,
+            get_morphology(args.cache_dir),
+            n_splits=args.folds,
+            n_jobs=args.workers,
+        )
+    )
+    bench.print_ambiguity(
+        bench.bench_ambiguity(corner_texts, get_morphology(args.cache_dir))
+    )
+
+
+# bench alt komutu ile bench.py'nin ortak seçenekleri; tek tanım burada durur
+def add_regression_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--baseline", default=None, help="gerileme karşılaştırması için taban çizgisi JSON"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="taban çizgisini yeniden yaz"
+    )
+    parser.add_argument("--trials", type=int, default=5, help="tekrar sayısı")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.10, help="izin verilen göreli kötüleşme"
+    )
+
+
+def add_scaling_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--scaling", action="store_true", help="derlem boyutu ve işçi sayısı taraması"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="derlem boyutu taramasındaki token sayıları",
+    )
+    parser.add_argument(
+        "--worker-counts",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="işçi sayısı taramasındaki değerler",
+    )
+    parser.add_argument(
+        "--scaling-tokens",
+        type=int,
+        default=100_000,
+        help="işçi sayısı taramasındaki derlemin token sayısı",
+    )
+    parser.add_argument(
+        "--scaling-output", default=None, help="tarama sonuçlarının yazılacağı JSON dosyası"
+    )
+
+
+def add_cold_start_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--cold-start", action="store_true", help="soğuk başlangıç ve içe aktarma süreleri"
+    )
+    parser.add_argument(
+        "--model", default=None, help="soğuk başlangıçta yüklenecek model paketi"
+    )
+
+
+def add_similarity_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--similarity", action="store_true", help="benzerlik indeksi sorgu süreleri"
+    )
+    parser.add_argument(
+        "--similarity-sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="benzerlik indeksindeki yapay belge sayıları",
+    )
+
+
+# Hem komutsuz örnek akışta hem alt komutlarda geçerli seçenekler. Her seçenek
+# burada bir kez tanımlanır: ana ayrıştırıcıya varsayılanlarıyla, alt komutların
+# ortak ebeveynine suppress=True ile eklenir. Alt komutta verilmeyen seçenek ad
+# alanına yazılmaz; böylece alt komut adından önce verilen değer ezilmez.
+def _add_shared_arguments(parser: argparse.ArgumentParser, suppress: bool = False):
+    def add(*names: str, default: Any = None, **kwargs: Any):
+        parser.add_argument(
+            *names, default=argparse.SUPPRESS if suppress else default, **kwargs
+        )
+
+    add("--workers", type=int, default=1, help="işçi süreç sayısı")
+    add("--jobs", type=int, default=-1, help="paralel iş sayısı (-1: tüm çekirdekler)")
+    add("--folds", type=int, default=5, help="katman sayısı")
+    add(
+        "--features",
+        choices=FEATURE_MODES,
+        default="lemma",
+        help="öznitelik modu (char: zemberek olmadan hızlı mod); train bunu model "
+        "paketine yazar, predict ve serve onu kullanır",
+    )
+    add("--cache-dir", help="önbellek dizini (kök önbelleği ve morphology anlık görüntüsü)")
+    add("--timing-report", help="aşama sürelerinin yazılacağı JSON dosyası")
+    add(
+        "--memory-report",
+        help="aşama sınırlarındaki tracemalloc ölçümlerinin yazılacağı JSON dosyası",
+    )
+    add(
+        "--ambiguity-report",
+        help="biçimbirimsel belirsizlik istatistiklerinin yazılacağı JSON dosyası",
+    )
+    add("--analysis-table", help="önceden derlenmiş analiz tablosu")
+
+    # Yakın kopya ayıklama
+    add(
+        "--dedup",
+        action="store_true",
+        default=False,
+        help="MinHash/LSH ile yakın kopyaları ayıkla",
+    )
+    add("--dedup-threshold", type=float, default=0.8, help="Jaccard benzerlik eşiği")
+    add("--shingle-size", type=int, default=5, help="kelime k-gram (shingle) boyu")
+    add(
+        "--dedup-max-documents",
+        type=int,
+        help="süzgeçte tutulacak en fazla belge (en eskisi atılır; varsayılan: sınırsız)",
+    )
+
+    # Profil
+    add(
+        "--profile",
+        choices=PROFILE_MODES,
+        help="cprofile: deterministik, sample: SIGPROF ile örnekleme",
+    )
+    add(
+        "--profile-stage",
+        help="yalnızca bu aşamayı profille (ör. analyze_text.analyze; varsayılan: tüm komut)",
+    )
+    add(
+        "--profile-output",
+        default="profil",
+        help="çıktı öneki (.pstats ve flamegraph için .collapsed)",
+    )
+    add("--profile-interval", type=float, default=0.005, help="örnekleme aralığı (sn)")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Zemberek ile yazar tahmini")
+    parser.add_argument(
+        "--cv", action="store_true", help="katmanlı çapraz doğrulama ve ızgara araması"
+    )
+    _add_shared_arguments(parser)
+
+    # Tüm alt komutlarda ortak seçenekler
+    common = argparse.ArgumentParser(add_help=False)
+    _add_shared_arguments(common, suppress=True)
+
+    commands = parser.add_subparsers(dest="command")
+    train = commands.add_parser("train", parents=[common], help="model paketi oluştur")
+    train.add_argument("--corpus", default=None, help="JSONL derlem (varsayılan: örnek)")
+    train.add_argument("--output", required=True, help="model paketi dosyası")
+    train.add_argument("-C", type=float, default=1.0, help="düzenlileştirme tersi")
+    train.set_defaults(handler=run_train)
+
+    update = commands.add_parser(
+        "update", parents=[common], help="model paketini yeni makalelerle güncelle"
+    )
+    update.add_argument("--model", required=True, help="model paketi dosyası")
+    update.add_argument(
+        "--corpus", required=True, help="yeni makalelerin JSONL derlemi ('-': stdin)"
+    )
+    update.add_argument(
+        "--output", default=None, help="güncellenen paket (varsayılan: --model)"
+    )
+    update.set_defaults(handler=run_update)
+
+    export = commands.add_parser(
+        "export", parents=[common], help="yalnızca çıkarım için küçük model paketi çıkar"
+    )
+    export.add_argument("--model", required=True, help="model paketi dosyası")
+    export.add_argument("--output", required=True, help="küçük model dosyası (.npz)")
+    export.add_argument(
+        "--keep-ratio",
+        type=float,
+        default=0.2,
+        help="büyüklüğe göre tutulacak katsayı oranı",
+    )
+    export.add_argument(
+        "--dtype", choices=("float32", "int8"), default="float32", help="katsayı tipi"
+    )
+    export.set_defaults(handler=run_export)
+
+    predict = commands.add_parser(
+        "predict", parents=[common], help="stdin JSONL -> stdout JSONL tahmin"
+    )
+    predict_model = predict.add_mutually_exclusive_group(required=True)
+    predict_model.add_argument("--model", help="model paketi dosyası")
+    predict_model.add_argument(
+        "--compact-model", help="küçük model paketi (export çıktısı)"
+    )
+    predict.add_argument("--batch-size", type=int, default=64, help="grup boyutu")
+    predict.add_argument(
+        "--cache-size", type=int, default=10000, help="tahmin önbelleği (0: kapalı)"
+    )
+    predict.add_argument(
+        "--cache-ttl", type=float, default=None, help="önbellek kaydı ömrü (sn)"
+    )
+    predict.set_defaults(handler=run_predict)
+
+    similar = commands.add_parser(
+        "similar", parents=[common], help="stdin JSONL -> en benzer köşe yazıları"
+    )
+    similar.add_argument("--index", required=True, help="benzerlik indeksi dosyası")
+    similar.add_argument("--top-k", type=int, default=5, help="benzer yazı sayısı")
+    similar.add_argument("--batch-size", type=int, default=64, help="grup boyutu")
+    similar.set_defaults(handler=run_similar)
+
+    freq = commands.add_parser("freq", parents=[common], help="frekans tablosu yaz")
+    freq.add_argument("--corpus", default=None, help="JSONL derlem (varsayılan: örnek)")
+    freq.add_argument("--output", default="kelime_frekanslari.txt")
+    freq.add_argument(
+        "--ngrams",
+        type=int,
+        nargs="*",
+        default=[],
+        help="kök n-gram dereceleri (ör. 2 3); PMI ve G² ile yazılır",
+    )
+    freq.add_argument(
+        "--ngram-min-count",
+        type=int,
+        default=2,
+        help="yazılacak en küçük n-gram sayısı",
+    )
+    freq.add_argument(
+        "--max-ngrams",
+        type=int,
+        default=1_000_000,
+        help="derece başına bellekte tutulacak en fazla n-gram",
+    )
+    freq.add_argument(
+        "--approximate",
+        action="store_true",
+        help="tam sayım yerine sabit bellekli sketch ile en sık kayıtları yaz",
+    )
+    freq.add_argument(
+        "--sketch-epsilon",
+        type=float,
+        default=1e-4,
+        help="Count-Min göreli hata sınırı (toplam sayının oranı)",
+    )
+    freq.add_argument(
+        "--sketch-delta",
+        type=float,
+        default=0.01,
+        help="Count-Min hata sınırının aşılma olasılığı",
+    )
+    freq.add_argument(
+        "--heavy-hitters",
+        type=int,
+        default=10_000,
+        help="Misra-Gries sayaç sayısı (eksik sayım en fazla N/(k+1))",
+    )
+    freq.add_argument(
+        "--top-k", type=int, default=10_000, help="yazılacak en sık kayıt sayısı"
+    )
+    freq.add_argument(
+        "--sketch",
+        default=None,
+        help="sketch dosyası; varsa yüklenip güncellenir, sonra kaydedilir",
+    )
+    freq.add_argument(
+        "--merge-sketch",
+        nargs="*",
+        default=[],
+        help="sayımlara katılacak diğer sketch dosyaları (işçiler, günler)",
+    )
+    freq.set_defaults(handler=run_freq)
+
+    build_table = commands.add_parser(
+        "build-table", parents=[common], help="sık kelimelerin analiz tablosunu derle"
+    )
+    build_table.add_argument(
+        "--corpus", default=None, help="JSONL derlem (varsayılan: örnek)"
+    )
+    build_table.add_argument("--output", required=True, help="analiz tablosu dosyası")
+    build_table.add_argument(
+        "--top", type=int, default=200_000, help="tabloya alınacak kelime sayısı"
+    )
+    build_table.set_defaults(handler=run_build_table)
+
+    index = commands.add_parser(
+        "index", parents=[common], help="benzerlik indeksi oluştur ya da genişlet"
+    )
+    index.add_argument("--corpus", default=None, help="JSONL derlem (varsayılan: örnek)")
+    index.add_argument("--output", required=True, help="benzerlik indeksi dosyası")
+    index.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="mevcut indekse eklemek yerine sözlük ve idf ile baştan oluştur",
+    )
+    index.set_defaults(handler=run_index)
+
+    bench = commands.add_parser("bench", parents=[common], help="performans ölçümleri")
+    add_regression_arguments(bench)
+    add_scaling_arguments(bench)
+    add_cold_start_arguments(bench)
+    add_similarity_arguments(bench)
+    bench.set_defaults(handler=run_bench)
+
+    args = parser.parse_args(argv)
+
+    # Ölçüm yalnızca rapor istendiğinde açılır; kapalıyken maliyeti yok denecek kadar az
+    timer.enabled = args.timing_report is not None
+    if args.analysis_table is not None:
+        load_analysis_table(args.analysis_table)
+    ambiguity.enabled = timer.enabled or args.ambiguity_report is not None
+    if args.memory_report is not None:
+        memory.start()
+    profiler = None
+    if args.profile is not None:
+        profiler = make_profiler(args.profile, args.profile_interval)
+        if args.profile_stage is not None:
+            timer.profile(args.profile_stage, profiler)
+        else:
+            profiler.start()
+    try:
+        if args.command is None:
+            run_demo(args)
+        else:
+            args.handler(args)
+    finally:
+        if profiler is not None:
+            if args.profile_stage is None:
+                profiler.stop()
+            profiler.close()
+            paths = profiler.write(args.profile_output)
+            print("Profil çıktıları:", ", ".join(paths), file=sys.stderr)
+            if args.profile == "cprofile":
+                print_pstats(paths[0], file=sys.stderr)
+        if args.timing_report is not None:
+            timer.dump(
+                args.timing_report,
+                {
+                    "ambiguity": ambiguity.report(),
+                    "skipped_analyses": dict(skipped_analyses),
+                    "analysis_table": (
+                        None if _analysis_table is None else _analysis_table.metrics()
+                    ),
+                },
+            )
+        if args.ambiguity_report is not None:
+            ambiguity.dump(args.ambiguity_report)
+        if args.memory_report is not None:
+            memory.dump(args.memory_report)
+            memory.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+import json
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from importlib.metadata import version as package_version
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from zemberek import TurkishMorphology, TurkishTokenizer
+
+
+# Analiz tablosunun biçim sürümü ve dosya imzası
+TABLE_FORMAT = 1
+TABLE_MAGIC = b"ZEMBEREK-ANALYSES\n"
+
+# Bir kelimenin analizleri arasında ve kök/analiz arasında kullanılan ayraçlar
+_ENTRY_SEPARATOR = "\x1f"
+_FIELD_SEPARATOR = "\x1e"
+
+
+# Tablonun geçerli olduğu ortam: kurulu zemberek-python sürümü ve bayt sırası
+def _table_header(count: int, keys_size: int, values_size: int) -> Dict[str, Any]:
+    return {
+        "format": TABLE_FORMAT,
+        "zemberek": package_version("zemberek-python"),
+        "byteorder": sys.byteorder,
+        "count": count,
+        "keys_size": keys_size,
+        "values_size": values_size,
+    }
+
+
+# Analizleri tek bir kayıt olarak kodlama: ilk karakter kelimenin zemberek
+# tarafından tanınıp tanınmadığı ("1"/"0"), ardından (kök, analiz) çiftleri
+def _encode_analyses(correct: bool, analyses: List[Tuple[str, str]]) -> bytes:
+    entries = _ENTRY_SEPARATOR.join(
+        stem + _FIELD_SEPARATOR + analysis for stem, analysis in analyses
+    )
+    return (("1" if correct else "0") + entries).encode("utf-8")
+
+
+def _decode_analyses(data: bytes) -> Tuple[bool, List[Tuple[str, str]]]:
+    text = data.decode("utf-8")
+    if len(text) == 1:
+        return text == "1", []
+    return text[0] == "1", [
+        tuple(entry.split(_FIELD_SEPARATOR, 1))
+        for entry in text[1:].split(_ENTRY_SEPARATOR)
+    ]
+
+
+# Derlemlerdeki yüzey biçimlerinin sıklıkları; analyze_text'e ulaşan biçimler
+# hem ham token'lar hem de ön işlenmiş (küçük harfli) kelimelerdir
+def count_surface_forms(texts: Iterable[str], normalize=None) -> Counter:
+    counts: Counter = Counter()
+    for text in texts:
+        counts.update(
+            token.content for token in TurkishTokenizer.DEFAULT.tokenize(text)
+        )
+        if normalize is not None:
+            counts.update(normalize(text).split())
+    return counts
+
+
+# En sık top yüzey biçimini analiz edip tabloyu yazma. Anahtarlar UTF-8 bayt
+# sırasına göre sıralanır; dosya: imza, JSON başlık, 8 bayta hizalama, anahtar
+# ve değer ofset dizileri (uint32, count + 1), anahtar ve değer blokları.
+def build_analysis_table(
+    counts: Counter, morphology: TurkishMorphology, path: str, top: int = 200_000
+) -> int:
+    records = []
+    for surface, _ in counts.most_common(top):
+        results = morphology.analyze(surface)
+        analyses = [
+            (result.get_stem(), result.format_string()) for result in results
+        ]
+        records.append(
+            (
+                surface.encode("utf-8"),
+                _encode_analyses(results.is_correct(), analyses),
+            )
+        )
+    records.sort()
+
+    key_offsets, value_offsets = array("I", [0]), array("I", [0])
+    for key, value in records:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(value))
+
+    header = json.dumps(
+        _table_header(len(records), key_offsets[-1], value_offsets[-1])
+    ).encode("utf-8") + b"\n"
+    prefix = TABLE_MAGIC + header
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(prefix)
+        file.write(b"\0" * (-len(prefix) % 8))
+        file.write(key_offsets.tobytes())
+        file.write(value_offsets.tobytes())
+        for key, _ in records:
+            file.write(key)
+        for _, value in records:
+            file.write(value)
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+# Anahtar dizisine bisect için dizi arayüzü (kopyalamadan dilimleme)
+class _Keys:
+    __slots__ = ("blob", "offsets")
+
+    def __init__(self, blob: memoryview, offsets: memoryview):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return bytes(self.blob[self.offsets[index] : self.offsets[index + 1]])
+
+
+# Belleğe eşlenmiş analiz tablosu. Sayfalar salt okunur eşlendiğinden aynı
+# dosyayı açan tüm süreçler (fork'lanmış işçiler dahil) onları işletim
+# sistemi üzerinden paylaşır; ısınma maliyeti yoktur.
+class AnalysisTable:
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(TABLE_MAGIC)] != TABLE_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} bir analiz tablosu değil")
+        header_end = self._map.find(b"\n", len(TABLE_MAGIC)) + 1
+        header = json.loads(self._map[len(TABLE_MAGIC) : header_end])
+        expected = _table_header(
+            header.get("count"), header.get("keys_size"), header.get("values_size")
+        )
+        if header != expected:
+            self._map.close()
+            raise ValueError(
+                f"{path} farklı bir ortam için oluşturulmuş: {header} != {expected}"
+            )
+
+        count = header["count"]
+        view = memoryview(self._map)
+        start = header_end + (-header_end % 8)
+        offsets_size = (count + 1) * 4
+        key_offsets = view[start : start + offsets_size].cast("I")
+        start += offsets_size
+        self._value_offsets = view[start : start + offsets_size].cast("I")
+        start += offsets_size
+        self._keys = _Keys(view[start : start + header["keys_size"]], key_offsets)
+        start += header["keys_size"]
+        self._values = view[start : start + header["values_size"]]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # Yüzey biçiminin (tanınma, [(kök, analiz), ...]) kaydı; tabloda yoksa None
+    def get(self, surface: str) -> Optional[Tuple[bool, List[Tuple[str, str]]]]:
+        key = surface.encode("utf-8")
+        index = bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        offsets = self._value_offsets
+        return _decode_analyses(
+            bytes(self._values[offsets[index] : offsets[index + 1]])
+        )
+
+    # İşçideki isabet sayaçlarını alıp sıfırlama; ebeveyn merge_counts ile toplar
+    def drain_counts(self) -> Tuple[int, int]:
+        counts = (self.hits, self.misses)
+        self.hits = self.misses = 0
+        return counts
+
+    def merge_counts(self, counts: Tuple[int, int]):
+        self.hits += counts[0]
+        self.misses += counts[1]
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
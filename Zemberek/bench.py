@@ -0,0 +1,997 @@
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import scipy.sparse as sp
+from zemberek import TurkishMorphology, TurkishTokenizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold, cross_val_score
+from sklearn.pipeline import make_pipeline
+
+from YeniZemberek import (
+    FEATURE_MODES,
+    MEMOIZED_TOKEN_TYPES,
+    TOKEN_RULES,
+    add_cold_start_arguments,
+    add_regression_arguments,
+    add_scaling_arguments,
+    add_similarity_arguments,
+    analyze_tokens,
+    corner_texts,
+    feature_rows,
+    frequencies_in_pool,
+    get_morphology,
+    make_feature_pipeline,
+    normalize_text,
+    predict_authors,
+    prepare_data,
+    preprocess_in_pool,
+    preprocess_text,
+    save_model,
+    train_model,
+    worker_pool,
+    write_word_frequencies,
+    _preprocess_worker,
+)
+from profiling import ambiguity
+from similarity import SimilarityIndex
+
+
+# Öznitelik modlarının doğruluk ve tahmin hızını karşılaştırma.
+# Kök kullanan modların tahmin süresine ön işleme (zemberek) süresi de eklenir.
+def bench_feature_modes(
+    corner_texts: Sequence[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    modes: Sequence[str] = FEATURE_MODES,
+    n_splits: int = 5,
+    n_jobs: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    raw_texts = [text for text, _ in corner_texts]
+
+    start = time.perf_counter()
+    lemma_texts, authors = prepare_data(list(corner_texts), morphology)
+    preprocess_time = time.perf_counter() - start
+
+    results = []
+    for mode in modes:
+        rows = feature_rows(raw_texts, lemma_texts if mode != "char" else None)
+        pipeline = make_pipeline(
+            make_feature_pipeline(mode, n_jobs=n_jobs),
+            LogisticRegression(max_iter=1000),
+        )
+        scores = cross_val_score(
+            pipeline,
+            rows,
+            authors,
+            cv=StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=42),
+        )
+
+        start = time.perf_counter()
+        pipeline.fit(rows, authors)
+        fit_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pipeline.predict(rows)
+        predict_time = time.perf_counter() - start
+        if mode != "char":
+            predict_time += preprocess_time
+
+        results.append(
+            {
+                "mode": mode,
+                "accuracy": float(scores.mean()),
+                "fit_time": fit_time,
+                "predict_time": predict_time,
+                "docs_per_sec": len(raw_texts) / predict_time,
+            }
+        )
+    return results
+
+
+# Öznitelik modu sonuçlarını tablo olarak yazdırma
+def print_feature_modes(results: List[Dict[str, Any]]):
+    print(f"{'mod':<8}{'doğruluk':>10}{'eğitim (sn)':>14}{'tahmin (sn)':>14}{'belge/sn':>12}")
+    for row in results:
+        print(
+            f"{row['mode']:<8}{row['accuracy'] * 100:>9.2f}%{row['fit_time']:>14.3f}"
+            f"{row['predict_time']:>14.3f}{row['docs_per_sec']:>12.1f}"
+        )
+
+
+# Derlemin biçimbirimsel belirsizliği; aynı boyuttaki derlemlerden bazılarının
+# neden daha yavaş vektörleştirilip eğitildiğini açıklar
+def bench_ambiguity(
+    corner_texts: Sequence[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    top: int = 10,
+) -> Dict[str, Any]:
+    enabled = ambiguity.enabled
+    ambiguity.reset()
+    ambiguity.enabled = True
+    try:
+        start = time.perf_counter()
+        prepare_data(list(corner_texts), morphology)
+        elapsed = time.perf_counter() - start
+        report = ambiguity.report(top)["prepare_data"]
+    finally:
+        ambiguity.enabled = enabled
+        ambiguity.reset()
+    report["corpus"]["tokens_per_sec"] = report["corpus"]["tokens"] / elapsed
+    return report
+
+
+def print_ambiguity(report: Dict[str, Any]):
+    corpus = report["corpus"]
+    print(
+        f"belge: {corpus['documents']}  token: {corpus['tokens']}  "
+        f"analiz: {corpus['analyses']}  analiz/token: {corpus['analyses_per_token']:.2f}  "
+        f"bilinmeyen: {corpus['unknown_rate'] * 100:.1f}%  "
+        f"token/sn: {corpus['tokens_per_sec']:.0f}"
+    )
+    print(f"{'analiz':>8}{'token':>10}")
+    for analyses, count in report["distribution"].items():
+        print(f"{analyses:>8}{count:>10}")
+    print(f"{'yüzey biçimi':<24}{'analiz':>8}{'geçiş':>8}")
+    for row in report["most_ambiguous"]:
+        print(f"{row['surface']:<24}{row['analyses']:>8}{row['occurrences']:>8}")
+
+
+# str.lower() ile Türkçe harf dönüşümünün karşılaştırması: farklı yüzey biçimi
+# sayısı (analiz önbelleği kaçırmaları) ve belge başına analiz edilen biçim sayısı
+def bench_case_folding(corner_texts: Sequence[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    def lower(text: str) -> str:
+        return "".join(c for c in text.lower() if c.isalpha() or c.isspace())
+
+    results = []
+    for name, fold in (("str.lower", lower), ("türkçe", normalize_text)):
+        start = time.perf_counter()
+        documents = [
+            fold(unicodedata.normalize("NFC", text)).split() for text, _ in corner_texts
+        ]
+        elapsed = time.perf_counter() - start
+        words = [word for document in documents for word in document]
+        distinct = len(set(words))
+        results.append(
+            {
+                "folding": name,
+                "tokens": len(words),
+                "distinct": distinct,
+                "cache_hit_rate": 1 - distinct / len(words),
+                "per_document_distinct": sum(len(set(document)) for document in documents),
+                "seconds": elapsed,
+            }
+        )
+    return results
+
+
+# Token türü kurallarının ve saklanan sonuçların (noktalama, sayı, tarih,
+# saat) kaldırdığı morphology.analyze çağrıları. Girdi, analyze_text'e verilen
+# ham metindir; saklanan türlerde her farklı içerik bir kez analiz edilir.
+def bench_token_filter(
+    corner_texts: Sequence[Tuple[str, str]], rules: Optional[Dict[Any, Any]] = None
+) -> Dict[str, Any]:
+    if rules is None:
+        rules = TOKEN_RULES
+    types: Counter = Counter()
+    contents: Dict[Any, set] = {}
+    for text, _ in corner_texts:
+        for token in TurkishTokenizer.DEFAULT.tokenize(text or ""):
+            types[token.type_] += 1
+            if token.type_ in MEMOIZED_TOKEN_TYPES and token.type_ not in rules:
+                contents.setdefault(token.type_, set()).add(token.content)
+    removed = {
+        token_type.name: count for token_type, count in types.items() if token_type in rules
+    }
+    memoized = {
+        token_type.name: types[token_type] - len(distinct)
+        for token_type, distinct in contents.items()
+    }
+    total = sum(types.values())
+    return {
+        "tokens": total,
+        "analyze_calls": total - sum(removed.values()) - sum(memoized.values()),
+        "removed": dict(sorted(removed.items(), key=lambda item: -item[1])),
+        "memoized": dict(sorted(memoized.items(), key=lambda item: -item[1])),
+    }
+
+
+def print_token_filter(report: Dict[str, Any]):
+    saved = report["tokens"] - report["analyze_calls"]
+    print(
+        f"token: {report['tokens']}  analyze çağrısı: {report['analyze_calls']}  "
+        f"kaldırılan: {saved} ({saved / report['tokens'] * 100:.1f}%)"
+    )
+    for name, count in report["removed"].items():
+        print(f"  {name:<16}{count:>8}  atlandı")
+    for name, count in report["memoized"].items():
+        print(f"  {name:<16}{count:>8}  saklanan sonuçtan")
+
+
+def print_case_folding(results: List[Dict[str, Any]]):
+    print(
+        f"{'dönüşüm':<12}{'token':>8}{'farklı':>8}{'isabet':>9}"
+        f"{'belge başına':>14}{'süre (ms)':>11}"
+    )
+    for row in results:
+        print(
+            f"{row['folding']:<12}{row['tokens']:>8}{row['distinct']:>8}"
+            f"{row['cache_hit_rate'] * 100:>8.2f}%{row['per_document_distinct']:>14}"
+            f"{row['seconds'] * 1000:>11.1f}"
+        )
+
+
+# Sürecin bellek kullanımı (kB). smaps_rollup varsa paylaşılan sayfalar PSS ile
+# işçiler arasında bölüştürülür; yoksa yalnızca en yüksek RSS raporlanır.
+def process_memory() -> Dict[str, int]:
+    try:
+        with open("/proc/self/smaps_rollup", "r") as file:
+            fields = {}
+            for line in file:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+        return {
+            "rss": fields["Rss"],
+            "pss": fields["Pss"],
+            "private": fields["Private_Clean"] + fields["Private_Dirty"],
+        }
+    except (OSError, KeyError):
+        return {"rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+
+def _worker_report(text: str) -> Tuple[int, Dict[str, int]]:
+    _preprocess_worker(text)
+    return os.getpid(), process_memory()
+
+
+# fork ile paylaşılan morphology ve her işçide yeniden oluşturulan (spawn)
+# morphology için işçi başlatma süresi ve işçi başına bellek karşılaştırması
+def bench_worker_pool(
+    workers: int = 4,
+    start_methods: Sequence[str] = ("fork", "spawn"),
+    sample_text: str = corner_texts[0][0],
+) -> List[Dict[str, Any]]:
+    morphology = get_morphology()
+    results = []
+    for start_method in start_methods:
+        start = time.perf_counter()
+        with worker_pool(
+            morphology if start_method == "fork" else None,
+            workers,
+            start_method=start_method,
+        ) as pool:
+            reports = dict(pool.map(_worker_report, [sample_text] * workers * 4, 1))
+        startup_time = time.perf_counter() - start
+
+        memory = list(reports.values())
+        results.append(
+            {
+                "start_method": start_method,
+                "workers": len(reports),
+                "startup_time": startup_time,
+                **{
+                    key: sum(m[key] for m in memory) / len(memory)
+                    for key in memory[0]
+                },
+            }
+        )
+    return results
+
+
+def print_worker_pool(results: List[Dict[str, Any]]):
+    print(
+        f"{'yöntem':<8}{'işçi':>6}{'başlatma (sn)':>15}"
+        f"{'RSS/işçi (MB)':>15}{'PSS/işçi (MB)':>15}{'özel/işçi (MB)':>16}"
+    )
+    for row in results:
+        columns = [
+            f"{row[key] / 1024:>15.1f}" if key in row else f"{'-':>15}"
+            for key in ("rss", "pss", "private")
+        ]
+        print(
+            f"{row['start_method']:<8}{row['workers']:>6}{row['startup_time']:>15.2f}"
+            + "".join(columns)
+        )
+
+
+# Örnek derlemi hedef token sayısına ulaşana kadar çoğaltma. Her kopyada
+# kelime sırası karıştırılır; sözcük dağarcığı ve belirsizlik korunur ama
+# belgeler birbirinin aynısı olmaz.
+def synthesize_corpus(
+    corner_texts: Sequence[Tuple[str, str]], target_tokens: int, seed: int = 0
+) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    corpus = list(corner_texts)
+    tokens = sum(len(text.split()) for text, _ in corpus)
+    while tokens < target_tokens:
+        for text, author in corner_texts:
+            words = text.split()
+            rng.shuffle(words)
+            corpus.append((" ".join(words), author))
+            tokens += len(words)
+            if tokens >= target_tokens:
+                break
+    return corpus
+
+
+def _worker_memory(_: int) -> Tuple[int, Dict[str, int]]:
+    time.sleep(0.05)  # Görevler tek bir işçide toplanmasın
+    return os.getpid(), process_memory()
+
+
+# Aynı havuzda tüm işçilerin ortalama belleği
+def _pool_memory(pool, workers: int) -> Dict[str, float]:
+    reports = list(dict(pool.map(_worker_memory, range(workers * 2), 1)).values())
+    return {key: sum(m[key] for m in reports) / len(reports) for key in reports[0]}
+
+
+# Tek bir (derlem, işçi sayısı) noktasında ön işleme, frekans sayımı ve toplu
+# tahmin süreleri. Havuz başlatma süresi ölçüme dahil edilmez.
+def _scaling_point(
+    corpus: Sequence[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    artifact: Dict[str, Any],
+    workers: int,
+) -> List[Dict[str, Any]]:
+    texts = [text for text, _ in corpus]
+    tokens = sum(len(text.split()) for text in texts)
+    rows = []
+
+    def row(stage: str, seconds: float, memory: Dict[str, float]):
+        rows.append(
+            {
+                "stage": stage,
+                "workers": workers,
+                "docs": len(texts),
+                "tokens": tokens,
+                "seconds": seconds,
+                "tokens_per_sec": tokens / seconds,
+                **memory,
+            }
+        )
+
+    with worker_pool(morphology, workers) as pool:
+        memory = _pool_memory(pool, workers)
+
+        start = time.perf_counter()
+        preprocess_in_pool(pool, texts)
+        row("prepare_data", time.perf_counter() - start, memory)
+
+        start = time.perf_counter()
+        counter = Counter()
+        for partial in frequencies_in_pool(pool, texts):
+            counter.update(partial)
+        row("frequencies", time.perf_counter() - start, memory)
+
+    with worker_pool(morphology, workers, artifact.get("lemma_table")) as pool:
+        memory = _pool_memory(pool, workers)
+        start = time.perf_counter()
+        predict_authors(artifact, texts, morphology, pool)
+        row("predict", time.perf_counter() - start, memory)
+    return rows
+
+
+def _scaling_artifact(
+    corner_texts: Sequence[Tuple[str, str]], morphology: TurkishMorphology
+) -> Dict[str, Any]:
+    lemma_table = {}
+    texts, authors = prepare_data(list(corner_texts), morphology, lemma_table)
+    return train_model(texts, authors, lemma_table=lemma_table)
+
+
+# Derlem boyutu taraması: sabit işçi sayısında token sayısı büyütülür
+def bench_scaling_sizes(
+    corner_texts: Sequence[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    token_targets: Sequence[int] = (10_000, 100_000, 1_000_000),
+    workers: int = 4,
+) -> List[Dict[str, Any]]:
+    artifact = _scaling_artifact(corner_texts, morphology)
+    results = []
+    for target in token_targets:
+        corpus = synthesize_corpus(corner_texts, target)
+        results.extend(_scaling_point(corpus, morphology, artifact, workers))
+    return results
+
+
+# İşçi sayısı taraması: sabit derlemde işçi sayısı büyütülür. Hızlanma ve
+# paralel verim, aynı aşamanın ilk (en küçük) işçi sayısındaki süresine göre
+# hesaplanır; bu sayı 1 değilse oradaki ölçeklenmenin doğrusal olduğu varsayılır.
+def bench_scaling_workers(
+    corner_texts: Sequence[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    worker_counts: Sequence[int] = (1, 2, 4, 8, 16),
+    target_tokens: int = 100_000,
+) -> List[Dict[str, Any]]:
+    artifact = _scaling_artifact(corner_texts, morphology)
+    corpus = synthesize_corpus(corner_texts, target_tokens)
+    results = []
+    for workers in worker_counts:
+        results.extend(_scaling_point(corpus, morphology, artifact, workers))
+
+    base = {}
+    for row in results:
+        base.setdefault(row["stage"], row["seconds"] * row["workers"])
+    for row in results:
+        row["speedup"] = base[row["stage"]] / row["seconds"]
+        row["efficiency"] = row["speedup"] / row["workers"]
+    return results
+
+
+def print_scaling(results: List[Dict[str, Any]]):
+    print(
+        f"{'aşama':<14}{'işçi':>6}{'token':>10}{'süre (sn)':>11}{'token/sn':>11}"
+        f"{'hızlanma':>10}{'verim':>8}{'RSS/işçi (MB)':>15}{'PSS/işçi (MB)':>15}"
+    )
+    for row in results:
+        speedup = f"{row['speedup']:>10.2f}" if "speedup" in row else f"{'-':>10}"
+        efficiency = (
+            f"{row['efficiency'] * 100:>7.0f}%" if "efficiency" in row else f"{'-':>8}"
+        )
+        memory = "".join(
+            f"{row[key] / 1024:>15.1f}" if key in row else f"{'-':>15}"
+            for key in ("rss", "pss")
+        )
+        print(
+            f"{row['stage']:<14}{row['workers']:>6}{row['tokens']:>10}"
+            f"{row['seconds']:>11.2f}{row['tokens_per_sec']:>11.0f}"
+            + speedup
+            + efficiency
+            + memory
+        )
+
+
+# İki taramayı çalıştırıp tablo olarak yazdırma (isteğe bağlı JSON çıktısı)
+def run_scaling(
+    corner_texts: Sequence[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    sizes: Sequence[int],
+    worker_counts: Sequence[int],
+    workers: int,
+    target_tokens: int = 100_000,
+    output: Optional[str] = None,
+):
+    by_size = bench_scaling_sizes(corner_texts, morphology, sizes, workers)
+    print_scaling(by_size)
+    by_workers = bench_scaling_workers(
+        corner_texts, morphology, worker_counts, target_tokens
+    )
+    print_scaling(by_workers)
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(
+                {"sizes": by_size, "workers": by_workers},
+                file,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+# Soğuk başlangıç aşamaları: ad -> (hazırlık kodu, ölçülen kod). Her aşama ayrı
+# ve taze bir yorumlayıcıda çalışır; hazırlık kodu ölçüme dahil edilmez.
+COLD_START_PHASES = {
+    "import_dependencies": (
+        "",
+        "import zemberek, sklearn.linear_model, sklearn.feature_extraction.text, stop_words",
+    ),
+    "import_module": ("", "import YeniZemberek"),
+    "create_morphology": (
+        "from zemberek import TurkishMorphology",
+        "TurkishMorphology.create_with_defaults()",
+    ),
+    "load_model": ("import YeniZemberek", "YeniZemberek.load_model(MODEL_PATH)"),
+    "first_prediction": (
+        "import YeniZemberek\n"
+        "artifact = YeniZemberek.load_model(MODEL_PATH)\n"
+        "morphology = YeniZemberek.get_morphology()",
+        "YeniZemberek.predict_authors(artifact, [YeniZemberek.target_text], morphology)",
+    ),
+    "total": (
+        "",
+        "import YeniZemberek\n"
+        "YeniZemberek.predict_authors(\n"
+        "    YeniZemberek.load_model(MODEL_PATH),\n"
+        "    [YeniZemberek.target_text],\n"
+        "    YeniZemberek.get_morphology(),\n"
+        ")",
+    ),
+}
+
+_COLD_START_MARKER = "COLD_START_RESULT "
+
+# En yüksek RSS, hazırlık kodundan sonra sıfırlanır; yalnızca ölçülen kodu kapsar
+_COLD_START_TEMPLATE = """
+import json, logging, os, sys, time
+sys.path.insert(0, {directory!r})
+MODEL_PATH = {model_path!r}
+
+def rss_kb():
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+def peak_rss_kb():
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+
+{setup}
+logging.getLogger("zemberek").setLevel(logging.WARNING)
+before = rss_kb()
+with open("/proc/self/clear_refs", "w") as file:
+    file.write("5")
+start = time.perf_counter()
+{measured}
+seconds = time.perf_counter() - start
+print({marker!r} + json.dumps({{
+    "seconds": seconds,
+    "rss_delta_kb": rss_kb() - before,
+    "rss_kb": rss_kb(),
+    "peak_rss_kb": peak_rss_kb(),
+}}))
+"""
+
+
+# -X importtime çıktısını (stderr) ayrıştırma: modül başına kendi ve
+# kümülatif içe aktarma süresi (mikrosaniye)
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, module = line[len("import time:"):].split("|", 2)
+        imports.append(
+            {
+                "module": module.strip(),
+                "depth": (len(module) - len(module.lstrip())) // 2,
+                "self_us": int(own),
+                "cumulative_us": int(cumulative),
+            }
+        )
+    return imports
+
+
+def _run_cold_phase(
+    setup: str, measured: str, model_path: str, importtime: bool = False
+) -> Tuple[Dict[str, Any], str]:
+    directory = os.path.dirname(os.path.abspath(__file__))
+    code = _COLD_START_TEMPLATE.format(
+        directory=directory,
+        model_path=model_path,
+        setup=setup,
+        measured=measured,
+        marker=_COLD_START_MARKER,
+    )
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    completed = subprocess.run(
+        command, cwd=directory, capture_output=True, text=True, check=True
+    )
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(_COLD_START_MARKER):
+            return json.loads(line[len(_COLD_START_MARKER):]), completed.stderr
+    raise RuntimeError(f"Soğuk başlangıç ölçümü sonuç üretmedi: {completed.stderr[-500:]}")
+
+
+# Her aşamayı taze yorumlayıcılarda tekrar çalıştırıp medyan süre ve bellek;
+# import_module aşaması ayrıca -X importtime ile modül dökümü üretir.
+# model_path verilmezse örnek derlemle geçici bir model paketi eğitilir.
+def bench_cold_start(
+    model_path: Optional[str] = None, trials: int = 3, top: int = 25
+) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        if model_path is None:
+            model_path = os.path.join(directory, "model.pkl")
+            lemma_table = {}
+            texts, authors = prepare_data(corner_texts, get_morphology(), lemma_table)
+            save_model(train_model(texts, authors, lemma_table=lemma_table), model_path)
+
+        phases = []
+        for name, (setup, measured) in COLD_START_PHASES.items():
+            runs = [
+                _run_cold_phase(setup, measured, model_path)[0] for _ in range(trials)
+            ]
+            phases.append(
+                {
+                    "phase": name,
+                    **{
+                        key: statistics.median(run[key] for run in runs)
+                        for key in runs[0]
+                    },
+                }
+            )
+
+        _, stderr = _run_cold_phase(*COLD_START_PHASES["import_module"], model_path, True)
+
+    imports = sorted(
+        parse_importtime(stderr), key=lambda row: row["cumulative_us"], reverse=True
+    )
+    return {"phases": phases, "imports": imports[:top]}
+
+
+def print_cold_start(report: Dict[str, Any]):
+    print(f"{'aşama':<22}{'süre (sn)':>11}{'RSS artışı (MB)':>17}{'en yüksek RSS (MB)':>20}")
+    for row in report["phases"]:
+        print(
+            f"{row['phase']:<22}{row['seconds']:>11.3f}"
+            f"{row['rss_delta_kb'] / 1024:>17.1f}{row['peak_rss_kb'] / 1024:>20.1f}"
+        )
+    print(f"{'modül':<48}{'kendi (ms)':>12}{'kümülatif (ms)':>16}")
+    for row in report["imports"]:
+        print(
+            f"{'  ' * row['depth'] + row['module']:<48}"
+            f"{row['self_us'] / 1000:>12.1f}{row['cumulative_us'] / 1000:>16.1f}"
+        )
+
+
+# Taban çizgisi dosyasının biçim sürümü; alanlar değişirse artırılır
+BASELINE_FORMAT = 2
+
+# Ölçüt adı -> büyük değer daha mı iyi
+REGRESSION_METRICS = {
+    "analyze_text.tokens_per_sec": True,
+    "preprocess_text.docs_per_sec": True,
+    "train.seconds": False,
+    "write_word_frequencies.seconds": False,
+    "predict.p50": False,
+    "predict.p99": False,
+    "peak_rss_kb": False,
+}
+
+
+# ru_maxrss süreç ömrü boyunca en yüksek değeri verir; denemeleri ayrı ölçmek için
+# Linux'ta en yüksek RSS (VmHWM) /proc/self/clear_refs ile her denemede sıfırlanır.
+# Sıfırlanamıyorsa (Linux dışı) ölçüt atlanır.
+def _reset_peak_rss() -> bool:
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_kb() -> int:
+    with open("/proc/self/status", "r") as file:
+        for line in file:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    raise RuntimeError("VmHWM bulunamadı")
+
+
+# Gerileme ölçütlerinin tek bir denemesi. Morphology oluşturma dışarıda kalır.
+def _regression_trial(
+    corner_texts: Sequence[Tuple[str, str]], morphology: TurkishMorphology
+) -> Dict[str, float]:
+    raw_texts = [text for text, _ in corner_texts]
+    measure_peak = _reset_peak_rss()
+
+    # Analiz sayısı belirsizlikle büyüdüğünden hız token başına ölçülür
+    start = time.perf_counter()
+    tokens = sum(1 for text in raw_texts for _ in analyze_tokens(text, morphology))
+    analyze_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in raw_texts:
+        preprocess_text(text, morphology)
+    preprocess_time = time.perf_counter() - start
+
+    lemma_table = {}
+    texts, authors = prepare_data(list(corner_texts), morphology, lemma_table)
+    start = time.perf_counter()
+    artifact = train_model(texts, authors, lemma_table=lemma_table)
+    train_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        write_word_frequencies(texts, morphology, os.path.join(directory, "frekans.txt"))
+        frequencies_time = time.perf_counter() - start
+
+    latencies = []
+    for text in raw_texts:
+        start = time.perf_counter()
+        predict_authors(artifact, [text], morphology)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    metrics = {
+        "analyze_text.tokens_per_sec": tokens / analyze_time,
+        "preprocess_text.docs_per_sec": len(raw_texts) / preprocess_time,
+        "train.seconds": train_time,
+        "write_word_frequencies.seconds": frequencies_time,
+        "predict.p50": statistics.median(latencies),
+        "predict.p99": latencies[min(len(latencies) - 1, round(0.99 * (len(latencies) - 1)))],
+    }
+    if measure_peak:
+        metrics["peak_rss_kb"] = _peak_rss_kb()
+    return metrics
+
+
+# Tekrarlanan denemelerin medyanı ve göreli gürültüsü (medyan mutlak sapma / medyan)
+def measure_regression_metrics(
+    corner_texts: Sequence[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    trials: int = 5,
+) -> Dict[str, Dict[str, float]]:
+    # İlk deneme önbellekleri ısıtır ve sayılmaz
+    _regression_trial(corner_texts, morphology)
+    runs = [_regression_trial(corner_texts, morphology) for _ in range(trials)]
+
+    metrics = {}
+    for name in REGRESSION_METRICS:
+        if name not in runs[0]:
+            continue
+        values = [run[name] for run in runs]
+        median = statistics.median(values)
+        deviation = statistics.median(abs(value - median) for value in values)
+        metrics[name] = {
+            "median": median,
+            "noise": deviation / median if median else 0.0,
+        }
+    return metrics
+
+
+def save_baseline(metrics: Dict[str, Dict[str, float]], path: str, trials: int):
+    payload = {
+        "format": BASELINE_FORMAT,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "trials": trials,
+        "metrics": metrics,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("format") != BASELINE_FORMAT:
+        raise ValueError(
+            f"Taban çizgisi biçimi {baseline.get('format')}, beklenen {BASELINE_FORMAT}: {path}"
+        )
+    return baseline
+
+
+# Her ölçüt için izin verilen kötüleşme: sabit tolerans ile iki ölçümün
+# gürültüsünün noise_factor katından büyük olanı
+def compare_to_baseline(
+    metrics: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.10,
+    noise_factor: float = 3.0,
+) -> List[Dict[str, Any]]:
+    rows = []
+    for name, higher_is_better in REGRESSION_METRICS.items():
+        if name not in baseline["metrics"] or name not in metrics:
+            continue
+        reference = baseline["metrics"][name]
+        current = metrics[name]
+        change = (current["median"] - reference["median"]) / reference["median"]
+        worse = -change if higher_is_better else change
+        allowed = max(tolerance, noise_factor * (reference["noise"] + current["noise"]))
+        rows.append(
+            {
+                "metric": name,
+                "baseline": reference["median"],
+                "current": current["median"],
+                "change": change,
+                "allowed": allowed,
+                "regressed": worse > allowed,
+            }
+        )
+    return rows
+
+
+def print_regression_diff(rows: List[Dict[str, Any]]):
+    print(
+        f"{'ölçüt':<32}{'taban':>14}{'şimdi':>14}{'değişim':>10}{'izin':>8}  durum"
+    )
+    for row in rows:
+        status = "GERİLEME" if row["regressed"] else "ok"
+        print(
+            f"{row['metric']:<32}{row['baseline']:>14.4g}{row['current']:>14.4g}"
+            f"{row['change'] * 100:>+9.1f}%{row['allowed'] * 100:>7.1f}%  {status}"
+        )
+
+
+# Ölçüp taban çizgisiyle karşılaştırma; update verilirse ya da dosya yoksa
+# taban çizgisi yazılır. Gerileme varsa False döner.
+def run_regression(
+    baseline_path: str,
+    corner_texts: Sequence[Tuple[str, str]],
+    morphology: TurkishMorphology,
+    trials: int = 5,
+    tolerance: float = 0.10,
+    update: bool = False,
+) -> bool:
+    metrics = measure_regression_metrics(corner_texts, morphology, trials)
+    if update or not os.path.exists(baseline_path):
+        save_baseline(metrics, baseline_path, trials)
+        print(f"Taban çizgisi {baseline_path} dosyasına yazıldı.")
+        return True
+
+    rows = compare_to_baseline(metrics, load_baseline(baseline_path), tolerance)
+    print_regression_diff(rows)
+    regressed = [row["metric"] for row in rows if row["regressed"]]
+    if regressed:
+        print("Performans gerilemesi: " + ", ".join(regressed), file=sys.stderr)
+    return not regressed
+
+
+# Benzerlik indeksi ölçümü için konulu yapay TF-IDF vektörleri: kelimelerin
+# %70'i Zipf dağılımlı ortak sözlükten, %30'u belgenin konusuna özgü
+# kelimelerden gelir; satırlar idf ağırlıklı ve L2 normludur.
+def synthesize_vectors(
+    documents: int,
+    vocabulary: int = 50_000,
+    topics: int = 500,
+    length: int = 300,
+    seed: int = 0,
+) -> sp.csr_matrix:
+    rng = np.random.default_rng(seed)
+    topic_words = vocabulary // (2 * topics)
+    probabilities = 1 / np.arange(1, vocabulary + 1)
+    probabilities /= probabilities.sum()
+    background = int(length * 0.7)
+    rows, columns = [], []
+    for document in range(documents):
+        topic = rng.integers(topics)
+        words = np.concatenate(
+            [
+                rng.choice(vocabulary, size=background, p=probabilities),
+                rng.integers(
+                    topic * topic_words,
+                    (topic + 1) * topic_words,
+                    size=length - background,
+                ),
+            ]
+        )
+        rows.append(np.full(len(words), document))
+        columns.append(words)
+    counts = sp.csr_matrix(
+        (
+            np.ones(documents * length, dtype=np.float32),
+            (np.concatenate(rows), np.concatenate(columns)),
+        ),
+        shape=(documents, vocabulary),
+    )
+    counts.sum_duplicates()
+    document_frequency = np.bincount(counts.indices, minlength=vocabulary)
+    idf = np.log((1 + documents) / (1 + document_frequency)) + 1
+    weighted = sp.csr_matrix(counts @ sp.diags(idf.astype(np.float32)))
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    return sp.csr_matrix(sp.diags(1 / norms) @ weighted, dtype=np.float32)
+
+
+# Benzerlik indeksinde MaxScore sorgusu ile tüm satırlarla iç çarpımın
+# (kaba kuvvet) süre ve sonuç karşılaştırması. İndeks yarısı tek seferde,
+# kalanı parça parça eklenerek (artımlı) kurulur.
+def bench_similarity(
+    sizes: Sequence[int], k: int = 10, queries: int = 50
+) -> List[Dict[str, Any]]:
+    results = []
+    for size in sizes:
+        vectors = synthesize_vectors(size + queries)
+        documents, probes = vectors[:size], vectors[size:]
+        index = SimilarityIndex(vectors.shape[1])
+
+        start = time.perf_counter()
+        index.add(documents[: size // 2], ["-"] * (size // 2))
+        step = max(1, size // 20)
+        for offset in range(size // 2, size, step):
+            end = min(size, offset + step)
+            index.add(documents[offset:end], ["-"] * (end - offset))
+        build_seconds = time.perf_counter() - start
+
+        index_seconds = brute_seconds = 0.0
+        matches = 0
+        for row in range(queries):
+            start = time.perf_counter()
+            found = index.search(probes[row], k)
+            index_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            scores = (documents @ probes[row].T).toarray().ravel()
+            expected = np.sort(scores[np.argpartition(-scores, k - 1)[:k]])[::-1]
+            brute_seconds += time.perf_counter() - start
+            matches += np.allclose(
+                [score for _, score in found], expected, atol=1e-5
+            )
+
+        metrics = index.metrics()
+        results.append(
+            {
+                "documents": size,
+                "segments": metrics["segments"],
+                "build_seconds": build_seconds,
+                "index_ms": index_seconds / queries * 1000,
+                "brute_ms": brute_seconds / queries * 1000,
+                "scanned_ratio": metrics["scanned_ratio"],
+                "exact": matches / queries,
+            }
+        )
+    return results
+
+
+def print_similarity(results: List[Dict[str, Any]]):
+    print(
+        f"{'belge':>10}{'segment':>9}{'kurulum (sn)':>14}{'MaxScore (ms)':>15}"
+        f"{'kaba kuvvet (ms)':>18}{'taranan':>9}{'aynı':>7}"
+    )
+    for row in results:
+        print(
+            f"{row['documents']:>10}{row['segments']:>9}{row['build_seconds']:>14.2f}"
+            f"{row['index_ms']:>15.2f}{row['brute_ms']:>18.2f}"
+            f"{row['scanned_ratio'] * 100:>8.1f}%{row['exact'] * 100:>6.0f}%"
+        )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="YeniZemberek performans ölçümleri")
+    parser.add_argument("--folds", type=int, default=5, help="katman sayısı")
+    parser.add_argument("--jobs", type=int, default=None, help="paralel iş sayısı")
+    parser.add_argument(
+        "--workers", type=int, default=4, help="işçi havuzu ölçümü için işçi sayısı"
+    )
+    add_regression_arguments(parser)
+    add_scaling_arguments(parser)
+    add_cold_start_arguments(parser)
+    add_similarity_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.cold_start:
+        print_cold_start(bench_cold_start(args.model, args.trials))
+        return
+
+    if args.similarity:
+        print_similarity(bench_similarity(args.similarity_sizes))
+        return
+
+    if args.scaling:
+        run_scaling(
+            corner_texts,
+            get_morphology(),
+            args.sizes,
+            args.worker_counts,
+            args.workers,
+            args.scaling_tokens,
+            args.scaling_output,
+        )
+        return
+
+    if args.baseline is not None:
+        passed = run_regression(
+            args.baseline,
+            corner_texts,
+            get_morphology(),
+            trials=args.trials,
+            tolerance=args.tolerance,
+            update=args.update_baseline,
+        )
+        sys.exit(0 if passed else 1)
+
+    print_feature_modes(
+        bench_feature_modes(
+            corner_texts, get_morphology(), n_splits=args.folds, n_jobs=args.jobs
+        )
+    )
+    print_ambiguity(bench_ambiguity(corner_texts, get_morphology()))
+    print_case_folding(bench_case_folding(corner_texts))
+    print_token_filter(bench_token_filter(corner_texts))
+    print_worker_pool(bench_worker_pool(args.workers))
+
+
+if __name__ == "__main__":
+    main()
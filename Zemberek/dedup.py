@@ -0,0 +1,158 @@
+import zlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+import numpy as np
+
+
+T = TypeVar("T")
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+
+# LSH bant/satır sayısı: num_perm'i bölen r değerlerinden eşiği (1/b)^(1/r)
+# istenen benzerliğin altında kalan en yüksek olanı. Adaylar imzayla ayrıca
+# doğrulandığından kaçırılan kopyalar yanlış adaylardan daha pahalıdır.
+def _lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows == 0:
+            bands = num_perm // rows
+            if (1 / bands) ** (1 / rows) <= threshold:
+                best = (bands, rows)
+    return best
+
+
+# MinHash/LSH ile yakın kopya belge süzgeci. Belgeler kelime k-gramlarına
+# (shingle) ayrılır; her belge için yalnızca num_perm uzunluğunda imza ve bant
+# anahtarları saklanır, metinler tutulmaz. Akış halinde (tek geçişte) çalışır.
+# LSH adayı olan belgelerde tahmini Jaccard benzerliği threshold'u geçerse
+# belge kopya sayılır.
+# Saklanan her belge varsayılan ayarlarla yaklaşık 2 kB tutar; bellek belge
+# sayısıyla doğrusal büyür. max_documents verilirse yalnızca en son saklanan o
+# kadar belge tutulur (en eskisi atılır); daha eski kopyalar artık yakalanmaz.
+class NearDuplicateFilter:
+    def __init__(
+        self,
+        shingle_size: int = 5,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        seed: int = 1,
+        max_documents: Optional[int] = None,
+    ):
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.max_documents = max_documents
+        self.bands, self.rows = _lsh_bands(num_perm, threshold)
+        rng = np.random.default_rng(seed)
+        # Çarp-kaydır karma ailesi: h(x) = ((a * x + b) mod 2^64) >> 32, a tek
+        self._a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+        self._buckets: List[Dict[bytes, int]] = [{} for _ in range(self.bands)]
+        # Sıra numarası -> imza; ekleme sırası en eskiyi atmak için kullanılır
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._next = 0
+        self.evicted = 0
+        self.documents = 0
+        self.duplicates = 0
+        self.words = 0
+        self.duplicate_words = 0
+
+    def _shingles(self, words: List[str]) -> np.ndarray:
+        size = self.shingle_size
+        grams = {
+            " ".join(words[i : i + size]) for i in range(max(1, len(words) - size + 1))
+        }
+        return np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) for gram in grams),
+            dtype=np.uint64,
+            count=len(grams),
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = self._shingles(text.casefold().split())
+        with np.errstate(over="ignore"):
+            values = (np.outer(hashes, self._a) + self._b) >> np.uint64(32)
+        return (values & _MASK32).min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    # En eski belgeyi atma; kovada yerini daha yeni bir belge almışsa dokunulmaz
+    def _evict_oldest(self):
+        index = next(iter(self._signatures))
+        signature = self._signatures.pop(index)
+        for band, key in enumerate(self._band_keys(signature)):
+            if self._buckets[band].get(key) == index:
+                del self._buckets[band][key]
+        self.evicted += 1
+
+    # Belge daha önce görülmüş bir belgenin yakın kopyası mı; değilse kaydedilir
+    def is_duplicate(self, text: Optional[str]) -> bool:
+        text = text or ""
+        word_count = len(text.split())
+        self.documents += 1
+        self.words += word_count
+        signature = self.signature(text)
+        keys = self._band_keys(signature)
+
+        candidates = {
+            self._buckets[band][key]
+            for band, key in enumerate(keys)
+            if key in self._buckets[band]
+        }
+        for candidate in candidates:
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity >= self.threshold:
+                self.duplicates += 1
+                self.duplicate_words += word_count
+                return True
+
+        # Kovada aynı anahtarlı en yeni belge tutulur; atılan belgenin yerini alır
+        index = self._next
+        self._next += 1
+        self._signatures[index] = signature
+        for band, key in enumerate(keys):
+            self._buckets[band][key] = index
+        if self.max_documents is not None and len(self._signatures) > self.max_documents:
+            self._evict_oldest()
+        return False
+
+    # Akıştaki kopya olmayan öğeleri sırayla döndürme
+    def filter(
+        self,
+        items: Iterable[T],
+        text: Callable[[T], Optional[str]] = lambda item: item,
+    ) -> Iterator[T]:
+        for item in items:
+            if not self.is_duplicate(text(item)):
+                yield item
+
+    def report(self) -> Dict[str, Any]:
+        documents, words = max(self.documents, 1), max(self.words, 1)
+        return {
+            "documents": self.documents,
+            "duplicates": self.duplicates,
+            "duplicate_rate": self.duplicates / documents,
+            "words": self.words,
+            "removed_words": self.duplicate_words,
+            "removed_word_rate": self.duplicate_words / words,
+            "shingle_size": self.shingle_size,
+            "threshold": self.threshold,
+            "bands": self.bands,
+            "rows": self.rows,
+            "stored": len(self._signatures),
+            "evicted": self.evicted,
+        }
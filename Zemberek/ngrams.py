@@ -0,0 +1,121 @@
+import math
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+
+def _xlogx(value: float) -> float:
+    return value * math.log(value) if value > 0 else 0.0
+
+
+# Dunning log-olabilirlik oranı (G²), 2x2 olasılık tablosundan
+def log_likelihood(k11: float, k12: float, k21: float, k22: float) -> float:
+    total = k11 + k12 + k21 + k22
+    rows = _xlogx(k11 + k12) + _xlogx(k21 + k22)
+    columns = _xlogx(k11 + k21) + _xlogx(k12 + k22)
+    cells = _xlogx(k11) + _xlogx(k12) + _xlogx(k21) + _xlogx(k22)
+    return max(0.0, 2 * (cells - rows - columns + _xlogx(total)))
+
+
+# Kök n-gramlarını akış halinde sayma. Tekil kök sayıları tam tutulur; her
+# n-gram derecesi için en fazla max_ngrams kayıt tutulur. Sınır aşıldığında
+# kayıtların en az yarısı kalacak şekilde en düşük sayılı n-gramlar atılır.
+# Böylece büyük arşivlerde bellek sınırlı kalır. Bir n-gram birden çok kez
+# atılabilir; yeniden görülen n-gramların sayıları en fazla o ana kadarki
+# kesme değerlerinin toplamı (max_undercount) kadar eksik kalır.
+class NgramCounter:
+    def __init__(self, orders: Sequence[int] = (2, 3), max_ngrams: int = 1_000_000):
+        self.orders = tuple(orders)
+        self.max_ngrams = max_ngrams
+        self.unigrams: Counter = Counter()
+        self.ngrams: Dict[int, Counter] = {n: Counter() for n in self.orders}
+        self.totals: Dict[int, int] = {n: 0 for n in self.orders}
+        self.cutoffs: Dict[int, int] = {n: 0 for n in self.orders}
+        self.pruned: Dict[int, int] = {n: 0 for n in self.orders}
+        self.undercount: Dict[int, int] = {n: 0 for n in self.orders}
+
+    # Bir cümlenin (ya da noktalama ile ayrılmış bir parçanın) kökleri;
+    # n-gramlar parçalar arasında kurulmaz
+    def update(self, lemmas: Sequence[str]):
+        self.unigrams.update(lemmas)
+        for n in self.orders:
+            if len(lemmas) < n:
+                continue
+            counts = self.ngrams[n]
+            grams = [tuple(lemmas[i : i + n]) for i in range(len(lemmas) - n + 1)]
+            counts.update(grams)
+            self.totals[n] += len(grams)
+            if len(counts) > self.max_ngrams:
+                self._prune(n)
+
+    def _prune(self, n: int):
+        counts = self.ngrams[n]
+        remaining = len(counts)
+        cutoff = 0
+        for count, frequency in sorted(Counter(counts.values()).items()):
+            if remaining <= self.max_ngrams // 2:
+                break
+            remaining -= frequency
+            cutoff = count
+        rare = [gram for gram, count in counts.items() if count <= cutoff]
+        for gram in rare:
+            del counts[gram]
+        self.pruned[n] += len(rare)
+        self.cutoffs[n] = max(self.cutoffs[n], cutoff)
+        self.undercount[n] += cutoff
+
+    # n-gramların sayı, PMI (log2) ve log-olabilirlik puanları. G², önek
+    # (ilk n-1 kök) ile son kök arasındaki 2x2 tablodan hesaplanır; tablonun
+    # tüm hücreleri aynı birimdedir: kenar sayıları n-gram konumlarında sayılır
+    # ve toplam n-gram sayısına bölünür. Budanmış n-gramlar kenar sayılarına
+    # katılmadığından kenarlar en fazla max_undercount kadar eksik kalabilir.
+    def collocations(
+        self, n: int, min_count: int = 2
+    ) -> List[Tuple[Tuple[str, ...], int, float, float]]:
+        unigram_total = sum(self.unigrams.values())
+        total = self.totals[n]
+        prefixes: Counter = Counter()
+        suffixes: Counter = Counter()
+        for gram, count in self.ngrams[n].items():
+            prefixes[gram[:-1]] += count
+            suffixes[gram[-1]] += count
+        rows = []
+        for gram, count in self.ngrams[n].items():
+            if count < min_count:
+                continue
+            expected = 1.0
+            for lemma in gram:
+                expected *= self.unigrams[lemma] / unigram_total
+            pmi = math.log2((count / total) / expected)
+
+            first = prefixes[gram[:-1]]
+            last = suffixes[gram[-1]]
+            llr = log_likelihood(
+                count,
+                max(first - count, 0),
+                max(last - count, 0),
+                max(total - first - last + count, 0),
+            )
+            rows.append((gram, count, pmi, llr))
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            f"{n}gram": {
+                "total": self.totals[n],
+                "distinct": len(self.ngrams[n]),
+                "pruned": self.pruned[n],
+                "cutoff": self.cutoffs[n],
+                "max_undercount": self.undercount[n],
+            }
+            for n in self.orders
+        }
+
+
+# Frekans tablosuyla aynı sekmeyle ayrılmış biçimde yazma: n-gram, sayı, PMI, G²
+def write_collocations(
+    rows: Iterable[Tuple[Tuple[str, ...], int, float, float]], output_file: str
+):
+    with open(output_file, "w", encoding="utf-8") as file:
+        for gram, count, pmi, llr in rows:
+            file.write(f"{' '.join(gram)}\t{count}\t{pmi:.4f}\t{llr:.4f}\n")
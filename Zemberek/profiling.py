@@ -0,0 +1,499 @@
+import cProfile
+import json
+import math
+import os
+import pstats
+import random
+import signal
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional
+
+
+# Kapalıyken her span çağrısı aynı boş bağlam yöneticisini döndürür
+_DISABLED_SPAN = nullcontext()
+
+
+# Yüzdelikler için aşama başına tutulan en fazla süre örneği
+RESERVOIR_SIZE = 1024
+
+_reservoir_random = random.Random(0)
+
+
+# Bir aşamanın süre özeti: çağrı sayısı, toplam, en küçük ve en büyük süre ile
+# yüzdelikler için sabit boyutlu rastgele örneklem (reservoir sampling).
+# Bellek aşamanın kaç kez çalıştığından bağımsızdır; RESERVOIR_SIZE çağrıya
+# kadar yüzdelikler kesindir.
+class _StageStats:
+    __slots__ = ("count", "total", "min", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.samples: List[float] = []
+
+    def add(self, duration: float):
+        self.count += 1
+        self.total += duration
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+        if len(self.samples) < RESERVOIR_SIZE:
+            self.samples.append(duration)
+        else:
+            slot = _reservoir_random.randrange(self.count)
+            if slot < RESERVOIR_SIZE:
+                self.samples[slot] = duration
+
+    # İki özeti birleştirme; örneklemler görülen çağrı sayılarıyla orantılı alınır
+    def merge(self, other: "_StageStats"):
+        samples = self.samples + other.samples
+        if len(samples) > RESERVOIR_SIZE:
+            share = round(RESERVOIR_SIZE * self.count / (self.count + other.count))
+            share = min(share, len(self.samples))
+            rest = min(RESERVOIR_SIZE - share, len(other.samples))
+            samples = _reservoir_random.sample(
+                self.samples, share
+            ) + _reservoir_random.sample(other.samples, rest)
+        self.samples = samples
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+class _Span:
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats: _StageStats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stats.add(time.perf_counter() - self.start)
+        return False
+
+
+# Profil alınan aşamanın bağlamı: profilleyiciyi açar, ölçüm açıksa süreyi de kaydeder
+class _ProfiledSpan:
+    __slots__ = ("profiler", "stats", "start")
+
+    def __init__(self, profiler, stats: Optional[_StageStats]):
+        self.profiler = profiler
+        self.stats = stats
+
+    def __enter__(self):
+        self.profiler.start()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.stats is not None:
+            self.stats.add(time.perf_counter() - self.start)
+        self.profiler.stop()
+        return False
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+# Adlandırılmış aşamaların sürelerini toplayan hafif ölçüm katmanı.
+# Aşama başına çağrı sayısı, toplam süre ve yüzdelikler raporlanır.
+# İşçi süreçlerinin ölçümleri drain() ile alınıp ebeveynde merge() ile katılır;
+# işçilerdeki süreler toplanır, yani paralel aşamalarda toplam CPU süresidir.
+class StageTimer:
+    def __init__(self):
+        self.enabled = False
+        self._stages: Dict[str, _StageStats] = defaultdict(_StageStats)
+        self._profiled: Dict[str, Any] = {}
+
+    def span(self, name: str):
+        if name in self._profiled:
+            return _ProfiledSpan(
+                self._profiled[name], self._stages[name] if self.enabled else None
+            )
+        if not self.enabled:
+            return _DISABLED_SPAN
+        return _Span(self._stages[name])
+
+    # Adı verilen aşamanın her çalışmasında profilleyiciyi açma
+    def profile(self, name: str, profiler):
+        self._profiled[name] = profiler
+
+    def reset(self):
+        self._stages.clear()
+
+    # Ölçümleri alıp sıfırlama (işçiden ebeveyne gönderim için)
+    def drain(self) -> Dict[str, _StageStats]:
+        stages = dict(self._stages)
+        self._stages.clear()
+        return stages
+
+    def merge(self, stages: Dict[str, _StageStats]):
+        for name, stats in stages.items():
+            self._stages[name].merge(stats)
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        stages = {}
+        for name, stats in sorted(self._stages.items()):
+            if not stats.count:
+                continue
+            ordered = sorted(stats.samples)
+            stages[name] = {
+                "count": stats.count,
+                "total": stats.total,
+                "mean": stats.total / stats.count,
+                "min": stats.min,
+                "p50": _percentile(ordered, 0.50),
+                "p90": _percentile(ordered, 0.90),
+                "p99": _percentile(ordered, 0.99),
+                "max": stats.max,
+            }
+        return stages
+
+    def dump(self, path: str, extra: Dict[str, Any] = None):
+        payload = {"stages": self.report(), **(extra or {})}
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(payload, file, ensure_ascii=False, indent=2)
+
+
+# Süreç genelinde paylaşılan ölçüm nesnesi
+timer = StageTimer()
+span = timer.span
+
+
+# tracemalloc anlık görüntüleriyle aşama sınırlarında bellek ölçümü (isteğe bağlı).
+# Her aşama için en yüksek bellek (önceki sınırdan bu yana), kalıcı bellek,
+# önceki sınıra göre fark ve en çok bellek ayıran satırlar raporlanır.
+class MemoryProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.top = 10
+        self._stages: List[Dict[str, Any]] = []
+        self._previous: Optional[tracemalloc.Snapshot] = None
+
+    def start(self, top: int = 10, frames: int = 1):
+        self.top = top
+        self._stages = []
+        tracemalloc.start(frames)
+        self._previous = self._snapshot()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        self._previous = None
+        tracemalloc.stop()
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            ]
+        )
+
+    def checkpoint(self, stage: str):
+        if not self.enabled:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = self._snapshot()
+        differences = snapshot.compare_to(self._previous, "lineno")
+        self._stages.append(
+            {
+                "stage": stage,
+                "retained": current,
+                "peak": peak,
+                "delta": sum(stat.size_diff for stat in differences),
+                "top_sites": [
+                    {
+                        "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                        "size": stat.size,
+                        "size_diff": stat.size_diff,
+                        "count": stat.count,
+                    }
+                    for stat in differences[: self.top]
+                ],
+            }
+        )
+        self._previous = snapshot
+        tracemalloc.reset_peak()
+
+    def report(self) -> List[Dict[str, Any]]:
+        return list(self._stages)
+
+    def dump(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"memory": self.report()}, file, ensure_ascii=False, indent=2)
+
+
+# Süreç genelinde paylaşılan bellek ölçüm nesnesi
+memory = MemoryProfiler()
+checkpoint = memory.checkpoint
+
+
+# Biçimbirimsel belirsizlik istatistikleri: analyze_text her token için tüm
+# analizleri ürettiğinden sonraki işler belirsizlikle birlikte büyür.
+# Token başına analiz dağılımı, en belirsiz yüzey biçimleri, bilinmeyen kelime
+# oranı ve belge/derlem başına analiz-token oranı toplanır.
+# Derlem üzerindeki her geçiş (ön işleme, frekans, n-gram) ayrı raporlanır;
+# işçi süreçlerinin sayımları drain() ile alınıp ebeveynde merge() ile katılır.
+class AmbiguityStats:
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self._passes: Dict[str, Dict[str, Any]] = {}
+        self.begin_pass("analyze")
+
+    # Yeni geçiş; aynı adlı geçiş yeniden başlarsa önceki sayımları silinir
+    def begin_pass(self, name: str):
+        self._name = name
+        self._pass = self._passes[name] = {
+            "distribution": Counter(),
+            "surface_analyses": {},
+            "surface_counts": Counter(),
+            "documents": [],
+        }
+        self._current = {"tokens": 0, "analyses": 0, "unknown": 0}
+        self._owner: Optional[int] = None
+
+    def record(self, surface: str, analyses: int, unknown: bool):
+        self._pass["distribution"][analyses] += 1
+        self._pass["surface_analyses"][surface] = analyses
+        self._pass["surface_counts"][surface] += 1
+        current = self._current
+        current["tokens"] += 1
+        current["analyses"] += analyses
+        current["unknown"] += unknown
+
+    # Belge sınırı; belge içinde hiç analiz yapılmadıysa kayıt açılmaz.
+    # İşçiler cümle başına empty=True ile çağırır; kayıtlar cümlelerle hizalı kalır.
+    def end_document(self, empty: bool = False):
+        if self._current["tokens"] or empty:
+            self._pass["documents"].append(self._current)
+            self._current = {"tokens": 0, "analyses": 0, "unknown": 0}
+        self._owner = None
+
+    # Blok içindeki kayıtları geçici olarak başka bir geçişe yazma; aynı akışta
+    # iki iş yapan geçişlerde (frekans ve n-gram) sayımlar birbirine karışmaz.
+    # Geçiş yoksa açılır; blok sonunda önceki geçiş ve yarım belgesi geri gelir.
+    @contextmanager
+    def switched(self, name: str):
+        saved = (self._name, self._pass, self._current, self._owner)
+        if name in self._passes:
+            self._name, self._pass = name, self._passes[name]
+            self._current = {"tokens": 0, "analyses": 0, "unknown": 0}
+            self._owner = None
+        else:
+            self.begin_pass(name)
+        try:
+            yield
+        finally:
+            self.end_document()
+            self._name, self._pass, self._current, self._owner = saved
+
+    # Geçerli geçişin sayımlarını alıp sıfırlama (işçiden ebeveyne gönderim için)
+    def drain(self) -> Dict[str, Any]:
+        self.end_document()
+        state = self._pass
+        self.begin_pass(self._name)
+        return state
+
+    # drain() çıktısını geçerli geçişe katma. owners verilirse kayıtlar cümledir
+    # ve aynı belgeye ait ardışık cümleler (gruplar arasında da) birleştirilir.
+    def merge(self, state: Dict[str, Any], owners: Optional[List[int]] = None):
+        self._pass["distribution"].update(state["distribution"])
+        self._pass["surface_analyses"].update(state["surface_analyses"])
+        self._pass["surface_counts"].update(state["surface_counts"])
+        if owners is None:
+            self.end_document()
+            self._pass["documents"].extend(state["documents"])
+            return
+        for owner, sentence in zip(owners, state["documents"]):
+            if owner != self._owner:
+                self.end_document()
+                self._owner = owner
+            for key, value in sentence.items():
+                self._current[key] += value
+
+    @staticmethod
+    def _summary(tokens: int, analyses: int, unknown: int) -> Dict[str, float]:
+        return {
+            "tokens": tokens,
+            "analyses": analyses,
+            "analyses_per_token": analyses / tokens if tokens else 0.0,
+            "unknown": unknown,
+            "unknown_rate": unknown / tokens if tokens else 0.0,
+        }
+
+    def _pass_report(self, state: Dict[str, Any], top: int) -> Dict[str, Any]:
+        documents = [self._summary(**document) for document in state["documents"]]
+        most_ambiguous = sorted(
+            state["surface_analyses"].items(), key=lambda item: (-item[1], item[0])
+        )[:top]
+        return {
+            "corpus": {
+                "documents": len(documents),
+                **self._summary(
+                    sum(document["tokens"] for document in state["documents"]),
+                    sum(document["analyses"] for document in state["documents"]),
+                    sum(document["unknown"] for document in state["documents"]),
+                ),
+            },
+            "distribution": {
+                str(analyses): count
+                for analyses, count in sorted(state["distribution"].items())
+            },
+            "most_ambiguous": [
+                {
+                    "surface": surface,
+                    "analyses": analyses,
+                    "occurrences": state["surface_counts"][surface],
+                }
+                for surface, analyses in most_ambiguous
+            ],
+            "documents": documents,
+        }
+
+    # Geçiş adı -> rapor; hiç analiz yapılmamış geçişler atlanır
+    def report(self, top: int = 20) -> Dict[str, Any]:
+        self.end_document()
+        return {
+            name: self._pass_report(state, top)
+            for name, state in self._passes.items()
+            if state["documents"]
+        }
+
+    def dump(self, path: str, top: int = 20):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"ambiguity": self.report(top)}, file, ensure_ascii=False, indent=2)
+
+
+# Süreç genelinde paylaşılan belirsizlik istatistikleri
+ambiguity = AmbiguityStats()
+
+
+# Yığın çerçevesini flamegraph etiketine çevirme: işlev (dosya:satır)
+def _frame_label(filename: str, lineno: int, name: str) -> str:
+    return f"{name} ({os.path.basename(filename)}:{lineno})".replace(";", ",")
+
+
+# cProfile ile deterministik profil. İç içe aşamalarda yalnızca en dıştaki açar/kapatır.
+# .pstats dosyasının yanında katlanmış yığınlar (flamegraph.pl / speedscope
+# girdisi) yazılır. pstats yol bilgisi tutmadığından her çağıran-çağrılan kenarı
+# iki çerçeveli tek bir yığındır; tam yığınlar için örnekleme profili kullanılır.
+class CProfileProfiler:
+    def __init__(self):
+        self._profile = cProfile.Profile()
+        self._depth = 0
+
+    def start(self):
+        if self._depth == 0:
+            self._profile.enable()
+        self._depth += 1
+
+    def stop(self):
+        self._depth -= 1
+        if self._depth == 0:
+            self._profile.disable()
+
+    def close(self):
+        pass
+
+    # Değer, çağrılanın o çağırandan gelen çağrılarda kendi içinde geçirdiği
+    # süredir (mikrosaniye); toplamı profilin toplam süresine eşittir
+    def collapsed(self) -> Counter:
+        self._profile.create_stats()
+        stacks: Counter = Counter()
+        for function, (_, _, own_time, _, callers) in self._profile.stats.items():
+            label = _frame_label(*function)
+            if not callers:
+                stacks[label] += int(own_time * 1e6)
+            for caller, (_, _, edge_own_time, _) in callers.items():
+                stacks[f"{_frame_label(*caller)};{label}"] += int(edge_own_time * 1e6)
+        return +stacks
+
+    def write(self, prefix: str) -> List[str]:
+        self._profile.dump_stats(prefix + ".pstats")
+        _write_collapsed(self.collapsed(), prefix + ".collapsed")
+        return [prefix + ".pstats", prefix + ".collapsed"]
+
+
+# SIGPROF zamanlayıcısıyla örnekleme profili; yalnızca ana iş parçacığında çalışır.
+# Zamanlayıcı ilk girişte bir kez kurulur ve close() ile kaldırılır; aşama
+# örnekleme aralığından kısa olsa da (tek kelime analizi gibi) örnek kaçmaz.
+# Yalnızca aşamanın içindeyken düşen örnekler katlanıp sayılır.
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._samples: Counter = Counter()
+        self._depth = 0
+        self._armed = False
+        self._previous_handler = None
+
+    def _sample(self, signum, frame):
+        if self._depth == 0:
+            return
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        self._samples[";".join(reversed(stack))] += 1
+
+    def start(self):
+        if not self._armed:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+            self._armed = True
+        self._depth += 1
+
+    def stop(self):
+        self._depth -= 1
+
+    def close(self):
+        if self._armed:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+            self._armed = False
+
+    def collapsed(self) -> Counter:
+        return Counter(self._samples)
+
+    def write(self, prefix: str) -> List[str]:
+        self.close()
+        _write_collapsed(self.collapsed(), prefix + ".collapsed")
+        return [prefix + ".collapsed"]
+
+
+def _write_collapsed(stacks: Counter, path: str):
+    with open(path, "w", encoding="utf-8") as file:
+        for stack, value in sorted(stacks.items()):
+            file.write(f"{stack} {value}\n")
+
+
+PROFILE_MODES = ("cprofile", "sample")
+
+
+def make_profiler(mode: str, interval: float = 0.005):
+    if mode == "cprofile":
+        return CProfileProfiler()
+    if mode == "sample":
+        return SamplingProfiler(interval)
+    raise ValueError(f"Bilinmeyen profil modu: {mode}")
+
+
+# pstats dosyasının en pahalı işlevlerini yazdırma
+def print_pstats(path: str, limit: int = 20, sort: str = "cumulative", file=None):
+    pstats.Stats(path, stream=file).sort_stats(sort).print_stats(limit)
@@ -0,0 +1,311 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from zemberek import TurkishMorphology
+
+from YeniZemberek import (
+    PredictionCache,
+    analyze_sentences,
+    analyze_text,
+    get_morphology,
+    load_compact_model,
+    load_model,
+    predict_authors,
+    preprocess_text,
+)
+
+
+# Sunucu model paketi olmadan başlatıldığında tahmin isteklerine dönen hata
+class ModelUnavailable(RuntimeError):
+    pass
+
+
+# Eşzamanlı istekleri gecikme bütçesi içinde mikro gruplara toplayan kuyruk.
+# Tüm işler tek bir iş parçacığında çalışır; morphology nesnesi paylaşılmaz.
+class MicroBatcher:
+    def __init__(
+        self,
+        handler: Callable[[List[Tuple[str, List[str]]]], List[Any]],
+        max_batch: int = 32,
+        max_latency: float = 0.005,
+    ):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self._queue: "queue.Queue[Tuple[str, List[str], Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, kind: str, texts: List[str]) -> Future:
+        future: Future = Future()
+        self._queue.put((kind, texts, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                results = self.handler([(kind, texts) for kind, texts, _ in batch])
+            except Exception as error:
+                for _, _, future in batch:
+                    future.set_exception(error)
+                continue
+            # İşleyicinin istek başına döndürdüğü hatalar yalnızca o isteğe gider
+            for (_, _, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+# Sıcak tutulan morphology ve model paketi üzerinden istek gruplarını işleme.
+# disambiguate=True ise /analyze ve /frequencies metni cümle cümle belirsizlik
+# gidericiden geçirir ve her kelime için yalnızca en iyi analizi döndürür.
+class AuthorService:
+    def __init__(
+        self,
+        morphology: TurkishMorphology,
+        artifact: Optional[Dict[str, Any]] = None,
+        cache: Optional[PredictionCache] = None,
+        disambiguate: bool = False,
+    ):
+        self.morphology = morphology
+        self.artifact = artifact
+        self.cache = cache
+        self.disambiguate = disambiguate
+
+    def _analyze(self, text: str) -> List[Tuple[str, str]]:
+        if self.disambiguate:
+            return analyze_sentences(text, self.morphology, disambiguate=True)
+        return analyze_text(text, self.morphology)
+
+    def process_batch(self, requests: List[Tuple[str, List[str]]]) -> List[Any]:
+        results: List[Any] = [None] * len(requests)
+
+        # Tahmin isteklerindeki tüm metinler tek bir transform/predict çağrısına girer
+        predict_requests = [i for i, (kind, _) in enumerate(requests) if kind == "predict"]
+        if predict_requests:
+            if self.artifact is None:
+                for i in predict_requests:
+                    results[i] = ModelUnavailable("Sunucu bir model paketi olmadan başlatıldı")
+            else:
+                texts = [text for i in predict_requests for text in requests[i][1]]
+                try:
+                    authors = predict_authors(
+                        self.artifact, texts, self.morphology, cache=self.cache
+                    )
+                except Exception:
+                    # Toplu çağrı başarısız olursa hatalı istek ayrı ayrı denenerek bulunur
+                    for i in predict_requests:
+                        results[i] = self._process_one(*requests[i])
+                else:
+                    offset = 0
+                    for i in predict_requests:
+                        size = len(requests[i][1])
+                        results[i] = authors[offset : offset + size]
+                        offset += size
+
+        for i, (kind, texts) in enumerate(requests):
+            if kind != "predict":
+                results[i] = self._process_one(kind, texts)
+        return results
+
+    # Tek bir isteği işler; hata gruptaki diğer isteklere yayılmadan sonuç olarak döner
+    def _process_one(self, kind: str, texts: List[str]) -> Any:
+        try:
+            if kind == "predict":
+                return predict_authors(self.artifact, texts, self.morphology, cache=self.cache)
+            if kind == "analyze":
+                return [self._analyze(text) for text in texts]
+            if kind == "preprocess":
+                lemma_table = self.artifact.get("lemma_table") if self.artifact else None
+                return [preprocess_text(text, self.morphology, lemma_table) for text in texts]
+            if kind == "frequencies":
+                token_counter = Counter()
+                for text in texts:
+                    token_counter.update(self._analyze(text))
+                return [
+                    {"lemma": lemma, "pos": pos, "frequency": frequency}
+                    for (lemma, pos), frequency in token_counter.most_common()
+                ]
+            return ValueError(f"Bilinmeyen istek türü: {kind}")
+        except Exception as error:
+            return error
+
+
+# Eşzamanlı bağlantı patlamalarında bağlantı reddedilmemesi için geniş kuyruk
+class AuthorHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address,
+        service: AuthorService,
+        batcher: MicroBatcher,
+        verbose: bool = False,
+    ):
+        super().__init__(address, AuthorRequestHandler)
+        self.service = service
+        self.batcher = batcher
+        self.verbose = verbose
+
+
+class AuthorRequestHandler(BaseHTTPRequestHandler):
+    endpoints = ("/analyze", "/preprocess", "/predict", "/frequencies")
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/metrics":
+            cache = self.server.service.cache
+            self._send_json(200, {"cache": cache.metrics() if cache else None})
+        else:
+            self._send_json(404, {"error": f"Bilinmeyen adres: {self.path}"})
+
+    def do_POST(self):
+        if self.path not in self.endpoints:
+            self._send_json(404, {"error": f"Bilinmeyen adres: {self.path}"})
+            return
+
+        # Gövde {"text": "..."} ya da {"texts": ["...", ...]} biçiminde olmalı
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            single = "text" in body
+            if not single and not isinstance(body["texts"], list):
+                raise TypeError("'texts' bir liste olmalı")
+            texts = [body["text"]] if single else body["texts"]
+            if not all(isinstance(text, str) for text in texts):
+                raise TypeError("Metinler dize olmalı")
+        except (ValueError, KeyError, TypeError) as error:
+            self._send_json(400, {"error": f"Geçersiz istek: {error}"})
+            return
+
+        # İsteğin kendi hatası 500, model paketinin yokluğu 503 olarak döner
+        try:
+            result = self.server.batcher.submit(self.path[1:], texts).result()
+        except ModelUnavailable as error:
+            self._send_json(503, {"error": str(error)})
+            return
+        except Exception as error:
+            self._send_json(500, {"error": f"İşleme hatası: {error}"})
+            return
+
+        if self.path == "/frequencies":
+            self._send_json(200, {"frequencies": result})
+        else:
+            self._send_json(200, {"result": result[0] if single else result})
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+# Morphology ve model paketi başlangıçta bir kez yüklenir
+def create_server(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    model_path: Optional[str] = None,
+    max_batch: int = 32,
+    max_latency: float = 0.005,
+    verbose: bool = False,
+    cache_dir: Optional[str] = None,
+    cache_size: int = 10000,
+    cache_ttl: Optional[float] = None,
+    compact_model_path: Optional[str] = None,
+    disambiguate: bool = False,
+) -> AuthorHTTPServer:
+    artifact = None
+    if compact_model_path:
+        artifact = load_compact_model(compact_model_path)
+    elif model_path:
+        artifact = load_model(model_path)
+    service = AuthorService(
+        get_morphology(cache_dir),
+        artifact,
+        PredictionCache(cache_size, cache_ttl) if cache_size > 0 else None,
+        disambiguate,
+    )
+    batcher = MicroBatcher(service.process_batch, max_batch, max_latency)
+    return AuthorHTTPServer((host, port), service, batcher, verbose)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Yazar tahmini HTTP servisi")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    model = parser.add_mutually_exclusive_group()
+    model.add_argument("--model", default=None, help="model paketi (save_model çıktısı)")
+    model.add_argument(
+        "--compact-model", default=None, help="küçük model paketi (export çıktısı)"
+    )
+    parser.add_argument("--max-batch", type=int, default=32, help="en büyük grup boyutu")
+    parser.add_argument(
+        "--max-latency-ms", type=float, default=5.0, help="grup toplama gecikme bütçesi"
+    )
+    parser.add_argument("--verbose", action="store_true", help="istekleri günlüğe yaz")
+    parser.add_argument(
+        "--cache-dir", default=None, help="morphology anlık görüntüsü dizini"
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=10000, help="tahmin önbelleği (0: kapalı)"
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=None, help="önbellek kaydı ömrü (sn)"
+    )
+    parser.add_argument(
+        "--disambiguate",
+        action="store_true",
+        help="/analyze ve /frequencies kelime başına yalnızca en iyi analizi döndürür",
+    )
+    args = parser.parse_args(argv)
+
+    server = create_server(
+        args.host,
+        args.port,
+        args.model,
+        args.max_batch,
+        args.max_latency_ms / 1000,
+        args.verbose,
+        args.cache_dir,
+        args.cache_size,
+        args.cache_ttl,
+        args.compact_model,
+        args.disambiguate,
+    )
+    print(f"Servis http://{args.host}:{args.port} adresinde dinliyor.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
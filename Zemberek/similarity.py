@@ -0,0 +1,199 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import scipy.sparse as sp
+
+
+# Terim başına Python işlem maliyetinin kabaca kaç posting taramasına denk
+# geldiği; sorgu terimlerinin listeleri bundan kısaysa segment doğrudan taranır
+_TERM_COST_POSTINGS = 10_000
+
+# Eşiğin ilk tahmini için taranan en yüksek üst sınırlı terim sayısı
+_SEED_TERMS = 8
+
+
+def _kth_largest(values: np.ndarray, k: int) -> float:
+    return float(np.partition(values, len(values) - k)[len(values) - k])
+
+
+# Kısmi skorların k. büyüğü; kısmi skorlar yalnızca artar, dolayısıyla bu
+# değer son k. skor için geçerli bir alt sınırdır
+def _threshold(scores: np.ndarray, k: int) -> float:
+    values = scores[scores > 0]
+    return _kth_largest(values, k) if len(values) >= k else 0.0
+
+
+# İndeksin bir parçası: terim (sütun) başına posting listeleri. CSC matrisinde
+# her sütunun satır indeksleri (segment içi belge numaraları) artan sıradadır;
+# max_weights, MaxScore üst sınırları için terim başına en büyük ağırlıktır.
+class _Segment:
+    __slots__ = ("offset", "postings", "max_weights")
+
+    def __init__(self, offset: int, rows: sp.spmatrix):
+        self.offset = offset
+        self.postings = sp.csc_matrix(rows, dtype=np.float32)
+        self.postings.sort_indices()
+        self.max_weights = self.postings.max(axis=0).toarray().ravel()
+
+    @property
+    def size(self) -> int:
+        return self.postings.shape[0]
+
+
+# Seyrek ters indeks üzerinde kosinüs benzerliğiyle en yakın k belge. Satırlar
+# L2 normlu vektörlerdir (TfidfVectorizer çıktısı gibi); skor iç çarpımdır.
+#
+# Sorgular terim-terim (term-at-a-time) ve MaxScore budamasıyla işlenir: sorgu
+# terimleri üst sınırlarına (sorgu ağırlığı x terimin en büyük ağırlığı) göre
+# azalan sırada dolaşılır. Kalan terimlerin üst sınır toplamı o ana kadarki
+# k. en iyi skoru aşamadığında yeni aday alınmaz; sık (düşük idf'li) terimlerin
+# uzun posting listeleri taranmaz, yalnızca ilk k'ya hâlâ girebilecek adayların
+# ağırlıkları ikili aramayla bulunur. Sonuç, tüm listeleri taramakla aynıdır.
+#
+# Eklemeler yeni bir segment açar; en yeni segment bir öncekinin en az yarısı
+# kadar olduğunda ikisi birleştirilir (LSM). Böylece segment sayısı belge
+# sayısının logaritmasıyla sınırlı kalır, ekleme maliyeti paylaştırılır.
+class SimilarityIndex:
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.segments: List[_Segment] = []
+        self.labels: List[str] = []
+        self.snippets: List[str] = []
+        self.queries = 0
+        self.postings_scanned = 0
+        self.postings_total = 0
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def add(
+        self,
+        rows: sp.spmatrix,
+        labels: Sequence[str],
+        snippets: Optional[Sequence[str]] = None,
+    ) -> range:
+        if rows.shape[1] != self.n_features:
+            raise ValueError(
+                f"Öznitelik sayısı uyuşmuyor: {rows.shape[1]} != {self.n_features}"
+            )
+        if rows.shape[0] != len(labels):
+            raise ValueError("Satır ve etiket sayıları uyuşmuyor")
+        start = len(self)
+        self.segments.append(_Segment(start, rows))
+        self.labels.extend(labels)
+        self.snippets.extend(snippets if snippets is not None else [""] * len(labels))
+
+        segments = self.segments
+        while len(segments) > 1 and 2 * segments[-1].size >= segments[-2].size:
+            newer, older = segments.pop(), segments.pop()
+            segments.append(
+                _Segment(older.offset, sp.vstack([older.postings, newer.postings]))
+            )
+        return range(start, len(self))
+
+    def _search_segment(
+        self,
+        segment: _Segment,
+        terms: np.ndarray,
+        weights: np.ndarray,
+        k: int,
+        threshold: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        bounds = weights * segment.max_weights[terms]
+        order = np.argsort(-bounds, kind="stable")
+        order = order[bounds[order] > 0]
+        terms, weights, bounds = terms[order], weights[order], bounds[order]
+        # remaining[i]: i. ve sonraki terimlerden gelebilecek en yüksek katkı
+        remaining = np.cumsum(bounds[::-1])[::-1]
+
+        postings = segment.postings
+        indptr, indices, data = postings.indptr, postings.indices, postings.data
+        lengths = indptr[terms + 1] - indptr[terms]
+        self.postings_total += int(lengths.sum())
+
+        # Küçük segmentler (ör. yeni eklenenler) budamasız, doğrudan taranır.
+        # Budamalı yolda eşik ilk tahmini için taranan terimler temel terimlere
+        # katılır; skorları yeniden hesaplanmaz.
+        if lengths.sum() <= _TERM_COST_POSTINGS * len(terms):
+            seed, essential = 0, len(terms)
+            scores = np.zeros(segment.size, dtype=np.float32)
+        else:
+            seed = min(len(terms), _SEED_TERMS)
+            scores = postings[:, terms[:seed]] @ weights[:seed]
+            self.postings_scanned += int(lengths[:seed].sum())
+            threshold = max(threshold, _threshold(scores, k))
+            essential = max(seed, int(np.sum(remaining > threshold)))
+
+        # Temel terimler: kalan üst sınırı eşiği aşan önek tek seferde taranır
+        if essential > seed:
+            scores += postings[:, terms[seed:essential]] @ weights[seed:essential]
+            self.postings_scanned += int(lengths[seed:essential].sum())
+        threshold = max(threshold, _threshold(scores, k))
+
+        # Temel olmayan terimler: yalnızca eşiğe ulaşabilecek adaylar güncellenir.
+        # Aday sayısı listeye göre büyükse liste doğrudan taranır (sonuç aynıdır).
+        candidates = np.flatnonzero(scores)
+        for j in range(essential, len(terms)):
+            candidates = candidates[scores[candidates] + remaining[j] >= threshold]
+            if not len(candidates):
+                break
+            start, end = indptr[terms[j]], indptr[terms[j] + 1]
+            docs = indices[start:end]
+            if 8 * len(candidates) < len(docs):
+                positions = np.minimum(np.searchsorted(docs, candidates), len(docs) - 1)
+                found = docs[positions] == candidates
+                scores[candidates[found]] += (
+                    weights[j] * data[start:end][positions[found]]
+                )
+                self.postings_scanned += len(candidates)
+            else:
+                scores[docs] += weights[j] * data[start:end]
+                self.postings_scanned += len(docs)
+            if len(candidates) > k:
+                threshold = max(threshold, _kth_largest(scores[candidates], k))
+
+        candidates = candidates[scores[candidates] > 0]
+        if len(candidates) > k:
+            top = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[top]
+        return candidates + segment.offset, scores[candidates]
+
+    # Tek satırlık sorgu vektörüne en benzer k belge: [(belge numarası, skor), ...]
+    def search(self, query: sp.spmatrix, k: int = 5) -> List[Tuple[int, float]]:
+        query = sp.csr_matrix(query)
+        terms = query.indices.astype(np.intp)
+        weights = query.data.astype(np.float32)
+        self.queries += 1
+        if not len(terms):
+            return []
+
+        docs = np.empty(0, dtype=np.int64)
+        scores = np.empty(0, dtype=np.float32)
+        threshold = 0.0
+        # Büyük segmentler önce aranır; bulunan eşik sonraki segmentleri budar
+        for segment in sorted(self.segments, key=lambda segment: -segment.size):
+            segment_docs, segment_scores = self._search_segment(
+                segment, terms, weights, k, threshold
+            )
+            docs = np.concatenate([docs, segment_docs])
+            scores = np.concatenate([scores, segment_scores])
+            if len(docs) > k:
+                top = np.argpartition(-scores, k - 1)[:k]
+                docs, scores = docs[top], scores[top]
+            if len(docs) == k:
+                threshold = float(scores.min())
+
+        order = np.argsort(-scores, kind="stable")
+        return [(int(docs[i]), float(scores[i])) for i in order]
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "documents": len(self),
+            "segments": len(self.segments),
+            "postings": sum(segment.postings.nnz for segment in self.segments),
+            "queries": self.queries,
+            "scanned_ratio": (
+                self.postings_scanned / self.postings_total
+                if self.postings_total
+                else 0.0
+            ),
+        }
@@ -0,0 +1,154 @@
+import hashlib
+import heapq
+import math
+import os
+import pickle
+from typing import Dict, Iterable, List, Mapping, Tuple
+import numpy as np
+
+
+# Sketch dosyalarının biçim sürümü
+SKETCH_FORMAT = 1
+
+
+def _hash_pair(key: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+# Count-Min Sketch: nokta sorguları için sabit bellekli sayaç. Tahmin gerçek
+# sayıdan küçük olmaz; 1 - delta olasılıkla en fazla epsilon * N fazladır.
+# Aynı epsilon/delta ile oluşturulan sketch'ler tablolar toplanarak birleşir.
+class CountMinSketch:
+    def __init__(self, epsilon: float = 1e-4, delta: float = 0.01):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+        self._rows = np.arange(self.depth, dtype=np.uint64)
+
+    # Çift karma ile her satırdaki sütunlar: (h1 + i * h2) mod width
+    def _columns(self, key: str) -> np.ndarray:
+        first, second = _hash_pair(key)
+        with np.errstate(over="ignore"):
+            positions = np.uint64(first) + self._rows * np.uint64(second)
+        return (positions % np.uint64(self.width)).astype(np.intp)
+
+    def add(self, key: str, count: int = 1):
+        self.table[np.arange(self.depth), self._columns(key)] += count
+        self.total += count
+
+    def estimate(self, key: str) -> int:
+        return int(self.table[np.arange(self.depth), self._columns(key)].min())
+
+    def merge(self, other: "CountMinSketch"):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Count-Min Sketch boyutları uyuşmuyor")
+        self.table += other.table
+        self.total += other.total
+
+
+# Misra-Gries sık öğe özeti: en fazla k sayaç. Her öğenin sayısı en fazla
+# N / (k + 1) eksik tahmin edilir; bu sınırdan sık geçen her öğe özette kalır.
+# Birleştirme: sayaçlar toplanır, (k+1). en büyük değer hepsinden çıkarılır.
+# Sayaçlar 2k'ya kadar büyür ve k'ya indirilir; küçültme maliyeti en az k
+# yeni öğeye yayılır, hata sınırı değişmez.
+class MisraGries:
+    def __init__(self, k: int = 10_000):
+        self.k = k
+        self.counters: Dict[str, int] = {}
+        self.total = 0
+
+    def add(self, key: str, count: int = 1):
+        self.total += count
+        counters = self.counters
+        if key in counters:
+            counters[key] += count
+            return
+        counters[key] = count
+        if len(counters) > 2 * self.k:
+            self._shrink()
+
+    def _shrink(self):
+        if len(self.counters) <= self.k:
+            return
+        threshold = heapq.nlargest(self.k + 1, self.counters.values())[-1]
+        self.counters = {
+            key: value - threshold
+            for key, value in self.counters.items()
+            if value > threshold
+        }
+
+    def merge(self, other: "MisraGries"):
+        for key, value in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        self.total += other.total
+        if len(self.counters) > self.k:
+            self._shrink()
+
+    @property
+    def error_bound(self) -> float:
+        return self.total / (self.k + 1)
+
+
+# Sıklık tablosunun yaklaşık modu: Count-Min nokta sorgularını, Misra-Gries
+# en sık öğe adaylarını tutar. Bellek sabittir; işçiler ve günler arasında
+# birleştirilebilir ve diske yazılıp okunabilir.
+class FrequencySketch:
+    def __init__(self, epsilon: float = 1e-4, delta: float = 0.01, heavy_hitters: int = 10_000):
+        self.counts = CountMinSketch(epsilon, delta)
+        self.heavy = MisraGries(heavy_hitters)
+
+    def add(self, key: str, count: int = 1):
+        self.counts.add(key, count)
+        self.heavy.add(key, count)
+
+    def update(self, counts: Mapping[str, int]):
+        for key, count in counts.items():
+            self.add(key, count)
+
+    def estimate(self, key: str) -> int:
+        return self.counts.estimate(key)
+
+    # En sık k öğe; sayılar Count-Min tahminidir (gerçek değerden küçük olmaz)
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        candidates = [(key, self.estimate(key)) for key in self.heavy.counters]
+        candidates.sort(key=lambda item: item[1], reverse=True)
+        return candidates[:k]
+
+    def merge(self, other: "FrequencySketch"):
+        self.counts.merge(other.counts)
+        self.heavy.merge(other.heavy)
+
+    def bounds(self) -> Dict[str, float]:
+        return {
+            "total": self.counts.total,
+            "point_error": self.counts.epsilon * self.counts.total,
+            "point_confidence": 1 - self.counts.delta,
+            "heavy_hitter_error": self.heavy.error_bound,
+            "bytes": self.counts.table.nbytes,
+        }
+
+    def save(self, path: str):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump((SKETCH_FORMAT, self), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+
+def load_sketch(path: str) -> FrequencySketch:
+    with open(path, "rb") as file:
+        sketch_format, sketch = pickle.load(file)
+    if sketch_format != SKETCH_FORMAT:
+        raise ValueError(f"{path} sketch biçimi {sketch_format}, beklenen {SKETCH_FORMAT}")
+    return sketch
+
+
+def merge_sketches(sketches: Iterable[FrequencySketch]) -> FrequencySketch:
+    sketches = iter(sketches)
+    merged = next(sketches)
+    for sketch in sketches:
+        merged.merge(sketch)
+    return merged
@@ -0,0 +1,111 @@
+import enum
+import json
+import os
+import pickle
+import sys
+import threading
+from importlib.metadata import version as package_version
+from typing import Any, Dict
+from zemberek import TurkishMorphology
+
+
+# Morphology anlık görüntüsünün biçim sürümü ve dosya imzası
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_MAGIC = b"ZEMBEREK-SNAPSHOT\n"
+
+
+# Anlık görüntünün geçerli olduğu ortam: kurulu zemberek-python ve Python sürümü
+def _snapshot_header() -> Dict[str, Any]:
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "zemberek": package_version("zemberek-python"),
+        "python": list(sys.version_info[:2]),
+    }
+
+
+def _restore_object(cls: type, scalars: Dict[str, Any]) -> Any:
+    obj = cls.__new__(cls)
+    obj.__dict__.update(scalars)
+    return obj
+
+
+_SNAPSHOT_SCALARS = (str, bytes, int, float, bool, type(None), enum.Enum)
+
+
+# Kilitler yeniden oluşturulur. __hash__ tanımlayan zemberek nesnelerinin
+# skaler alanları nesneyle birlikte kurulur; döngüsel başvurular çözülürken
+# sözlük anahtarı olarak kullanıldıklarında hash değerleri hazır olur.
+class _SnapshotPickler(pickle.Pickler):
+    _lock_factories = {
+        type(threading.Lock()): threading.Lock,
+        type(threading.RLock()): threading.RLock,
+    }
+
+    def reducer_override(self, obj):
+        if type(obj) in self._lock_factories:
+            return self._lock_factories[type(obj)], ()
+        if isinstance(obj, threading.Condition):
+            return threading.Condition, (obj._lock,)
+        cls = type(obj)
+        if (
+            cls.__module__.startswith("zemberek")
+            and cls.__hash__ is not object.__hash__
+            and hasattr(obj, "__dict__")
+            and not isinstance(obj, enum.Enum)
+        ):
+            scalars = {
+                key: value
+                for key, value in obj.__dict__.items()
+                if isinstance(value, _SNAPSHOT_SCALARS)
+            }
+            rest = {
+                key: value for key, value in obj.__dict__.items() if key not in scalars
+            }
+            return _restore_object, (cls, scalars), rest or None
+        return NotImplemented
+
+
+# Tamamen kurulmuş morphology nesnesini ikili anlık görüntü olarak yazma
+def save_morphology_snapshot(morphology: TurkishMorphology, path: str):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(SNAPSHOT_MAGIC)
+        file.write(json.dumps(_snapshot_header()).encode("utf-8") + b"\n")
+        _SnapshotPickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump(morphology)
+    os.replace(tmp_path, path)
+
+
+# Anlık görüntüyü dosyadan akış halinde okuma; sürüm uyuşmazsa ValueError.
+# Nesneler her süreçte yeniden kurulduğundan sayfalar süreçler arasında
+# paylaşılmaz; paylaşım için worker_pool'un fork ile devralması kullanılır.
+def load_morphology_snapshot(path: str) -> TurkishMorphology:
+    with open(path, "rb") as file:
+        if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} bir morphology anlık görüntüsü değil")
+        header = json.loads(file.readline())
+        if header != _snapshot_header():
+            raise ValueError(
+                f"{path} farklı bir ortam için oluşturulmuş: {header} != "
+                f"{_snapshot_header()}"
+            )
+        return pickle.load(file)
+
+
+def load_or_create_morphology_snapshot(snapshot_dir: str) -> TurkishMorphology:
+    path = os.path.join(snapshot_dir, "morphology.snapshot")
+    if os.path.exists(path):
+        try:
+            return load_morphology_snapshot(path)
+        except (
+            ValueError,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+        ):
+            os.remove(path)  # Eski sürüm ya da bozuk dosya: yeniden oluşturulur
+
+    morphology = TurkishMorphology.create_with_defaults()
+    os.makedirs(snapshot_dir, exist_ok=True)
+    save_morphology_snapshot(morphology, path)
+    return morphology
@@ -0,0 +1,35 @@
+import os
+import random
+import sys
+import pytest
+
+# Modüller Zemberek/ dizininde betik olarak durur ve birbirini düz adla içe aktarır
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Zemberek")
+)
+
+
+# Morphology nesnesi pahalıdır; tüm testler için bir kez oluşturulur
+@pytest.fixture(scope="session")
+def morphology():
+    from YeniZemberek import get_morphology
+
+    return get_morphology()
+
+
+# Yazarına özgü kelimelerden oluşan, ön işlenmiş (kök dizisi) küçük derlem
+@pytest.fixture
+def lemma_corpus():
+    rng = random.Random(0)
+    vocabulary = {
+        "ayşe": ["deniz", "gemi", "liman", "dalga", "balık", "kıyı"],
+        "mehmet": ["dağ", "kaya", "zirve", "orman", "yayla", "patika"],
+        "zeynep": ["şehir", "sokak", "bina", "trafik", "meydan", "köprü"],
+    }
+    common = ["gün", "insan", "zaman", "yer", "hayat"]
+    texts, authors = [], []
+    for author, words in vocabulary.items():
+        for _ in range(10):
+            texts.append(" ".join(rng.choices(words, k=20) + rng.choices(common, k=10)))
+            authors.append(author)
+    return texts, authors
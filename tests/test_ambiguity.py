@@ -0,0 +1,121 @@
+import json
+import pytest
+
+import YeniZemberek
+from YeniZemberek import (
+    corner_texts,
+    main,
+    prepare_data,
+    skipped_analyses,
+    write_word_frequencies,
+)
+from profiling import AmbiguityStats, ambiguity
+
+
+@pytest.fixture
+def enabled_ambiguity():
+    ambiguity.reset()
+    skipped_analyses.clear()
+    ambiguity.enabled = True
+    yield ambiguity
+    ambiguity.enabled = False
+    ambiguity.reset()
+    skipped_analyses.clear()
+
+
+def test_passes_are_reported_separately(enabled_ambiguity, morphology, tmp_path):
+    corpus = corner_texts[:3]
+    prepare_data(corpus, morphology)
+    write_word_frequencies(
+        [text for text, _ in corpus], morphology, str(tmp_path / "freq.txt")
+    )
+
+    report = enabled_ambiguity.report()
+    assert list(report) == ["prepare_data", "frequencies"]
+    assert report["prepare_data"]["corpus"]["documents"] == 3
+    assert report["frequencies"]["corpus"]["documents"] == 3
+
+
+def test_repeated_pass_starts_from_zero(enabled_ambiguity, morphology):
+    prepare_data(corner_texts[:2], morphology)
+    prepare_data(corner_texts[:2], morphology)
+    assert enabled_ambiguity.report()["prepare_data"]["corpus"]["documents"] == 2
+
+
+@pytest.mark.parametrize("stage", ["prepare_data", "frequencies"])
+def test_worker_counts_match_serial(enabled_ambiguity, morphology, tmp_path, stage):
+    corpus = corner_texts[:4]
+
+    def run(workers):
+        enabled_ambiguity.reset()
+        skipped_analyses.clear()
+        YeniZemberek._token_memo.clear()
+        if stage == "prepare_data":
+            prepare_data(corpus, morphology, workers=workers)
+        else:
+            write_word_frequencies(
+                [text for text, _ in corpus], morphology, str(tmp_path / "f.txt"), workers
+            )
+        return enabled_ambiguity.report()[stage], dict(skipped_analyses)
+
+    serial_report, serial_skipped = run(1)
+    pooled_report, pooled_skipped = run(2)
+    assert pooled_report == serial_report
+    # Saklanan sonuçlar süreç başına tutulur; her işçi bir içeriği bir kez
+    # analiz ettiğinden havuzda atlanan çağrı sayısı seri çalışmayı geçmez
+    assert pooled_skipped.keys() == serial_skipped.keys()
+    for name, count in serial_skipped.items():
+        assert 0 < pooled_skipped[name] <= count
+
+
+def _worker_sentences(*records):
+    worker = AmbiguityStats()
+    for surface, analyses in records:
+        worker.record(surface, analyses, False)
+        worker.end_document(empty=True)
+    state = worker.drain()
+    assert worker.report() == {}
+    return state
+
+
+def test_sentence_records_are_grouped_by_document_across_batches():
+    parent = AmbiguityStats()
+    parent.merge(_worker_sentences(("a", 1), ("b", 2)), [0, 1])
+    parent.merge(_worker_sentences(("c", 3)), [1])
+
+    report = parent.report()["analyze"]
+    assert [document["tokens"] for document in report["documents"]] == [1, 2]
+    assert report["distribution"] == {"1": 1, "2": 1, "3": 1}
+
+
+def test_freq_subcommand_reports_one_pass_per_stage(morphology, tmp_path):
+    corpus_path = tmp_path / "corpus.jsonl"
+    corpus_path.write_text(
+        "".join(
+            json.dumps({"text": text, "author": author}, ensure_ascii=False) + "\n"
+            for text, author in corner_texts[:3]
+        ),
+        encoding="utf-8",
+    )
+    report_path = tmp_path / "ambiguity.json"
+    try:
+        main(
+            [
+                "freq",
+                "--corpus",
+                str(corpus_path),
+                "--output",
+                str(tmp_path / "freq.txt"),
+                "--ambiguity-report",
+                str(report_path),
+            ]
+        )
+    finally:
+        ambiguity.enabled = False
+        ambiguity.reset()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))["ambiguity"]
+    assert {stage: report[stage]["corpus"]["documents"] for stage in report} == {
+        "prepare_data": 3,
+        "frequencies": 3,
+    }
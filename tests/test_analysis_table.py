@@ -0,0 +1,57 @@
+import pytest
+
+from YeniZemberek import (
+    analyze_text,
+    build_analysis_table,
+    corner_texts,
+    count_surface_forms,
+    load_analysis_table,
+    normalize_text,
+    prepare_data,
+)
+
+CORPUS = corner_texts[:3]
+
+
+@pytest.fixture
+def table(morphology, tmp_path):
+    path = str(tmp_path / "analysis.table")
+    counts = count_surface_forms((text for text, _ in CORPUS), normalize_text)
+    build_analysis_table(counts, morphology, path, top=300)
+    yield load_analysis_table(path)
+    load_analysis_table(None)
+
+
+def test_table_round_trips_zemberek_analyses(table, morphology):
+    assert len(table) == 300
+    counts = count_surface_forms((text for text, _ in CORPUS), normalize_text)
+    for surface, _ in counts.most_common(20):
+        correct, analyses = table.get(surface)
+        results = morphology.analyze(surface)
+        assert correct == results.is_correct()
+        assert analyses == [(r.get_stem(), r.format_string()) for r in results]
+
+
+def test_analyze_text_is_unchanged_by_the_table(table, morphology):
+    text = CORPUS[0][0]
+    with_table = analyze_text(text, morphology)
+    assert table.hits > 0
+    load_analysis_table(None)
+    assert analyze_text(text, morphology) == with_table
+
+
+def test_hits_and_misses_are_counted(table):
+    assert table.get("ve") is not None
+    assert table.get("zzzyokböyle") is None
+    assert table.metrics()["hits"] == 1
+    assert table.metrics()["misses"] == 1
+    assert table.metrics()["hit_rate"] == 0.5
+
+
+def test_worker_lookups_are_merged_into_the_parent(table, morphology):
+    prepare_data(CORPUS, morphology)
+    serial = table.drain_counts()
+    assert serial[0] > 0
+
+    prepare_data(CORPUS, morphology, workers=2)
+    assert table.drain_counts() == serial
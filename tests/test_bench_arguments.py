@@ -0,0 +1,54 @@
+import argparse
+
+import bench
+import YeniZemberek
+from YeniZemberek import (
+    add_cold_start_arguments,
+    add_regression_arguments,
+    add_scaling_arguments,
+    add_similarity_arguments,
+)
+
+ADDERS = (
+    add_regression_arguments,
+    add_scaling_arguments,
+    add_cold_start_arguments,
+    add_similarity_arguments,
+)
+
+
+def _bench_options(monkeypatch, main, argv):
+    seen = {}
+
+    def record(args):
+        seen.update(vars(args))
+
+    # Ölçümleri çalıştırmadan yalnızca ayrıştırılan seçenekleri yakala
+    monkeypatch.setattr(YeniZemberek, "run_bench", record)
+    monkeypatch.setattr(bench, "print_cold_start", lambda report: None)
+    monkeypatch.setattr(
+        bench, "bench_cold_start", lambda model, trials: seen.update(model=model, trials=trials)
+    )
+    main(argv)
+    return seen
+
+
+def test_bench_module_reuses_cli_definitions():
+    for adder in ADDERS:
+        assert getattr(bench, adder.__name__) is adder
+
+
+def test_bench_subcommand_and_script_share_defaults(monkeypatch):
+    parser = argparse.ArgumentParser()
+    for adder in ADDERS:
+        adder(parser)
+    defaults = vars(parser.parse_args([]))
+
+    options = _bench_options(monkeypatch, YeniZemberek.main, ["bench"])
+    for name, value in defaults.items():
+        assert options[name] == value
+
+    options = _bench_options(
+        monkeypatch, bench.main, ["--cold-start", "--model", "m.pkl", "--trials", "2"]
+    )
+    assert options == {"model": "m.pkl", "trials": 2}
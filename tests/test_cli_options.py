@@ -0,0 +1,71 @@
+import json
+import pytest
+
+import YeniZemberek
+from YeniZemberek import corner_texts, main
+from profiling import ambiguity, timer
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    path = tmp_path / "corpus.jsonl"
+    path.write_text(
+        "".join(
+            json.dumps({"text": text, "author": author}, ensure_ascii=False) + "\n"
+            for text, author in corner_texts[:2]
+        ),
+        encoding="utf-8",
+    )
+    yield str(path)
+    timer.enabled = ambiguity.enabled = False
+    timer.reset()
+    ambiguity.reset()
+
+
+# Komutu çalıştırmadan ayrıştırılan seçenekleri yakalama; raporlar geçici
+# dizine yazılır
+def _parsed(monkeypatch, tmp_path, argv):
+    seen = {}
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(YeniZemberek, "run_freq", lambda args: seen.update(vars(args)))
+    monkeypatch.setattr(YeniZemberek, "load_analysis_table", lambda path: None)
+    main(argv)
+    return seen
+
+
+@pytest.mark.parametrize(
+    "option, value, key",
+    [
+        ("--timing-report", "t.json", "timing_report"),
+        ("--memory-report", "m.json", "memory_report"),
+        ("--ambiguity-report", "a.json", "ambiguity_report"),
+        ("--analysis-table", "tablo.bin", "analysis_table"),
+        ("--cache-dir", "onbellek", "cache_dir"),
+        ("--dedup-threshold", "0.5", "dedup_threshold"),
+        ("--profile-output", "cikti", "profile_output"),
+        ("--workers", "3", "workers"),
+        ("--jobs", "2", "jobs"),
+    ],
+)
+def test_shared_options_work_on_both_sides_of_the_subcommand(
+    monkeypatch, tmp_path, corpus_path, option, value, key
+):
+    before = _parsed(monkeypatch, tmp_path, [option, value, "freq"])
+    after = _parsed(monkeypatch, tmp_path, ["freq", option, value])
+    default = _parsed(monkeypatch, tmp_path, ["freq"])
+    assert before[key] == after[key] != default[key]
+    assert str(before[key]) == value
+
+
+def test_flags_before_the_subcommand_are_kept(monkeypatch, tmp_path):
+    assert _parsed(monkeypatch, tmp_path, ["--dedup", "freq"])["dedup"] is True
+    assert _parsed(monkeypatch, tmp_path, ["freq"])["dedup"] is False
+
+
+def test_timing_report_given_before_subcommand_is_written(morphology, corpus_path, tmp_path):
+    report = tmp_path / "timing.json"
+    output = tmp_path / "freq.txt"
+    main(["--timing-report", str(report), "freq", "--corpus", corpus_path, "--output", str(output)])
+
+    stages = json.loads(report.read_text(encoding="utf-8"))["stages"]
+    assert "frequencies.analyze" in stages
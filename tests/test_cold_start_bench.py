@@ -0,0 +1,25 @@
+from bench import COLD_START_PHASES, _run_cold_phase, parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        450 |   zemberek.core
+import time:      1000 |       1450 | zemberek
+"""
+
+
+def test_parse_importtime_reads_depth_and_times():
+    assert parse_importtime(IMPORTTIME + "başka bir satır\n") == [
+        {"module": "_io", "depth": 1, "self_us": 120, "cumulative_us": 120},
+        {"module": "zemberek.core", "depth": 1, "self_us": 300, "cumulative_us": 450},
+        {"module": "zemberek", "depth": 0, "self_us": 1000, "cumulative_us": 1450},
+    ]
+
+
+def test_import_phase_runs_in_a_fresh_interpreter():
+    result, stderr = _run_cold_phase(*COLD_START_PHASES["import_module"], "", True)
+
+    assert result["seconds"] > 0
+    assert result["rss_delta_kb"] > 0
+    modules = {row["module"] for row in parse_importtime(stderr)}
+    assert "YeniZemberek" in modules
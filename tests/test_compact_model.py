@@ -0,0 +1,82 @@
+import io
+import json
+import sys
+import pytest
+
+from YeniZemberek import (
+    export_compact_model,
+    load_compact_model,
+    main,
+    predict_authors,
+    prepare_data,
+    save_model,
+    train_model,
+)
+
+
+@pytest.fixture
+def trained(lemma_corpus, morphology):
+    texts, authors = lemma_corpus
+    corpus = list(zip(texts, authors))
+    lemma_table = {}
+    lemma_texts, labels = prepare_data(corpus, morphology, lemma_table)
+    return texts, train_model(lemma_texts, labels, lemma_table=lemma_table)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "int8"])
+def test_unpruned_compact_model_agrees_with_full_model(trained, morphology, tmp_path, dtype):
+    texts, artifact = trained
+    path = str(tmp_path / "compact.npz")
+    report = export_compact_model(artifact, path, keep_ratio=1.0, dtype=dtype)
+
+    compact = load_compact_model(path)
+    assert report["agreement"] == 1.0
+    assert predict_authors(compact, texts, morphology) == predict_authors(
+        artifact, texts, morphology
+    )
+
+
+def test_pruned_agreement_matches_report(trained, morphology, tmp_path):
+    texts, artifact = trained
+    path = str(tmp_path / "compact.npz")
+    report = export_compact_model(artifact, path, keep_ratio=0.2)
+
+    full = predict_authors(artifact, texts, morphology)
+    compact = predict_authors(load_compact_model(path), texts, morphology)
+    agreement = sum(a == b for a, b in zip(full, compact)) / len(texts)
+    assert agreement == pytest.approx(report["agreement"])
+    assert report["kept_features"] < report["features"]
+
+
+def test_compact_model_carries_lemma_table(trained, tmp_path):
+    _, artifact = trained
+    path = str(tmp_path / "compact.npz")
+    export_compact_model(artifact, path)
+
+    compact = load_compact_model(path)
+    assert compact["lemma_table"] == artifact["lemma_table"]
+    assert compact["lemma_table"]
+    assert compact["version"] != artifact["version"]
+
+
+def test_export_and_predict_subcommands(trained, tmp_path, monkeypatch, capsys):
+    texts, artifact = trained
+    model_path, compact_path = tmp_path / "model.pkl", tmp_path / "compact.npz"
+    save_model(artifact, str(model_path))
+    main(
+        [
+            "export",
+            "--model",
+            str(model_path),
+            "--output",
+            str(compact_path),
+            "--keep-ratio",
+            "1.0",
+        ]
+    )
+
+    lines = "".join(json.dumps({"text": text}) + "\n" for text in texts[:4])
+    monkeypatch.setattr(sys, "stdin", io.StringIO(lines))
+    main(["predict", "--compact-model", str(compact_path), "--cache-size", "0"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["author"] for record in records] == ["ayşe"] * 4
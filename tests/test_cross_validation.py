@@ -0,0 +1,35 @@
+from YeniZemberek import cross_validate_grid
+
+
+GRID = {"ngram_range": [(1, 1), (1, 2)], "C": [0.1, 1.0]}
+
+
+def test_grid_reports_every_combination_sorted(lemma_corpus):
+    texts, authors = lemma_corpus
+    report = cross_validate_grid(texts, authors, GRID, n_splits=3, n_jobs=1)
+
+    assert len(report) == 4
+    assert {(row["params"]["ngram_range"], row["params"]["C"]) for row in report} == {
+        ((1, 1), 0.1),
+        ((1, 1), 1.0),
+        ((1, 2), 0.1),
+        ((1, 2), 1.0),
+    }
+    accuracies = [row["mean_accuracy"] for row in report]
+    assert accuracies == sorted(accuracies, reverse=True)
+    assert report[0]["mean_accuracy"] == 1.0
+    assert all(row["wall_time"] > 0 for row in report)
+
+
+def test_parallel_and_cached_runs_match_serial(lemma_corpus, tmp_path):
+    texts, authors = lemma_corpus
+    serial = cross_validate_grid(texts, authors, GRID, n_splits=3, n_jobs=1)
+    cached = cross_validate_grid(
+        texts, authors, GRID, n_splits=3, n_jobs=2, cache_dir=str(tmp_path)
+    )
+
+    assert (tmp_path / "folds").is_dir()
+    accuracy = lambda report: {
+        str(row["params"]): row["mean_accuracy"] for row in report
+    }
+    assert accuracy(cached) == accuracy(serial)
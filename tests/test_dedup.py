@@ -0,0 +1,98 @@
+import json
+import random
+import pytest
+
+from YeniZemberek import corner_texts, deduplicate_corpus, main, prepare_data
+from dedup import NearDuplicateFilter
+
+VOCABULARY = [f"kelime{i}" for i in range(5_000)]
+
+
+def _document(rng, length=200):
+    return [rng.choice(VOCABULARY) for _ in range(length)]
+
+
+def _near_copy(rng, words, edits=2):
+    words = list(words)
+    for position in rng.sample(range(len(words)), edits):
+        words[position] = rng.choice(VOCABULARY)
+    return words
+
+
+def _jaccard(a, b, size=5):
+    grams = lambda words: {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+    first, second = grams(a), grams(b)
+    return len(first & second) / len(first | second)
+
+
+def test_lsh_recall_on_near_copies_and_no_false_positives():
+    rng = random.Random(0)
+    originals = [_document(rng) for _ in range(200)]
+    copies = [_near_copy(rng, words) for words in originals]
+    assert min(_jaccard(a, b) for a, b in zip(originals, copies)) >= 0.8
+
+    dedup = NearDuplicateFilter()
+    assert not any(dedup.is_duplicate(" ".join(words)) for words in originals)
+    found = sum(dedup.is_duplicate(" ".join(words)) for words in copies)
+    assert found / len(copies) >= 0.95
+
+
+def test_signature_similarity_estimates_jaccard():
+    rng = random.Random(1)
+    dedup = NearDuplicateFilter(num_perm=256)
+    for edits in (1, 5, 20):
+        words = _document(rng)
+        copy = _near_copy(rng, words, edits)
+        estimate = (dedup.signature(" ".join(words)) == dedup.signature(" ".join(copy))).mean()
+        assert estimate == pytest.approx(_jaccard(words, copy), abs=0.1)
+
+
+def test_max_documents_evicts_oldest_signatures():
+    rng = random.Random(2)
+    documents = [" ".join(_document(rng)) for _ in range(10)]
+
+    bounded = NearDuplicateFilter(max_documents=5)
+    for text in documents:
+        bounded.is_duplicate(text)
+    report = bounded.report()
+    assert (report["stored"], report["evicted"]) == (5, 5)
+    assert sum(len(bucket) for bucket in bounded._buckets) <= 5 * bounded.bands
+    # En eskiler unutuldu, en yeniler hâlâ yakalanıyor
+    assert not bounded.is_duplicate(documents[0])
+    assert bounded.is_duplicate(documents[-1])
+
+
+def test_deduplication_streams_the_corpus():
+    consumed = []
+
+    def corpus():
+        for item in corner_texts[:3] + [corner_texts[0]]:
+            consumed.append(item)
+            yield item
+
+    kept, dedup = deduplicate_corpus(corpus())
+    assert next(kept) == corner_texts[0] and len(consumed) == 1
+    assert list(kept) == list(corner_texts[1:3])
+    assert dedup.report()["duplicates"] == 1
+
+
+def test_prepare_data_consumes_a_generator(morphology):
+    expected = prepare_data(list(corner_texts[:2]), morphology)
+    assert prepare_data((item for item in corner_texts[:2]), morphology) == expected
+
+
+def test_freq_subcommand_deduplicates_a_stream(morphology, tmp_path, capsys):
+    corpus_path = tmp_path / "corpus.jsonl"
+    records = corner_texts[:2] + [corner_texts[0]]
+    corpus_path.write_text(
+        "".join(
+            json.dumps({"text": text, "author": author}, ensure_ascii=False) + "\n"
+            for text, author in records
+        ),
+        encoding="utf-8",
+    )
+    output = tmp_path / "freq.txt"
+    main(["freq", "--corpus", str(corpus_path), "--output", str(output), "--dedup"])
+
+    assert "Yakın kopya: 1/3 belge" in capsys.readouterr().err
+    assert output.read_text(encoding="utf-8")
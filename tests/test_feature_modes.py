@@ -0,0 +1,102 @@
+import json
+import pytest
+
+import YeniZemberek
+from YeniZemberek import (
+    export_compact_model,
+    feature_rows,
+    load_model,
+    main,
+    predict_authors,
+    save_model,
+    train_model,
+    update_model,
+)
+
+
+def test_char_model_predicts_without_morphology(lemma_corpus):
+    texts, authors = lemma_corpus
+    artifact = train_model(None, authors, raw_texts=texts, features="char")
+
+    assert artifact["features"] == "char"
+    # morphology=None: char modunda ön işleme hiç çalışmamalı
+    assert predict_authors(artifact, texts, None) == authors
+
+
+def test_union_model_uses_lemmas_and_raw_text(lemma_corpus, morphology):
+    texts, authors = lemma_corpus
+    artifact = train_model(texts, authors, raw_texts=texts, features="union")
+
+    assert artifact["features"] == "union"
+    assert predict_authors(artifact, texts[::5], morphology) == authors[::5]
+
+
+def test_feature_mode_survives_save_and_load(lemma_corpus, tmp_path):
+    texts, authors = lemma_corpus
+    path = str(tmp_path / "model.pkl")
+    save_model(train_model(None, authors, raw_texts=texts, features="char"), path)
+
+    artifact = load_model(path)
+    assert artifact["features"] == "char"
+    assert predict_authors(artifact, texts[:3], None) == authors[:3]
+
+
+def test_lemma_only_operations_reject_other_modes(lemma_corpus, tmp_path):
+    texts, authors = lemma_corpus
+    artifact = train_model(None, authors, raw_texts=texts, features="char")
+
+    with pytest.raises(ValueError):
+        update_model(artifact, [(texts[0], authors[0])], None)
+    with pytest.raises(ValueError):
+        export_compact_model(artifact, str(tmp_path / "compact.npz"))
+
+
+def test_non_lemma_modes_require_raw_texts(lemma_corpus):
+    texts, authors = lemma_corpus
+    with pytest.raises(ValueError):
+        train_model(texts, authors, features="union")
+
+
+def test_parallel_feature_extraction_matches_serial(lemma_corpus, monkeypatch):
+    texts, authors = lemma_corpus
+    seen = []
+    make = YeniZemberek.make_feature_pipeline
+    monkeypatch.setattr(
+        YeniZemberek,
+        "make_feature_pipeline",
+        lambda mode, n_jobs=None: seen.append(n_jobs) or make(mode, n_jobs=n_jobs),
+    )
+    serial = train_model(texts, authors, raw_texts=texts, features="union")
+    parallel = train_model(texts, authors, raw_texts=texts, features="union", n_jobs=2)
+
+    assert seen == [None, 2]
+    # Pakete yazılan vektörleştirici tahminde süreç açmaz
+    assert parallel["vectorizer"].n_jobs is None
+    rows = feature_rows(texts, texts)
+    assert (
+        parallel["vectorizer"].transform(rows) != serial["vectorizer"].transform(rows)
+    ).nnz == 0
+
+
+def test_train_subcommand_passes_jobs(lemma_corpus, monkeypatch, tmp_path):
+    texts, authors = lemma_corpus
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text(
+        "".join(
+            json.dumps({"text": text, "author": author}, ensure_ascii=False) + "\n"
+            for text, author in zip(texts, authors)
+        ),
+        encoding="utf-8",
+    )
+    seen = {}
+    train = YeniZemberek.train_model
+    monkeypatch.setattr(
+        YeniZemberek,
+        "train_model",
+        lambda *args, **kwargs: seen.update(kwargs) or train(*args, **kwargs),
+    )
+    train_args = ["--features", "char", "--corpus", str(corpus), "--output", str(tmp_path / "m")]
+    main(["--jobs", "2", "train"] + train_args)
+    assert seen["n_jobs"] == 2
+    main(["train"] + train_args + ["--jobs", "3"])
+    assert seen["n_jobs"] == 3
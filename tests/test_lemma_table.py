@@ -0,0 +1,31 @@
+from YeniZemberek import corner_texts, prepare_data, preprocess_text
+
+
+def test_lemma_table_gives_same_lemmas_as_analysis(morphology):
+    lemma_table = {}
+    texts, _ = prepare_data(corner_texts[:3], morphology, lemma_table)
+
+    assert lemma_table
+    for (raw, _), text in zip(corner_texts[:3], texts):
+        assert preprocess_text(raw, morphology) == text
+        assert preprocess_text(raw, morphology, lemma_table) == text
+
+
+def test_known_words_skip_morphology(morphology):
+    lemma_table = {}
+    texts, _ = prepare_data(corner_texts[:1], morphology, lemma_table)
+
+    # Tüm kelimeler tabloda; zemberek'e hiç gidilmemeli
+    assert preprocess_text(corner_texts[0][0], None, lemma_table) == texts[0]
+
+
+def test_unknown_words_are_learned_only_when_asked(morphology):
+    lemma_table = {}
+    prepare_data(corner_texts[:1], morphology, lemma_table)
+    size = len(lemma_table)
+
+    preprocess_text("Zeplinler gökyüzünde süzülüyordu.", morphology, lemma_table)
+    assert len(lemma_table) == size
+
+    preprocess_text("Zeplinler gökyüzünde süzülüyordu.", morphology, lemma_table, learn=True)
+    assert len(lemma_table) > size
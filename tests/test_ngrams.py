@@ -0,0 +1,171 @@
+import json
+import math
+import random
+from collections import Counter
+import pytest
+
+import YeniZemberek
+from YeniZemberek import lemma_runs, main, write_ngram_collocations
+from ngrams import NgramCounter, log_likelihood
+from profiling import ambiguity
+
+
+def _brute_force_g2(k11, k12, k21, k22):
+    table = [[k11, k12], [k21, k22]]
+    total = k11 + k12 + k21 + k22
+    g2 = 0.0
+    for i in range(2):
+        for j in range(2):
+            expected = sum(table[i]) * (table[0][j] + table[1][j]) / total
+            if table[i][j]:
+                g2 += table[i][j] * math.log(table[i][j] / expected)
+    return 2 * g2
+
+
+@pytest.mark.parametrize(
+    "table", [(10, 0, 0, 90), (5, 15, 20, 60), (2, 98, 40, 9860), (30, 2, 4, 1000)]
+)
+def test_log_likelihood_matches_definition(table):
+    assert log_likelihood(*table) == pytest.approx(_brute_force_g2(*table))
+
+
+def test_independent_table_scores_zero():
+    assert log_likelihood(1, 99, 99, 9801) == pytest.approx(0.0, abs=1e-6)
+
+
+def _sentences(seed=0, count=500):
+    rng = random.Random(seed)
+    words = [f"k{i}" for i in range(200)]
+    return [rng.choices(words, k=rng.randint(1, 12)) for _ in range(count)]
+
+
+def test_counts_match_brute_force_without_pruning():
+    sentences = _sentences()
+    counter = NgramCounter((2, 3))
+    for lemmas in sentences:
+        counter.update(lemmas)
+
+    for n in (2, 3):
+        expected = Counter(
+            tuple(lemmas[i : i + n]) for lemmas in sentences for i in range(len(lemmas) - n + 1)
+        )
+        assert counter.ngrams[n] == expected
+        assert counter.totals[n] == sum(expected.values())
+    assert counter.unigrams == Counter(word for lemmas in sentences for word in lemmas)
+
+
+def test_ngrams_do_not_cross_runs():
+    counter = NgramCounter((2,))
+    counter.update(["kara", "kedi"])
+    counter.update(["beyaz", "köpek"])
+    assert ("kedi", "beyaz") not in counter.ngrams[2]
+
+
+def test_pruning_bounds_memory_and_undercount():
+    sentences = _sentences(seed=1, count=2_000)
+    exact = Counter(
+        tuple(lemmas[i : i + 2]) for lemmas in sentences for i in range(len(lemmas) - 1)
+    )
+    counter = NgramCounter((2,), max_ngrams=1_000)
+    for lemmas in sentences:
+        counter.update(lemmas)
+
+    report = counter.report()["2gram"]
+    assert report["distinct"] <= 1_000 and report["pruned"] > 0
+    assert report["total"] == sum(exact.values())
+    for gram, count in counter.ngrams[2].items():
+        assert exact[gram] - report["max_undercount"] <= count <= exact[gram]
+
+
+def test_pruning_keeps_frequent_ngrams():
+    rng = random.Random(2)
+    counter = NgramCounter((2,), max_ngrams=100)
+    for i in range(5_000):
+        counter.update(["sık", "geçen"] if i % 10 == 0 else [f"a{rng.random()}", f"b{i}"])
+    assert counter.ngrams[2][("sık", "geçen")] >= 500 - counter.undercount[2]
+
+
+def test_trigram_g2_marginals_are_counted_at_trigram_positions():
+    sentences = _sentences(seed=4, count=300)
+    for lemmas in sentences[::5]:
+        lemmas[:3] = ["k1", "k2", "k3"]
+    counter = NgramCounter((2, 3))
+    for lemmas in sentences:
+        counter.update(lemmas)
+
+    trigrams = [
+        tuple(lemmas[i : i + 3]) for lemmas in sentences for i in range(len(lemmas) - 2)
+    ]
+    rows = {gram: llr for gram, _, _, llr in counter.collocations(3, min_count=2)}
+    for gram, llr in rows.items():
+        count = trigrams.count(gram)
+        first = sum(1 for other in trigrams if other[:2] == gram[:2])
+        last = sum(1 for other in trigrams if other[2] == gram[2])
+        # Tüm hücreler aynı birimde olduğundan hiçbiri kırpılmadan negatif olmaz
+        k22 = len(trigrams) - first - last + count
+        assert k22 >= 0
+        assert llr == pytest.approx(_brute_force_g2(count, first - count, last - count, k22))
+    assert max(rows, key=rows.get) == ("k1", "k2", "k3")
+
+
+def test_collocations_rank_fixed_phrases_first():
+    rng = random.Random(3)
+    words = [f"k{i}" for i in range(100)]
+    counter = NgramCounter((2, 3))
+    for _ in range(300):
+        lemmas = rng.choices(words, k=6)
+        position = rng.randrange(4)
+        lemmas[position : position + 2] = ["hayırlı", "olsun"]
+        counter.update(lemmas)
+
+    rows = counter.collocations(2, min_count=2)
+    gram, count, pmi, llr = rows[0]
+    assert gram == ("hayırlı", "olsun") and count >= 300
+    assert pmi > 0 and llr == max(row[3] for row in rows)
+    assert all(row[1] >= 2 for row in rows)
+
+
+def test_write_ngram_collocations_from_text(morphology, tmp_path):
+    text = "Kitap okumayı çok severim. Kitap okumak güzeldir, kitap okuyan çocuk."
+    prefix = str(tmp_path / "freq")
+    report = write_ngram_collocations([text], morphology, prefix, (2,), min_count=2)
+
+    # Noktalama kök dizilerini böler; n-gramlar onun üzerinden kurulmaz
+    runs = list(lemma_runs(text, morphology))
+    assert runs == [
+        ["kitap", "oku", "çok", "sev"],
+        ["kitap", "oku", "güzel"],
+        ["kitap", "oku", "çocuk"],
+    ]
+    assert report["2gram"]["total"] == 7
+    lines = (tmp_path / "freq.2gram.txt").read_text(encoding="utf-8").splitlines()
+    assert lines[0].split("\t")[:2] == ["kitap oku", "3"]
+
+
+def test_freq_counts_ngrams_in_the_frequency_pass(morphology, monkeypatch, tmp_path):
+    texts = [
+        "Kitap okumayı çok severim. Kitap okumak güzeldir.",
+        "Kitap okuyan çocuk, kitap okumayı sever.",
+    ]
+    # Derlem tek kullanımlık bir akıştır; ikinci bir geçiş hiçbir metin görmez
+    stream = iter([(text, "yazar") for text in texts])
+    monkeypatch.setattr(YeniZemberek, "iter_corpus", lambda path: stream)
+    monkeypatch.setattr(ambiguity, "enabled", False)
+    output = tmp_path / "freq.txt"
+    report = tmp_path / "ambiguity.json"
+    main(
+        ["--ambiguity-report", str(report), "freq", "--corpus", "derlem.jsonl"]
+        + ["--ngrams", "2", "--output", str(output)]
+    )
+
+    # Aynı geçişte yapılan iki işin belirsizlik sayımları ayrı raporlanır
+    passes = json.loads(report.read_text(encoding="utf-8"))["ambiguity"]
+    assert passes["ngrams"]["corpus"]["documents"] == len(texts)
+    assert passes["frequencies"]["corpus"]["documents"] == len(texts)
+
+    expected = write_ngram_collocations(texts, morphology, str(tmp_path / "tek"), (2,))
+    assert (tmp_path / "freq.2gram.txt").read_text(encoding="utf-8") == (
+        tmp_path / "tek.2gram.txt"
+    ).read_text(encoding="utf-8")
+    assert expected["2gram"]["total"] > 0
+    assert "kitap" in output.read_text(encoding="utf-8")
@@ -0,0 +1,47 @@
+from YeniZemberek import PredictionCache, predict_authors, prepare_data, train_model
+
+
+def test_key_ignores_case_and_whitespace_but_not_model_version():
+    key = PredictionCache.key("Denizde  YÜZDÜK\n", "v1")
+    assert key == PredictionCache.key("denizde yüzdük", "v1")
+    assert key != PredictionCache.key("denizde yüzdük", "v2")
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PredictionCache(max_size=2)
+    cache.put("a", "ayşe")
+    cache.put("b", "mehmet")
+    assert cache.get("a") == "ayşe"
+    cache.put("c", "zeynep")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "ayşe"
+    assert cache.metrics()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("YeniZemberek.time.monotonic", lambda: now[0])
+    cache = PredictionCache(ttl=10)
+    cache.put("a", "ayşe")
+    now[0] += 5
+    assert cache.get("a") == "ayşe"
+    now[0] += 6
+    assert cache.get("a") is None
+
+    metrics = cache.metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["expirations"]) == (1, 1, 1)
+
+
+def test_cached_predictions_match_uncached(lemma_corpus, morphology):
+    texts, authors = lemma_corpus
+    lemma_texts, labels = prepare_data(list(zip(texts, authors)), morphology, {})
+    artifact = train_model(lemma_texts, labels)
+    cache = PredictionCache()
+
+    queries = texts[:5] + [f"  {text}\n" for text in texts[:5]]
+    expected = predict_authors(artifact, queries, morphology)
+    assert predict_authors(artifact, queries, morphology, cache=cache) == expected
+    assert cache.metrics()["size"] == 5
+    assert predict_authors(artifact, queries, morphology, cache=cache) == expected
+    assert cache.metrics()["hits"] >= 10
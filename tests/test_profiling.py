@@ -0,0 +1,172 @@
+import random
+import pytest
+
+import YeniZemberek
+from YeniZemberek import corner_texts, prepare_data, preprocess_text, write_word_frequencies
+from profiling import (
+    RESERVOIR_SIZE,
+    CProfileProfiler,
+    MemoryProfiler,
+    StageTimer,
+    _StageStats,
+    timer,
+)
+
+
+@pytest.fixture
+def enabled_timer():
+    timer.reset()
+    timer.enabled = True
+    yield timer
+    timer.enabled = False
+    timer.reset()
+
+
+def test_disabled_timer_records_nothing():
+    stages = StageTimer()
+    with stages.span("a"):
+        pass
+    assert stages.report() == {}
+
+
+def test_timer_reports_counts_and_percentiles(monkeypatch):
+    clock = iter([0.0, 1.0, 1.0, 3.0, 3.0, 6.0])
+    monkeypatch.setattr("profiling.time.perf_counter", lambda: next(clock))
+    stages = StageTimer()
+    stages.enabled = True
+    for _ in range(3):
+        with stages.span("a"):
+            pass
+
+    report = stages.report()["a"]
+    assert report["count"] == 3
+    assert report["total"] == 6.0
+    assert (report["p50"], report["max"]) == (2.0, 3.0)
+
+
+def test_memory_checkpoints_report_retained_and_peak():
+    profiler = MemoryProfiler()
+    profiler.start(top=3)
+    try:
+        kept = [bytearray(1 << 20)]
+        profiler.checkpoint("allocate")
+        temporary = bytearray(4 << 20)
+        del temporary
+        profiler.checkpoint("spike")
+    finally:
+        profiler.stop()
+
+    allocate, spike = profiler.report()
+    assert allocate["stage"] == "allocate"
+    assert allocate["delta"] >= 1 << 20
+    assert len(allocate["top_sites"]) <= 3
+    # Tepe değer her sınırda sıfırlanır; geçici ayırma yalnızca kendi aşamasında görünür
+    assert spike["peak"] >= spike["retained"] + (4 << 20) - (64 << 10)
+    assert allocate["peak"] < spike["peak"]
+    assert kept
+
+
+def test_disabled_memory_checkpoint_is_a_no_op():
+    profiler = MemoryProfiler()
+    profiler.checkpoint("stage")
+    assert profiler.report() == []
+
+
+def _diamond(level):
+    # Her düzeyde iki yol birleşir; tam yol sayımı 2**level olurdu
+    if level == 0:
+        return sum(range(200))
+    return _left(level) + _right(level)
+
+
+def _left(level):
+    return _diamond(level - 1)
+
+
+def _right(level):
+    return _diamond(level - 1)
+
+
+def test_cprofile_collapsed_stacks_are_caller_callee_edges():
+    profiler = CProfileProfiler()
+    profiler.start()
+    _diamond(12)
+    profiler.stop()
+
+    stacks = profiler.collapsed()
+    assert all(stack.count(";") <= 1 for stack in stacks)
+    edges = {tuple(frame.split(" (")[0] for frame in stack.split(";")) for stack in stacks}
+    assert ("_left", "_diamond") in edges
+    assert ("_diamond", "_right") in edges
+    assert len(stacks) < 20
+
+    own_time = sum(entry[2] for entry in profiler._profile.stats.values())
+    assert sum(stacks.values()) == pytest.approx(own_time * 1e6, rel=0.01, abs=len(stacks))
+
+
+def test_preprocessing_stages_are_timed(enabled_timer, morphology):
+    preprocess_text("Kitap okudum. Eve gittim.", morphology)
+
+    report = enabled_timer.report()
+    for stage in ("split_sentences", "preprocess_text.lemmas", "analyze_text.analyze"):
+        assert report[stage]["count"] >= 1
+
+
+def test_stage_memory_is_bounded_and_percentiles_stay_close():
+    stats = _StageStats()
+    durations = [i / 1000 for i in range(1, 20_001)]
+    random.Random(1).shuffle(durations)
+    for duration in durations:
+        stats.add(duration)
+
+    assert len(stats.samples) == RESERVOIR_SIZE
+    assert (stats.count, stats.min, stats.max) == (20_000, 0.001, 20.0)
+    assert stats.total == pytest.approx(sum(durations))
+    stages = StageTimer()
+    stages._stages["a"] = stats
+    report = stages.report()["a"]
+    assert report["p50"] == pytest.approx(10.0, rel=0.1)
+    assert report["p90"] == pytest.approx(18.0, rel=0.05)
+
+
+def test_merged_stages_match_single_recording():
+    whole, halves = StageTimer(), [StageTimer(), StageTimer()]
+    for timer_ in (whole, *halves):
+        timer_.enabled = True
+    for i in range(3_000):
+        duration = (i % 97) / 1000
+        whole._stages["a"].add(duration)
+        halves[i % 2]._stages["a"].add(duration)
+
+    merged = StageTimer()
+    for part in halves:
+        merged.merge(part.drain())
+    assert halves[0].report() == {}
+    expected, actual = whole.report()["a"], merged.report()["a"]
+    assert len(merged._stages["a"].samples) <= RESERVOIR_SIZE
+    assert actual["count"] == expected["count"]
+    assert actual["total"] == pytest.approx(expected["total"])
+    assert (actual["min"], actual["max"]) == (expected["min"], expected["max"])
+    assert actual["p50"] == pytest.approx(expected["p50"], abs=0.01)
+
+
+@pytest.mark.parametrize("stage", ["prepare_data", "frequencies"])
+def test_worker_spans_are_merged_into_parent(enabled_timer, morphology, tmp_path, stage):
+    corpus = corner_texts[:4]
+
+    def run(workers):
+        enabled_timer.reset()
+        YeniZemberek._token_memo.clear()
+        if stage == "prepare_data":
+            prepare_data(corpus, morphology, workers=workers)
+        else:
+            write_word_frequencies(
+                [text for text, _ in corpus], morphology, str(tmp_path / "f.txt"), workers
+            )
+        return enabled_timer.report()
+
+    serial, pooled = run(1), run(2)
+    for name in ("analyze_text.analyze", "analyze_text.format"):
+        assert pooled[name]["count"] == serial[name]["count"] > 0
+        # İşçi süreleri toplanır; aynı iş, benzer toplam süre
+        assert serial[name]["total"] / 4 < pooled[name]["total"] < serial[name]["total"] * 4
@@ -0,0 +1,36 @@
+import pytest
+from zemberek import TurkishTokenizer
+
+import bench
+from bench import _peak_rss_kb, _regression_trial, _reset_peak_rss, _run_cold_phase
+
+linux_only = pytest.mark.skipif(not _reset_peak_rss(), reason="VmHWM sıfırlanamıyor")
+
+
+def test_tokens_per_sec_counts_tokens(lemma_corpus, morphology, monkeypatch):
+    texts, authors = lemma_corpus
+    corpus = list(zip(texts, authors))
+    monkeypatch.setattr(bench.time, "perf_counter", iter(range(0, 10_000)).__next__)
+
+    metrics = _regression_trial(corpus, morphology)
+    tokens = sum(len(TurkishTokenizer.DEFAULT.tokenize(text)) for text in texts)
+    assert metrics["analyze_text.tokens_per_sec"] == tokens
+
+
+@linux_only
+def test_trial_peak_excludes_earlier_allocations(lemma_corpus, morphology):
+    spike = bytearray(256 << 20)
+    spike[::4096] = b"x" * len(spike[::4096])
+    lifetime_peak = _peak_rss_kb()
+    del spike
+
+    texts, authors = lemma_corpus
+    metrics = _regression_trial(list(zip(texts, authors)), morphology)
+    assert metrics["peak_rss_kb"] < lifetime_peak - (128 << 10)
+
+
+@linux_only
+def test_cold_phase_peak_covers_only_measured_code():
+    setup = "spike = bytearray(256 << 20); spike[::4096] = b'x' * len(spike[::4096]); del spike"
+    result, _ = _run_cold_phase(setup, "data = bytearray(8 << 20)", "")
+    assert result["peak_rss_kb"] < 128 << 10
@@ -0,0 +1,32 @@
+from collections import Counter
+
+from bench import bench_scaling_workers, synthesize_corpus
+
+
+def test_synthesized_corpus_reaches_target_with_same_vocabulary(lemma_corpus):
+    texts, authors = lemma_corpus
+    corpus = list(zip(texts, authors))
+    synthetic = synthesize_corpus(corpus, 5_000)
+
+    assert sum(len(text.split()) for text, _ in synthetic) >= 5_000
+    assert synthetic[: len(corpus)] == corpus
+    assert set(" ".join(text for text, _ in synthetic).split()) == set(" ".join(texts).split())
+    assert Counter(author for _, author in synthetic).keys() == set(authors)
+
+
+def test_worker_sweep_reports_speedup_against_first_count(lemma_corpus, morphology):
+    texts, authors = lemma_corpus
+    results = bench_scaling_workers(
+        list(zip(texts, authors)), morphology, worker_counts=(1, 2), target_tokens=1_000
+    )
+
+    assert [(row["stage"], row["workers"]) for row in results] == [
+        (stage, workers)
+        for workers in (1, 2)
+        for stage in ("prepare_data", "frequencies", "predict")
+    ]
+    for row in results:
+        assert row["tokens"] >= 1_000
+        assert row["efficiency"] == row["speedup"] / row["workers"]
+        if row["workers"] == 1:
+            assert row["speedup"] == 1.0
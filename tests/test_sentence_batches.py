@@ -0,0 +1,50 @@
+from YeniZemberek import (
+    _lemmatize,
+    _sentence_words,
+    analyze_sentences,
+    analyze_text,
+    corner_texts,
+    group_by_document,
+    preprocess_text,
+    sentence_batches,
+    split_sentences,
+)
+
+TEXTS = ["Eve gittim. Kitap okudum.", "", "Deniz sakindi.\nGemiler limana döndü. Akşam oldu."]
+
+
+def test_batches_cross_documents_and_keep_owners():
+    batches, owners = sentence_batches(TEXTS, batch_size=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert owners == [0, 0, 2, 2, 2]
+    sentences = [sentence for batch in batches for sentence in batch]
+    assert group_by_document(sentences, owners, len(TEXTS)) == [
+        split_sentences(text) for text in TEXTS
+    ]
+
+
+def test_sentence_wise_preprocessing_matches_whole_document(morphology):
+    for text, _ in corner_texts[:3]:
+        sentences = [
+            " ".join(_lemmatize(_sentence_words(sentence), morphology, None, False))
+            for sentence in split_sentences(text)
+        ]
+        assert " ".join(sentence for sentence in sentences if sentence) == preprocess_text(
+            text, morphology
+        )
+
+
+def test_disambiguation_keeps_one_analysis_per_word(morphology):
+    # "yüz" sayı, ad ve fiil olabilir; bağlam ilkini sayı, ikinciyi fiil yapar
+    sentence = "Yüz kişi denizde yüzdü."
+    analyses = analyze_text(sentence, morphology)
+    best = analyze_sentences(sentence, morphology, disambiguate=True)
+
+    assert analyze_sentences(sentence, morphology) == analyses
+    assert len(best) == 5  # dört kelime ve nokta
+    assert set(best) <= set(analyses) and len(best) < len(analyses)
+    assert [pos.split("]")[0] for lemma, pos in best if lemma == "yüz"] == [
+        "[yüz:Num, Card",
+        "[yüzmek:Verb",
+    ]
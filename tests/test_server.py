@@ -0,0 +1,116 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+import pytest
+
+import server as server_module
+from YeniZemberek import analyze_sentences, analyze_text, preprocess_text
+from server import AuthorHTTPServer, AuthorService, MicroBatcher
+
+
+def _serve(service, handler):
+    server = AuthorHTTPServer(("127.0.0.1", 0), service, MicroBatcher(handler))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _post(server, path, body):
+    host, port = server.server_address
+    request = urllib.request.Request(
+        f"http://{host}:{port}{path}",
+        data=body if isinstance(body, bytes) else json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+@pytest.fixture
+def service(morphology):
+    return AuthorService(morphology)
+
+
+def test_handler_failure_returns_json_error(service):
+    def failing(requests):
+        raise RuntimeError("bozuk")
+
+    server = _serve(service, failing)
+    try:
+        status, payload = _post(server, "/analyze", {"text": "Kitap okudum."})
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert status == 500
+    assert "bozuk" in payload["error"]
+
+
+def test_request_errors(service, morphology):
+    server = _serve(service, service.process_batch)
+    try:
+        assert _post(server, "/yok", {"text": "a"})[0] == 404
+        assert _post(server, "/analyze", b"{")[0] == 400
+        assert _post(server, "/analyze", {"texts": [1, 2]})[0] == 400
+        # Dize bir metin listesi gibi harf harf işlenmez
+        assert _post(server, "/analyze", {"texts": "Kitap okudum."})[0] == 400
+        # Model olmadan tahmin isteği sunucuyu düşürmeden 503 döner
+        assert _post(server, "/predict", {"text": "Kitap okudum."})[0] == 503
+        status, payload = _post(server, "/preprocess", {"text": "Kitap okudum."})
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert status == 200
+    assert payload["result"] == preprocess_text("Kitap okudum.", morphology)
+
+
+def test_request_error_stays_in_its_request(morphology, monkeypatch):
+    def predict(artifact, texts, morphology, cache=None):
+        if "bozuk" in texts:
+            raise ValueError("bozuk metin")
+        return ["yazar"] * len(texts)
+
+    monkeypatch.setattr(server_module, "predict_authors", predict)
+    service = AuthorService(morphology, artifact={})
+    original = service._process_one
+
+    def process_one(kind, texts):
+        if kind == "analyze" and "bozuk" in texts:
+            return RuntimeError("bozuk analiz")
+        return original(kind, texts)
+
+    monkeypatch.setattr(service, "_process_one", process_one)
+
+    # Geniş gecikme bütçesiyle tüm istekler aynı mikro gruba düşer
+    batcher = MicroBatcher(service.process_batch, max_latency=1.0)
+    futures = [
+        batcher.submit("analyze", ["bozuk"]),
+        batcher.submit("analyze", ["Kitap okudum."]),
+        batcher.submit("predict", ["bozuk"]),
+        batcher.submit("predict", ["Kitap okudum.", "Eve gittim."]),
+    ]
+    with pytest.raises(RuntimeError, match="bozuk analiz"):
+        futures[0].result(timeout=30)
+    assert futures[1].result(timeout=30) == [analyze_text("Kitap okudum.", morphology)]
+    with pytest.raises(ValueError, match="bozuk metin"):
+        futures[2].result(timeout=30)
+    assert futures[3].result(timeout=30) == ["yazar", "yazar"]
+
+
+def test_disambiguating_service_returns_best_analyses(morphology):
+    sentence = "Yüz kişi denizde yüzdü."
+    service = AuthorService(morphology, disambiguate=True)
+    server = _serve(service, service.process_batch)
+    try:
+        status, payload = _post(server, "/analyze", {"text": sentence})
+        _, frequencies = _post(server, "/frequencies", {"text": sentence})
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert status == 200
+    best = [tuple(pair) for pair in payload["result"]]
+    assert best == analyze_sentences(sentence, morphology, disambiguate=True)
+    assert len(best) < len(analyze_text(sentence, morphology))
+    assert sum(row["frequency"] for row in frequencies["frequencies"]) == len(best)
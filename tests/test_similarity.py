@@ -0,0 +1,140 @@
+import json
+import pickle
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+
+from YeniZemberek import (
+    add_to_similarity_index,
+    build_similarity_index,
+    load_model,
+    main,
+    prepare_data,
+    similar_articles,
+)
+import similarity
+from similarity import SimilarityIndex
+
+
+# Zipf dağılımlı terimlerle L2 normlu seyrek belge vektörleri; sık terimlerin
+# uzun posting listeleri MaxScore budamasını devreye sokar
+def _documents(count, features=2_000, terms=30, seed=0):
+    rng = np.random.default_rng(seed)
+    weights = 1 / np.arange(1, features + 1)
+    weights /= weights.sum()
+    rows = np.repeat(np.arange(count), terms)
+    columns = rng.choice(features, size=count * terms, p=weights)
+    values = rng.random(count * terms).astype(np.float32) + 0.1
+    matrix = sp.csr_matrix((values, (rows, columns)), shape=(count, features))
+    matrix.sum_duplicates()
+    return normalize(matrix).astype(np.float32)
+
+
+def _brute_force(matrix, query, k):
+    scores = (matrix @ query.T).toarray().ravel()
+    order = np.argsort(-scores, kind="stable")[:k]
+    return [(int(doc), float(scores[doc])) for doc in order if scores[doc] > 0]
+
+
+def _assert_same_neighbours(found, expected):
+    assert [score for _, score in found] == pytest.approx(
+        [score for _, score in expected], abs=1e-5
+    )
+    # Eşit skorlu belgeler farklı sırada gelebilir; ayrık skorlarda belge aynı olmalı
+    for (doc, score), (expected_doc, _) in zip(found, expected):
+        if sum(abs(score - other) < 1e-5 for _, other in expected) == 1:
+            assert doc == expected_doc
+
+
+@pytest.mark.parametrize("k", [1, 5, 20])
+def test_maxscore_matches_brute_force(k, monkeypatch):
+    # Küçük derlemde de budamalı yol seçilsin
+    monkeypatch.setattr(similarity, "_TERM_COST_POSTINGS", 0)
+    matrix = _documents(30_000)
+    index = SimilarityIndex(matrix.shape[1])
+    index.add(matrix, [str(i) for i in range(matrix.shape[0])])
+
+    queries = _documents(25, seed=1)
+    for i in range(queries.shape[0]):
+        _assert_same_neighbours(index.search(queries[i], k), _brute_force(matrix, queries[i], k))
+    # Budama gerçekten devrede: posting'lerin bir kısmı taranmadı
+    assert index.metrics()["scanned_ratio"] < 1
+
+
+def test_incremental_index_matches_single_build():
+    matrix = _documents(5_000, seed=2)
+    single = SimilarityIndex(matrix.shape[1])
+    single.add(matrix, ["a"] * matrix.shape[0])
+
+    incremental = SimilarityIndex(matrix.shape[1])
+    sizes = [1_000, 500, 500, 250, 1_000, 750, 1_000]
+    start = 0
+    for size in sizes:
+        ids = incremental.add(matrix[start : start + size], ["a"] * size)
+        assert ids == range(start, start + size)
+        start += size
+    assert len(incremental) == matrix.shape[0]
+    assert len(incremental.segments) <= int(np.log2(len(sizes))) + 1
+
+    queries = _documents(20, seed=3)
+    for i in range(queries.shape[0]):
+        _assert_same_neighbours(incremental.search(queries[i], 10), single.search(queries[i], 10))
+
+
+def test_index_survives_pickle_round_trip():
+    matrix = _documents(2_000, seed=4)
+    index = SimilarityIndex(matrix.shape[1])
+    index.add(matrix, [f"yazar{i % 3}" for i in range(matrix.shape[0])])
+
+    restored = pickle.loads(pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL))
+    assert restored.labels == index.labels
+    query = _documents(1, seed=5)
+    assert restored.search(query, 5) == index.search(query, 5)
+
+
+def test_add_rejects_mismatched_rows():
+    index = SimilarityIndex(10)
+    with pytest.raises(ValueError):
+        index.add(sp.csr_matrix((2, 11)), ["a", "b"])
+    with pytest.raises(ValueError):
+        index.add(sp.csr_matrix((2, 10)), ["a"])
+
+
+def test_empty_query_returns_nothing():
+    index = SimilarityIndex(10)
+    index.add(sp.identity(10, format="csr"), list("abcdefghij"))
+    assert index.search(sp.csr_matrix((1, 10))) == []
+
+
+def test_articles_find_themselves(lemma_corpus, morphology):
+    texts, authors = lemma_corpus
+    lemmas, _ = prepare_data(list(zip(texts, authors)), morphology)
+    package = build_similarity_index(lemmas[:20], texts[:20], authors[:20])
+    ids = add_to_similarity_index(package, lemmas[20:], texts[20:], authors[20:])
+    assert ids == range(20, len(texts))
+
+    results = similar_articles(package, texts, morphology, k=3)
+    for i, neighbours in enumerate(results):
+        assert neighbours[0]["id"] == i
+        assert neighbours[0]["score"] == pytest.approx(1.0, abs=1e-3)
+        assert neighbours[0]["author"] == authors[i]
+
+
+def test_index_subcommand_appends_to_saved_index(lemma_corpus, morphology, tmp_path):
+    texts, authors = lemma_corpus
+    output = str(tmp_path / "index.pkl")
+    for part in (slice(0, 15), slice(15, None)):
+        corpus = tmp_path / "corpus.jsonl"
+        corpus.write_text(
+            "".join(
+                json.dumps({"text": text, "author": author}, ensure_ascii=False) + "\n"
+                for text, author in zip(texts[part], authors[part])
+            ),
+            encoding="utf-8",
+        )
+        main(["index", "--corpus", str(corpus), "--output", output])
+
+    package = load_model(output)
+    assert package["index"].labels == authors
+    assert similar_articles(package, [texts[-1]], morphology, k=1)[0][0]["id"] == len(texts) - 1
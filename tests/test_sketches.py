@@ -0,0 +1,154 @@
+import json
+import random
+from collections import Counter
+import pytest
+
+from YeniZemberek import (
+    corner_texts,
+    iter_prepared_texts,
+    main,
+    prepare_data,
+    worker_pool,
+    write_approximate_frequencies,
+    write_word_frequencies,
+)
+from sketches import CountMinSketch, FrequencySketch, MisraGries, load_sketch, merge_sketches
+
+
+# Zipf dağılımlı akış: az sayıda çok sık, çok sayıda seyrek anahtar
+def _stream(seed=0, size=50_000, vocabulary=5_000):
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, vocabulary + 1)]
+    return rng.choices([f"k{i}" for i in range(vocabulary)], weights, k=size)
+
+
+def test_count_min_never_undercounts_and_stays_within_bound():
+    keys = _stream()
+    exact = Counter(keys)
+    sketch = CountMinSketch(epsilon=1e-3, delta=0.01)
+    for key in keys:
+        sketch.add(key)
+
+    errors = [sketch.estimate(key) - count for key, count in exact.items()]
+    assert min(errors) >= 0
+    # Sınır 1 - delta olasılıkla geçerli; aşan anahtar oranı delta'yı geçmemeli
+    bound = sketch.epsilon * sketch.total
+    assert sum(error > bound for error in errors) / len(errors) <= sketch.delta
+
+
+def test_misra_gries_keeps_every_heavy_hitter():
+    keys = _stream(seed=1)
+    exact = Counter(keys)
+    summary = MisraGries(k=100)
+    for key in keys:
+        summary.add(key)
+    summary._shrink()
+
+    assert len(summary.counters) <= summary.k
+    for key, count in exact.items():
+        estimate = summary.counters.get(key, 0)
+        assert count - summary.error_bound <= estimate <= count
+        if count > summary.error_bound:
+            assert key in summary.counters
+
+
+def test_merged_halves_match_a_single_pass():
+    keys = _stream(seed=2)
+    whole = FrequencySketch(epsilon=1e-3, heavy_hitters=200)
+    halves = [FrequencySketch(epsilon=1e-3, heavy_hitters=200) for _ in range(2)]
+    for i, key in enumerate(keys):
+        whole.add(key)
+        halves[i % 2].add(key)
+
+    merged = merge_sketches(halves)
+    assert (merged.counts.table == whole.counts.table).all()
+    assert merged.counts.total == whole.counts.total == len(keys)
+
+    exact = Counter(keys)
+    for key, count in exact.items():
+        if count > merged.heavy.error_bound:
+            assert key in merged.heavy.counters
+    top = [key for key, _ in merged.top(10)]
+    assert top == [key for key, _ in exact.most_common(10)]
+
+
+def test_mismatched_sketches_do_not_merge():
+    with pytest.raises(ValueError):
+        FrequencySketch(epsilon=1e-3).merge(FrequencySketch(epsilon=1e-4))
+
+
+def test_sketch_round_trips_through_file(tmp_path):
+    sketch = FrequencySketch(epsilon=1e-3)
+    sketch.update(Counter(_stream(size=1_000)))
+    path = str(tmp_path / "sketch.pkl")
+    sketch.save(path)
+
+    loaded = load_sketch(path)
+    assert loaded.top(20) == sketch.top(20)
+    assert loaded.bounds() == sketch.bounds()
+
+
+def test_streamed_sketch_matches_exact_frequencies(morphology, tmp_path):
+    consumed = []
+
+    def corpus():
+        for item in corner_texts[:3]:
+            consumed.append(item)
+            yield item
+
+    texts = iter_prepared_texts(corpus(), morphology)
+    assert not consumed
+    output = tmp_path / "approximate.txt"
+    bounds = write_approximate_frequencies(texts, morphology, str(output), FrequencySketch())
+
+    # Küçük derlemde hata sınırı birin altında; sayımlar tam sayımla aynı olmalı
+    assert bounds["point_error"] < 1
+    exact, _ = prepare_data(corner_texts[:3], morphology)
+    write_word_frequencies(exact, morphology, str(tmp_path / "exact.txt"))
+    lines = set(output.read_text(encoding="utf-8").splitlines())
+    assert lines == set((tmp_path / "exact.txt").read_text(encoding="utf-8").splitlines())
+
+
+def test_pooled_stream_matches_serial(morphology, tmp_path):
+    documents = corner_texts[:5]
+    serial, pooled = FrequencySketch(), FrequencySketch()
+    write_approximate_frequencies(
+        iter_prepared_texts(documents, morphology),
+        morphology,
+        str(tmp_path / "serial.txt"),
+        serial,
+    )
+    with worker_pool(morphology, 2) as pool:
+        texts = iter_prepared_texts(iter(documents), morphology, pool, chunk_size=2)
+        write_approximate_frequencies(
+            texts, morphology, str(tmp_path / "pooled.txt"), pooled, pool=pool
+        )
+    assert (serial.counts.table == pooled.counts.table).all()
+    assert dict(serial.top(50)) == dict(pooled.top(50))
+
+    expected, _ = prepare_data(documents, morphology)
+    assert list(iter_prepared_texts(documents, morphology)) == expected
+
+
+def test_freq_subcommand_merges_saved_sketches(morphology, tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text(
+        "".join(
+            json.dumps({"text": text, "author": author}, ensure_ascii=False) + "\n"
+            for text, author in corner_texts[:2]
+        ),
+        encoding="utf-8",
+    )
+    first, second = str(tmp_path / "first.pkl"), str(tmp_path / "second.pkl")
+    output = str(tmp_path / "freq.txt")
+    common = ["freq", "--approximate", "--corpus", str(corpus), "--output", output]
+    main(common + ["--sketch", first])
+    main(common + ["--sketch", second, "--workers", "2"])
+    main(common + ["--merge-sketch", first, second])
+
+    once = load_sketch(first)
+    lines = open(output, encoding="utf-8").read().splitlines()
+    assert lines
+    for line in lines:
+        key, frequency = line.rsplit("\t", 1)
+        assert int(frequency) == 3 * once.estimate(key)
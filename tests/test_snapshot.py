@@ -0,0 +1,55 @@
+import json
+import pytest
+
+import snapshot
+from snapshot import (
+    SNAPSHOT_MAGIC,
+    _snapshot_header,
+    load_morphology_snapshot,
+    load_or_create_morphology_snapshot,
+    save_morphology_snapshot,
+)
+
+
+def _analyses(morphology, word):
+    return [str(analysis) for analysis in morphology.analyze(word)]
+
+
+def test_snapshot_round_trip(morphology, tmp_path):
+    path = str(tmp_path / "morphology.snapshot")
+    save_morphology_snapshot(morphology, path)
+
+    restored = load_morphology_snapshot(path)
+    for word in ("kitaplarımızdan", "gittim", "3", "İstanbul'a"):
+        assert _analyses(restored, word) == _analyses(morphology, word)
+
+
+def test_mismatched_header_is_rejected(tmp_path):
+    path = tmp_path / "morphology.snapshot"
+    header = dict(_snapshot_header(), format=-1)
+    path.write_bytes(SNAPSHOT_MAGIC + json.dumps(header).encode("utf-8") + b"\n")
+
+    with pytest.raises(ValueError):
+        load_morphology_snapshot(str(path))
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"", b"\x80\x05bozuk", b"\x80\x04\x95\x00"],
+    ids=["empty", "garbage", "truncated"],
+)
+def test_corrupt_snapshot_is_rebuilt(morphology, tmp_path, monkeypatch, payload):
+    path = tmp_path / "morphology.snapshot"
+    header = json.dumps(_snapshot_header()).encode("utf-8")
+    path.write_bytes(SNAPSHOT_MAGIC + header + b"\n" + payload)
+    saved = []
+    monkeypatch.setattr(
+        snapshot.TurkishMorphology, "create_with_defaults", staticmethod(lambda: morphology)
+    )
+    monkeypatch.setattr(
+        snapshot, "save_morphology_snapshot", lambda obj, target: saved.append(target)
+    )
+
+    assert load_or_create_morphology_snapshot(str(tmp_path)) is morphology
+    assert saved == [str(path)]
+    assert not path.exists()
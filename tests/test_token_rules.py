@@ -0,0 +1,74 @@
+from collections import Counter
+import pytest
+from zemberek import TurkishTokenizer
+
+import YeniZemberek
+from YeniZemberek import MEMOIZED_TOKEN_TYPES, analyze_text, corner_texts, skipped_analyses
+from bench import bench_token_filter
+
+
+@pytest.fixture
+def skipped():
+    skipped_analyses.clear()
+    YeniZemberek._token_memo.clear()
+    yield skipped_analyses
+    skipped_analyses.clear()
+    YeniZemberek._token_memo.clear()
+
+
+# Her token için doğrudan morphology.analyze; kurallar ve saklama olmadan
+def _zemberek(text, morphology):
+    return [
+        (result.get_stem(), result.format_string())
+        for token in TurkishTokenizer.DEFAULT.tokenize(text)
+        for result in morphology.analyze(token.content)
+    ]
+
+
+@pytest.mark.parametrize(
+    "text", ["3", "31.", "%5", "12:30", "03.00", "12.03.2020", "Kitap, kalem.", "“Eyvah!..”"]
+)
+def test_numbers_dates_and_punctuation_keep_zemberek_analyses(morphology, skipped, text):
+    expected = _zemberek(text, morphology)
+    assert analyze_text(text, morphology) == expected
+    # İkinci çağrı saklanan sonuçlardan gelir; çıktı aynı kalır
+    assert analyze_text(text, morphology) == expected
+
+
+def test_number_analysis_is_zemberek_cardinal(morphology, skipped):
+    assert analyze_text("3", morphology) == [("3", "[3:Num, Card] 3:Num")]
+    assert analyze_text("31.", morphology) == []
+
+
+def test_repeated_punctuation_and_numbers_skip_zemberek(morphology, skipped):
+    texts = [text for text, _ in corner_texts[:5]]
+    expected = [_zemberek(text, morphology) for text in texts]
+    assert [analyze_text(text, morphology) for text in texts] == expected
+
+    tokens = [token for text in texts for token in TurkishTokenizer.DEFAULT.tokenize(text)]
+    counts = Counter(token.type_ for token in tokens if token.type_ in MEMOIZED_TOKEN_TYPES)
+    distinct = Counter(
+        token_type for token_type, _ in {
+            (token.type_, token.content) for token in tokens if token.type_ in counts
+        }
+    )
+    assert skipped["Punctuation"] > 0
+    assert skipped == {
+        token_type.name: counts[token_type] - distinct[token_type] for token_type in counts
+    }
+
+
+def test_addresses_and_mentions_are_skipped(morphology, skipped):
+    text = "Yaz: ali@ornek.com http://ornek.com @ali"
+    assert analyze_text(text, morphology) == analyze_text("Yaz:", morphology)
+    assert skipped["Email"] == skipped["URL"] == skipped["Mention"] == 1
+
+
+def test_token_filter_bench_matches_raw_analysis(morphology, skipped):
+    report = bench_token_filter(corner_texts[:5])
+    assert report["memoized"]["Punctuation"] > 0
+    assert report["analyze_calls"] < report["tokens"]
+
+    for text, _ in corner_texts[:5]:
+        analyze_text(text, morphology)
+    assert dict(skipped) == {**report["removed"], **report["memoized"]}
@@ -0,0 +1,22 @@
+import unicodedata
+
+from YeniZemberek import TURKISH_FOLD_TABLE, normalize_text
+
+
+def test_dotted_and_dotless_i_fold_the_turkish_way():
+    assert normalize_text("ISPARTA İZMİR Işık") == "ısparta izmir ışık"
+
+
+def test_punctuation_and_digits_are_removed_whitespace_kept():
+    assert normalize_text("Merhaba, dünya! 2024'te\tgörüşürüz.") == "merhaba dünya te\tgörüşürüz"
+
+
+def test_decomposed_input_matches_after_nfc():
+    decomposed = unicodedata.normalize("NFD", "ÇAĞRI Şükrü Öğün")
+    assert normalize_text(unicodedata.normalize("NFC", decomposed)) == "çağrı şükrü öğün"
+
+
+def test_characters_outside_the_table_are_cached_on_first_use():
+    assert 0x03A9 not in TURKISH_FOLD_TABLE or TURKISH_FOLD_TABLE[0x03A9] == "ω"
+    assert normalize_text("ΩMEGA") == "ωmega"
+    assert TURKISH_FOLD_TABLE[0x03A9] == "ω"
@@ -0,0 +1,77 @@
+import json
+import numpy as np
+import pytest
+
+from YeniZemberek import (
+    load_model,
+    main,
+    predict_authors,
+    prepare_data,
+    save_model,
+    train_model,
+    update_model,
+)
+
+
+@pytest.fixture
+def split_corpus(lemma_corpus):
+    texts, authors = lemma_corpus
+    corpus = list(zip(texts, authors))
+    # Güncellemede hem mevcut yazarlara yeni makaleler hem de yeni bir yazar gelir
+    old = [item for i, item in enumerate(corpus) if item[1] != "zeynep" and i % 2 == 0]
+    new = [item for i, item in enumerate(corpus) if item not in old]
+    return old, new
+
+
+def _idf_by_term(artifact):
+    vectorizer = artifact["vectorizer"]
+    return dict(zip(vectorizer.get_feature_names_out(), vectorizer.idf_))
+
+
+def test_updated_idf_matches_full_retrain(split_corpus, morphology):
+    old, new = split_corpus
+    texts, authors = prepare_data(old, morphology, {})
+    updated = update_model(train_model(texts, authors), new, morphology)
+
+    all_texts, all_authors = prepare_data(old + new, morphology, {})
+    retrained = train_model(all_texts, all_authors)
+
+    expected = _idf_by_term(retrained)
+    actual = _idf_by_term(updated)
+    assert actual.keys() == expected.keys()
+    for term, idf in expected.items():
+        assert actual[term] == pytest.approx(idf)
+    assert np.array_equal(
+        np.sort(updated["document_frequency"]), np.sort(retrained["document_frequency"])
+    )
+
+
+def test_update_adds_new_author(split_corpus, morphology):
+    old, new = split_corpus
+    texts, authors = prepare_data(old, morphology, {})
+    artifact = train_model(texts, authors)
+    assert "zeynep" not in artifact["label_encoder"].classes_
+
+    artifact = update_model(artifact, new, morphology)
+    assert list(artifact["label_encoder"].classes_) == ["ayşe", "mehmet", "zeynep"]
+    assert len(artifact["labels"]) == len(old) + len(new)
+    zeynep = [text for text, author in new if author == "zeynep"]
+    assert predict_authors(artifact, zeynep, morphology) == ["zeynep"] * len(zeynep)
+
+
+def test_update_subcommand_rewrites_model(split_corpus, morphology, tmp_path):
+    old, new = split_corpus
+    texts, authors = prepare_data(old, morphology, {})
+    model_path = tmp_path / "model.pkl"
+    save_model(train_model(texts, authors), str(model_path))
+    corpus_path = tmp_path / "new.jsonl"
+    corpus_path.write_text(
+        "".join(
+            json.dumps({"text": text, "author": author}, ensure_ascii=False) + "\n"
+            for text, author in new
+        ),
+        encoding="utf-8",
+    )
+
+    main(["update", "--model", str(model_path), "--corpus", str(corpus_path)])
+    assert len(load_model(str(model_path))["labels"]) == len(old) + len(new)
@@ -0,0 +1,29 @@
+from collections import Counter
+
+from YeniZemberek import (
+    analyze_text,
+    corner_texts,
+    frequencies_in_pool,
+    prepare_data,
+    worker_pool,
+)
+
+
+def test_pool_preprocessing_matches_serial(morphology):
+    serial_table, pooled_table = {}, {}
+    serial = prepare_data(corner_texts[:4], morphology, serial_table)
+    pooled = prepare_data(corner_texts[:4], morphology, pooled_table, workers=2)
+
+    assert pooled == serial
+    assert pooled_table == serial_table
+
+
+def test_pool_frequencies_match_serial_counts(morphology):
+    texts = [text for text, _ in corner_texts[:2]]
+    with worker_pool(morphology, 2) as pool:
+        pooled = sum(frequencies_in_pool(pool, texts), Counter())
+
+    serial = Counter()
+    for text in texts:
+        serial.update(analyze_text(text, morphology))
+    assert pooled == serial